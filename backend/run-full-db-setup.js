@@ -13,8 +13,13 @@ const sqlDir = path.join(__dirname, '..', 'database');
 const files = [
   'commands.sql',           // schema (tables)
   'seed_data_new.sql',     // drinks + ingredients data
+  'update_amount_ml.sql',  // numeric amount_ml / is_approximate backfill
   'game_night_menu.sql',   // game night menu table + data
-  'drinks_with_risha_menu.sql'
+  'drinks_with_risha_menu.sql',
+  'drink_search.sql',      // ranked search function + search_document backfill (after every file that adds drinks)
+  'stamp_data_version.sql', // new catalog data version: query caches drop their entries
+  'change_log.sql',         // change triggers for scripts/refresh_daemon.py (after the bulk load)
+  'verify_setup.sql'        // fail the setup if derived columns were left unfilled
 ];
 
 function runSql(sql, label) {
@@ -88,17 +88,13 @@ app.get('/api/drinks', async (req, res) => {
 // IMPORTANT: These specific routes must come BEFORE /api/drinks/:name
 // Otherwise Express will match "method", "glass", "search", or "filter" as a drink name
 
-// Search drinks by name
+// Search drinks by name, ingredients, garnish and description (ranked full-text, see database/drink_search.sql)
 app.get('/api/drinks/search/:query', async (req, res) => {
   try {
-    const query = `%${req.params.query}%`;
     const result = await db.query(
       `SELECT drink_id, name, glass_type, build_method, garnish 
-       FROM drinks 
-       WHERE name ILIKE $1 
-       ORDER BY name
-       LIMIT 20`,
-      [query]
+       FROM search_drinks($1, 20)`,
+      [req.params.query]
     );
     res.json(result.rows);
   } catch (err) {
@@ -291,6 +287,9 @@ app.get('/api/drinks/by-ingredients', async (req, res) => {
       return res.status(400).json({ error: 'At least one ingredient is required' });
     }
     
+    // ?substitutes=true also accepts drinks whose ingredient has a listed substitute matching the search
+    const includeSubstitutes = req.query.substitutes === 'true';
+    
     // Get all valid subcategories to check against
     const subcategoriesResult = await db.query(
       `SELECT DISTINCT LOWER(subcategory) as subcat
@@ -333,7 +332,15 @@ app.get('/api/drinks/by-ingredients', async (req, res) => {
             WHERE di.drink_id = d.drink_id
             AND LOWER(i.name) LIKE LOWER($${paramIndex})
           )
-          OR LOWER(d.garnish) LIKE LOWER($${paramIndex})
+          OR LOWER(d.garnish) LIKE LOWER($${paramIndex})${includeSubstitutes ? `
+          OR EXISTS (
+            SELECT 1
+            FROM drink_ingredients di
+            JOIN ingredient_substitutes s ON s.ingredient_id = di.ingredient_id
+            JOIN ingredients sub ON s.substitute_id = sub.ingredient_id
+            WHERE di.drink_id = d.drink_id
+            AND LOWER(sub.name) LIKE LOWER($${paramIndex})
+          )` : ''}
         )`);
         paramIndex++;
       }
@@ -408,7 +415,7 @@ app.get('/api/game-night-menu', async (req, res) => {
          m.display_order,
          d.drink_id
        FROM game_night_menu m
-       LEFT JOIN drinks d ON LOWER(m.drink_name) = LOWER(d.name)
+       LEFT JOIN drinks d ON m.drink_id = d.drink_id
        ORDER BY m.display_order ASC`
     );
     res.json(result.rows);
@@ -419,7 +426,7 @@ app.get('/api/game-night-menu', async (req, res) => {
   }
 });
 
-// Get Drinks with Risha Menu (pulls from DB; uses db_drink_name for join)
+// Get Drinks with Risha Menu (pulls from DB; drink_id is resolved from db_drink_name at load time)
 app.get('/api/drinks-with-risha-menu', async (req, res) => {
   try {
     const result = await db.query(
@@ -431,7 +438,7 @@ app.get('/api/drinks-with-risha-menu', async (req, res) => {
          m.display_order,
          d.drink_id
        FROM drinks_with_risha_menu m
-       LEFT JOIN drinks d ON LOWER(COALESCE(m.db_drink_name, m.drink_name)) = LOWER(d.name)
+       LEFT JOIN drinks d ON m.drink_id = d.drink_id
        ORDER BY m.display_order ASC`
     );
     res.json(result.rows);
@@ -526,7 +533,7 @@ app.get('/api/drinks/:name/recommendations', async (req, res) => {
 // Recommend drinks based on available ingredients
 app.post('/api/recommendations/by-ingredients', async (req, res) => {
   try {
-    const { ingredient_ids, ingredient_names, min_match_percentage } = req.body;
+    const { ingredient_ids, ingredient_names, min_match_percentage, include_substitutes } = req.body;
     
     let ingredientIdList = [];
     
@@ -553,6 +560,15 @@ app.post('/api/recommendations/by-ingredients', async (req, res) => {
     
     const minMatch = min_match_percentage || 50;
     
+    // With include_substitutes, an ingredient also counts as matched when one of its
+    // precomputed substitutes (ingredient_substitutes) is in the list
+    const isAvailable = include_substitutes
+      ? `(di.ingredient_id = ANY($1::INT[]) OR EXISTS (
+            SELECT 1 FROM ingredient_substitutes s
+            WHERE s.ingredient_id = di.ingredient_id AND s.substitute_id = ANY($1::INT[])
+          ))`
+      : 'di.ingredient_id = ANY($1::INT[])';
+    
     // Find drinks that can be made with available ingredients
     const result = await db.query(
       `WITH drink_stats AS (
@@ -563,12 +579,15 @@ app.post('/api/recommendations/by-ingredients', async (req, res) => {
           d.build_method,
           d.garnish,
           COUNT(DISTINCT di.ingredient_id) FILTER (
-            WHERE di.ingredient_id = ANY($1::INT[])
+            WHERE ${isAvailable}
           ) as matched_ingredients,
           COUNT(DISTINCT di.ingredient_id) as total_ingredients,
           ARRAY_AGG(i.name) FILTER (
-            WHERE di.ingredient_id != ALL($1::INT[])
-          ) as missing_ingredients
+            WHERE NOT ${isAvailable}
+          ) as missing_ingredients,
+          ARRAY_AGG(i.name) FILTER (
+            WHERE di.ingredient_id != ALL($1::INT[]) AND ${isAvailable}
+          ) as substituted_ingredients
         FROM drinks d
         JOIN drink_ingredients di ON d.drink_id = di.drink_id
         JOIN ingredients i ON di.ingredient_id = i.ingredient_id
@@ -583,7 +602,8 @@ app.post('/api/recommendations/by-ingredients', async (req, res) => {
         matched_ingredients,
         total_ingredients,
         ROUND((matched_ingredients::NUMERIC / NULLIF(total_ingredients, 0) * 100), 2) as match_percentage,
-        COALESCE(missing_ingredients, ARRAY[]::TEXT[]) as missing_ingredients
+        COALESCE(missing_ingredients, ARRAY[]::TEXT[]) as missing_ingredients${include_substitutes ? `,
+        COALESCE(substituted_ingredients, ARRAY[]::TEXT[]) as substituted_ingredients` : ''}
       FROM drink_stats
       WHERE (matched_ingredients::NUMERIC / NULLIF(total_ingredients, 0) * 100) >= $2
       ORDER BY match_percentage DESC, total_ingredients ASC
@@ -0,0 +1,79 @@
+-- Change log for incremental refresh of derived data (scripts/refresh_daemon.py).
+-- Row triggers on drinks, ingredients and drink_ingredients record which rows changed and which
+-- columns were set, then NOTIFY catalog_changes. The daemon recomputes only the affected derived
+-- rows (amount_ml, search documents, drink_stats, classifications, garnishes, substitutes) and
+-- deletes the entries it handled.
+-- Run after the full setup: commands.sql drops the base tables and their triggers. Safe to re-run.
+
+CREATE TABLE IF NOT EXISTS catalog_change_log (
+    change_id BIGSERIAL PRIMARY KEY,
+    table_name TEXT NOT NULL,        -- drinks / ingredients / drink_ingredients
+    operation TEXT NOT NULL,         -- INSERT / UPDATE / DELETE
+    drink_id INT,
+    ingredient_id INT,
+    columns TEXT[],                  -- columns changed (UPDATE) or set (INSERT); NULL for DELETE
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION log_catalog_change() RETURNS TRIGGER AS $$
+DECLARE
+    new_row JSONB;
+    old_row JSONB;
+    changed TEXT[];
+BEGIN
+    -- Writes made by the refresh daemon are derived data, not changes
+    IF current_setting('drinksdb.refreshing', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP <> 'DELETE' THEN
+        new_row := to_jsonb(NEW);
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        old_row := to_jsonb(OLD);
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(key ORDER BY key) INTO changed
+        FROM jsonb_object_keys(jsonb_strip_nulls(new_row)) AS key;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(n.key ORDER BY n.key) INTO changed
+        FROM jsonb_each(new_row) n
+        JOIN jsonb_each(old_row) o ON o.key = n.key
+        WHERE n.value IS DISTINCT FROM o.value;
+        IF changed IS NULL THEN
+            RETURN NULL;  -- nothing actually changed
+        END IF;
+    END IF;
+
+    -- A deleted row, or the old key of a row whose key changed
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND (old_row->'drink_id', old_row->'ingredient_id')
+                                                IS DISTINCT FROM (new_row->'drink_id', new_row->'ingredient_id')) THEN
+        INSERT INTO catalog_change_log (table_name, operation, drink_id, ingredient_id, columns)
+        VALUES (TG_TABLE_NAME, 'DELETE', (old_row->>'drink_id')::INT, (old_row->>'ingredient_id')::INT, NULL);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO catalog_change_log (table_name, operation, drink_id, ingredient_id, columns)
+        VALUES (TG_TABLE_NAME, TG_OP, (new_row->>'drink_id')::INT, (new_row->>'ingredient_id')::INT, changed);
+    END IF;
+
+    -- Identical notifications in one transaction are delivered once, at commit
+    PERFORM pg_notify('catalog_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS drinks_change_log ON drinks;
+CREATE TRIGGER drinks_change_log
+    AFTER INSERT OR UPDATE OR DELETE ON drinks
+    FOR EACH ROW EXECUTE FUNCTION log_catalog_change();
+
+DROP TRIGGER IF EXISTS ingredients_change_log ON ingredients;
+CREATE TRIGGER ingredients_change_log
+    AFTER INSERT OR UPDATE OR DELETE ON ingredients
+    FOR EACH ROW EXECUTE FUNCTION log_catalog_change();
+
+DROP TRIGGER IF EXISTS drink_ingredients_change_log ON drink_ingredients;
+CREATE TRIGGER drink_ingredients_change_log
+    AFTER INSERT OR UPDATE OR DELETE ON drink_ingredients
+    FOR EACH ROW EXECUTE FUNCTION log_catalog_change();
@@ -2,70 +2,107 @@
 -- This script updates ingredients to set category='Liquor' and appropriate subcategories
 -- Subcategories: Whiskey, Gin, Vodka, Rum, Tequila, Mezcal, Brandy, Cognac, Cachaça, Pisco, etc.
 
--- WHISKEY (including all whiskey/whisky variants)
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Whiskey'
-WHERE LOWER(name) LIKE '%whiskey%' 
-   OR LOWER(name) LIKE '%whisky%'
-   OR name IN ('Bourbon Whiskey', 'Rye Whiskey', 'Irish Whiskey', 'Blended Scotch Whisky', 'Scotch Whisky', 
-               'Bourbon or Rye Whiskey', 'Rye Whiskey or Bourbon', 'Lagavulin 16y');
+-- classify_liquor_ingredients(ARRAY[...]) reclassifies only those ingredients; scripts/refresh_daemon.py
+-- calls it for ingredients that were added or renamed. A targeted call first clears an existing 'Liquor'
+-- classification, so an ingredient renamed away from a liquor name loses it (category/subcategory become
+-- NULL: the category it had before it was classified is not kept). Safe to re-run.
 
--- GIN
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Gin'
-WHERE LOWER(name) LIKE '%gin%'
-   OR name IN ('Gin', 'Dry Gin', 'London Dry Gin', 'Old Tom Gin');
+CREATE OR REPLACE FUNCTION classify_liquor_ingredients(target_ids INT[] DEFAULT NULL) RETURNS VOID AS $$
+BEGIN
+    IF target_ids IS NOT NULL THEN
+        UPDATE ingredients
+        SET category = NULL, subcategory = NULL
+        WHERE category = 'Liquor' AND ingredient_id = ANY(target_ids);
+    END IF;
 
--- VODKA
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Vodka'
-WHERE LOWER(name) LIKE '%vodka%'
-   OR name IN ('Vodka', 'Smirnoff Vodka', 'Vanilla Vodka', 'Vodka Citron', 'Vodka Vanilla');
+    -- WHISKEY (including all whiskey/whisky variants)
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Whiskey'
+    WHERE (
+        LOWER(name) LIKE '%whiskey%'
+        OR LOWER(name) LIKE '%whisky%'
+        OR name IN ('Bourbon Whiskey', 'Rye Whiskey', 'Irish Whiskey', 'Blended Scotch Whisky', 'Scotch Whisky',
+                    'Bourbon or Rye Whiskey', 'Rye Whiskey or Bourbon', 'Lagavulin 16y')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- RUM
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Rum'
-WHERE LOWER(name) LIKE '%rum%'
-   OR LOWER(name) LIKE '%rhum%'
-   OR name IN ('Rum', 'Aged Rum', 'White Rum', 'Blackstrap Rum', 'Blended Aged Rum',
-               'Amber Jamaican Rum', 'Gold Jamaican Rum', 'Gold Puerto Rican Rum', 
-               'Jamaican Rum', 'Jamaican Dark Rum', 'Jamaica Overproof White Rum',
-               'Cuban Rum', 'Demerara Rum', 'Goslings Rum',
-               'White Cuban Ron', 'Ron Profundo Havana Club', 'Ron Smoky Havana Club',
-               'Martinique Molasses Rhum*', 'Rhum Martinique Agricole');
+    -- GIN
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Gin'
+    WHERE (
+        LOWER(name) LIKE '%gin%'
+        OR name IN ('Gin', 'Dry Gin', 'London Dry Gin', 'Old Tom Gin')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- TEQUILA
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Tequila'
-WHERE LOWER(name) LIKE '%tequila%'
-   OR name IN ('Tequila', '100% Agave Tequila', 'Tequila 100% Agave');
+    -- VODKA
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Vodka'
+    WHERE (
+        LOWER(name) LIKE '%vodka%'
+        OR name IN ('Vodka', 'Smirnoff Vodka', 'Vanilla Vodka', 'Vodka Citron', 'Vodka Vanilla')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- MEZCAL
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Mezcal'
-WHERE LOWER(name) LIKE '%mezcal%'
-   OR name IN ('Mezcal', 'Espadin Mezcal');
+    -- RUM
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Rum'
+    WHERE (
+        LOWER(name) LIKE '%rum%'
+        OR LOWER(name) LIKE '%rhum%'
+        OR name IN ('Rum', 'Aged Rum', 'White Rum', 'Blackstrap Rum', 'Blended Aged Rum',
+                    'Amber Jamaican Rum', 'Gold Jamaican Rum', 'Gold Puerto Rican Rum',
+                    'Jamaican Rum', 'Jamaican Dark Rum', 'Jamaica Overproof White Rum',
+                    'Cuban Rum', 'Demerara Rum', 'Goslings Rum',
+                    'White Cuban Ron', 'Ron Profundo Havana Club', 'Ron Smoky Havana Club',
+                    'Martinique Molasses Rhum*', 'Rhum Martinique Agricole')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- BRANDY (including fruit brandies)
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Brandy'
-WHERE (LOWER(name) LIKE '%brandy%' AND LOWER(name) NOT LIKE '%cognac%')
-   OR name IN ('Brandy', 'Apricot Brandy', 'Peach Brandy', 'Cherry Brandy Luxardo');
+    -- TEQUILA
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Tequila'
+    WHERE (
+        LOWER(name) LIKE '%tequila%'
+        OR name IN ('Tequila', '100% Agave Tequila', 'Tequila 100% Agave')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- COGNAC
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Cognac'
-WHERE (LOWER(name) LIKE '%cognac%' AND LOWER(name) NOT LIKE '%brandy%')
-   OR name = 'Cognac';
+    -- MEZCAL
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Mezcal'
+    WHERE (
+        LOWER(name) LIKE '%mezcal%'
+        OR name IN ('Mezcal', 'Espadin Mezcal')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
--- Handle compound ingredients (these can be either/or, so we'll classify them as the first type)
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Cognac'
-WHERE name = 'Cognac or Brandy';
+    -- BRANDY (including fruit brandies)
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Brandy'
+    WHERE (
+        (LOWER(name) LIKE '%brandy%' AND LOWER(name) NOT LIKE '%cognac%')
+        OR name IN ('Brandy', 'Apricot Brandy', 'Peach Brandy', 'Cherry Brandy Luxardo')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
 
-UPDATE ingredients 
-SET category = 'Liquor', subcategory = 'Whiskey'
-WHERE name IN ('Bourbon or Rye Whiskey', 'Rye Whiskey or Bourbon');
+    -- COGNAC
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Cognac'
+    WHERE (
+        (LOWER(name) LIKE '%cognac%' AND LOWER(name) NOT LIKE '%brandy%')
+        OR name = 'Cognac'
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
+
+    -- Handle compound ingredients (these can be either/or, so we'll classify them as the first type)
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Cognac'
+    WHERE (
+        name = 'Cognac or Brandy'
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
+
+    UPDATE ingredients 
+    SET category = 'Liquor', subcategory = 'Whiskey'
+    WHERE (
+        name IN ('Bourbon or Rye Whiskey', 'Rye Whiskey or Bourbon')
+    ) AND (target_ids IS NULL OR ingredient_id = ANY(target_ids));
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT classify_liquor_ingredients();
 
 -- Verify the updates
 SELECT name, category, subcategory 
@@ -1,6 +1,15 @@
 -- Drop existing tables (optional)
 
 
+-- Menu tables keep their rows; their drink_id links are rebuilt when the menu files are re-run
+ALTER TABLE IF EXISTS game_night_menu DROP COLUMN IF EXISTS drink_id;
+
+ALTER TABLE IF EXISTS drinks_with_risha_menu DROP COLUMN IF EXISTS drink_id;
+
+DROP TABLE IF EXISTS drink_stats;
+
+DROP TABLE IF EXISTS ingredient_substitutes;
+
 DROP TABLE IF EXISTS drink_flavor_profiles;
 
 DROP TABLE IF EXISTS drink_ingredients;
@@ -19,7 +28,8 @@ CREATE TABLE drinks (
     description TEXT,
     glass_type TEXT,         -- e.g., "rocks", "martini", "collins"
     build_method TEXT,       -- e.g., "Stirred", "Shaken", "In Glass"
-    garnish TEXT             -- e.g., "lemon twist", "olive"
+    garnish TEXT,            -- e.g., "lemon twist", "olive"
+    search_document TSVECTOR -- weighted name/ingredients/garnish/description, see drink_search.sql
 );
 
 
@@ -36,6 +46,8 @@ CREATE TABLE drink_ingredients (
     ingredient_id INT REFERENCES ingredients(ingredient_id),
     amount TEXT,       -- e.g., '1.5', '2', or 'dash'
     unit TEXT,         -- e.g., 'oz', 'ml', 'dash', 'tsp'
+    amount_ml NUMERIC(8,2),                        -- to_ml(amount, unit) in scripts/quantities.py (NULL for counted items like 'pcs')
+    is_approximate BOOLEAN NOT NULL DEFAULT FALSE, -- TRUE for top/splash/dash style amounts
     PRIMARY KEY (drink_id, ingredient_id)
 );
 
@@ -55,6 +67,34 @@ CREATE TABLE drink_flavor_profiles (
     intensity NUMERIC(3,1) CHECK (intensity >= 0 AND intensity <= 10)        -- Overall flavor intensity
 );
 
+-- Derived per-drink strength stats, loaded by scripts/drink_stats.py
+CREATE TABLE drink_stats (
+    drink_id INT PRIMARY KEY REFERENCES drinks(drink_id) ON DELETE CASCADE,
+    total_volume_ml NUMERIC(8,2),   -- undiluted recipe volume
+    ethanol_ml NUMERIC(8,2),
+    final_volume_ml NUMERIC(8,2),   -- after dilution by build_method
+    final_abv NUMERIC(5,2),         -- e.g., 18.50 for 18.5% ABV
+    standard_drinks NUMERIC(5,2),   -- US standard drinks (14 g ethanol)
+    ingredient_count INT,
+    approximate_count INT           -- ingredients with top/splash/dash amounts
+);
+
+-- Top-K substitutes per ingredient, loaded by scripts/substitutions.py
+CREATE TABLE ingredient_substitutes (
+    ingredient_id INT REFERENCES ingredients(ingredient_id) ON DELETE CASCADE,
+    substitute_id INT REFERENCES ingredients(ingredient_id) ON DELETE CASCADE,  -- can stand in for ingredient_id
+    score NUMERIC(6,4),
+    rank SMALLINT,                  -- 1 = best substitute
+    PRIMARY KEY (ingredient_id, substitute_id)
+);
+
+-- Catalog-wide settings such as data_version (kept across seed runs, stamped by stamp_data_version.sql)
+CREATE TABLE IF NOT EXISTS catalog_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 
 -- Insert sample data
 -- See seed_data.sql for INSERT statements
@@ -66,3 +106,16 @@ CREATE TABLE drink_flavor_profiles (
 CREATE INDEX idx_flavor_sweetness ON drink_flavor_profiles(sweetness);
 CREATE INDEX idx_flavor_bitterness ON drink_flavor_profiles(bitterness);
 CREATE INDEX idx_flavor_sourness ON drink_flavor_profiles(sourness);
+
+-- Full-text index for ranked drink search
+CREATE INDEX idx_drinks_search_document ON drinks USING GIN (search_document);
+
+-- Index for volume / strength / scaling queries on the numeric quantity
+CREATE INDEX idx_drink_ingredients_amount_ml ON drink_ingredients(amount_ml);
+
+-- Indexes for strength / volume filters
+CREATE INDEX idx_drink_stats_final_abv ON drink_stats(final_abv);
+CREATE INDEX idx_drink_stats_total_volume ON drink_stats(total_volume_ml);
+
+-- Index for "which recipe ingredients can this bottle stand in for" lookups
+CREATE INDEX idx_ingredient_substitutes_substitute ON ingredient_substitutes(substitute_id);
@@ -0,0 +1,62 @@
+-- Ranked full-text drink search.
+-- drinks.search_document is a weighted tsvector: name (A), ingredient names (B), garnish (C), description (D).
+-- The ingestion scripts load it directly; the UPDATE at the bottom backfills databases seeded without it.
+-- Safe to re-run.
+
+ALTER TABLE drinks ADD COLUMN IF NOT EXISTS search_document TSVECTOR;
+CREATE INDEX IF NOT EXISTS idx_drinks_search_document ON drinks USING GIN (search_document);
+
+-- Turn free text into a prefix AND query: 'gin lim' -> 'gin':* & 'lim':*
+-- so partially typed words still match while the GIN index is used.
+CREATE OR REPLACE FUNCTION drink_search_query(search_text TEXT) RETURNS TSQUERY AS $$
+    SELECT to_tsquery('english', string_agg(quote_literal(word) || ':*', ' & '))
+    FROM regexp_split_to_table(
+        lower(regexp_replace(COALESCE(search_text, ''), '[^[:alnum:]]+', ' ', 'g')),
+        '\s+'
+    ) AS word
+    WHERE word <> ''
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Ranked search used by GET /api/drinks/search/:query
+CREATE OR REPLACE FUNCTION search_drinks(search_text TEXT, max_results INT DEFAULT 20)
+RETURNS TABLE(
+    drink_id INT,
+    name TEXT,
+    glass_type TEXT,
+    build_method TEXT,
+    garnish TEXT,
+    rank REAL
+) AS $$
+    SELECT d.drink_id, d.name, d.glass_type, d.build_method, d.garnish,
+           ts_rank(d.search_document, q) AS rank
+    FROM drinks d, drink_search_query(search_text) AS q
+    WHERE d.search_document @@ q
+    ORDER BY rank DESC, d.name
+    LIMIT max_results
+$$ LANGUAGE sql STABLE;
+
+-- Rebuild the search documents of the given drinks (used by scripts/refresh_daemon.py after edits)
+CREATE OR REPLACE FUNCTION refresh_drink_search_documents(target_ids INT[]) RETURNS INT AS $$
+    WITH updated AS (
+        UPDATE drinks d
+        SET search_document =
+            setweight(to_tsvector('english', COALESCE(d.name, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(ing.names, '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(d.garnish, '')), 'C') ||
+            setweight(to_tsvector('english', COALESCE(d.description, '')), 'D')
+        FROM (
+            SELECT dr.drink_id, STRING_AGG(i.name, ' ' ORDER BY i.name) AS names
+            FROM drinks dr
+            LEFT JOIN drink_ingredients di ON dr.drink_id = di.drink_id
+            LEFT JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+            WHERE dr.drink_id = ANY(target_ids)
+            GROUP BY dr.drink_id
+        ) ing
+        WHERE ing.drink_id = d.drink_id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INT FROM updated
+$$ LANGUAGE sql;
+
+-- Backfill search documents for drinks loaded without one
+SELECT refresh_drink_search_documents(ARRAY(SELECT drink_id FROM drinks WHERE search_document IS NULL));
@@ -1,5 +1,5 @@
 -- Drinks with Risha menu: table + taste blurbs.
--- Links to drinks table via db_drink_name (so we can display "The Americano" but join on "Americano").
+-- Links to drinks table via drink_id, resolved from db_drink_name (so we can display "The Americano" but link "Americano").
 -- Run this after your main schema and seed data. If you use a hosted DB (e.g. Render), run this in the SQL console.
 
 -- Create Drinks with Risha menu table
@@ -11,6 +11,10 @@ CREATE TABLE IF NOT EXISTS drinks_with_risha_menu (
     display_order INT
 );
 
+-- Resolved link to drinks (exact names below; scripts/resolve_menus.py handles the rest)
+ALTER TABLE drinks_with_risha_menu ADD COLUMN IF NOT EXISTS drink_id INT REFERENCES drinks(drink_id) ON DELETE SET NULL;
+CREATE INDEX IF NOT EXISTS idx_drinks_with_risha_menu_drink_id ON drinks_with_risha_menu(drink_id);
+
 -- Add Bijou to drinks table if it doesn't exist (classic: gin, green Chartreuse, sweet vermouth, orange bitters)
 INSERT INTO drinks (name, description, glass_type, build_method, garnish)
 SELECT
@@ -28,14 +32,15 @@ DECLARE
 BEGIN
     SELECT drink_id INTO bijou_drink_id FROM drinks WHERE LOWER(name) = 'bijou';
     IF bijou_drink_id IS NOT NULL THEN
-        INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit)
-        SELECT bijou_drink_id, i.ingredient_id, v.amount, v.unit
+        -- amount_ml / is_approximate as computed by scripts/quantities.py to_ml(amount, unit)
+        INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate)
+        SELECT bijou_drink_id, i.ingredient_id, v.amount, v.unit, v.amount_ml, v.is_approximate
         FROM (VALUES
-            ('Gin', '1', 'oz'),
-            ('Green Chartreuse', '1', 'oz'),
-            ('Sweet Red Vermouth', '1', 'oz'),
-            ('Orange Bitters', '2', 'dashes')
-        ) AS v(ingredient_name, amount, unit)
+            ('Gin', '1', 'oz', 30.00, FALSE),
+            ('Green Chartreuse', '1', 'oz', 30.00, FALSE),
+            ('Sweet Red Vermouth', '1', 'oz', 30.00, FALSE),
+            ('Orange Bitters', '2', 'dashes', 2.00, TRUE)
+        ) AS v(ingredient_name, amount, unit, amount_ml, is_approximate)
         JOIN ingredients i ON LOWER(i.name) = LOWER(v.ingredient_name)
         WHERE NOT EXISTS (
             SELECT 1 FROM drink_ingredients di
@@ -66,13 +71,14 @@ DECLARE
 BEGIN
     SELECT drink_id INTO dirty_drink_id FROM drinks WHERE LOWER(name) = 'dirty martini';
     IF dirty_drink_id IS NOT NULL THEN
-        INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit)
-        SELECT dirty_drink_id, i.ingredient_id, v.amount, v.unit
+        -- amount_ml / is_approximate as computed by scripts/quantities.py to_ml(amount, unit)
+        INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate)
+        SELECT dirty_drink_id, i.ingredient_id, v.amount, v.unit, v.amount_ml, v.is_approximate
         FROM (VALUES
-            ('Gin', '2', 'oz'),
-            ('Dry Vermouth', '1/3', 'oz'),
-            ('Olive Brine', '1/2', 'oz')
-        ) AS v(ingredient_name, amount, unit)
+            ('Gin', '2', 'oz', 60.00, FALSE),
+            ('Dry Vermouth', '1/3', 'oz', 10.00, FALSE),
+            ('Olive Brine', '1/2', 'oz', 15.00, FALSE)
+        ) AS v(ingredient_name, amount, unit, amount_ml, is_approximate)
         JOIN ingredients i ON LOWER(i.name) = LOWER(v.ingredient_name)
         WHERE NOT EXISTS (
             SELECT 1 FROM drink_ingredients di
@@ -82,7 +88,7 @@ BEGIN
 END $$;
 
 -- Insert Drinks with Risha menu items (taste blurbs + display order)
--- db_drink_name: exact name in drinks table for JOIN; NULL means use drink_name
+-- db_drink_name: exact name in drinks table used to set drink_id; NULL means use drink_name
 -- Tone: as if saying to her at the bar; flirty, not a dossier.
 INSERT INTO drinks_with_risha_menu (drink_name, db_drink_name, description, display_order) VALUES
 ('The Americano', 'Americano', 'Better than a Campari spritz.', 1),
@@ -94,6 +100,13 @@ ON CONFLICT (drink_name) DO UPDATE SET
     description = EXCLUDED.description,
     display_order = EXCLUDED.display_order;
 
+-- Link menu items to drinks by exact (case-insensitive) name; db_drink_name wins when set
+UPDATE drinks_with_risha_menu m
+SET drink_id = d.drink_id
+FROM drinks d
+WHERE LOWER(COALESCE(m.db_drink_name, m.drink_name)) = LOWER(d.name)
+  AND m.drink_id IS DISTINCT FROM d.drink_id;
+
 -- Set garnishes for Americano and Boulevardier
 UPDATE drinks SET garnish = 'Orange slice' WHERE LOWER(name) = LOWER('Americano');
 UPDATE drinks SET garnish = 'Orange twist' WHERE LOWER(name) = LOWER('Boulevardier');
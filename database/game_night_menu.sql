@@ -8,6 +8,10 @@ CREATE TABLE IF NOT EXISTS game_night_menu (
     UNIQUE(drink_name)
 );
 
+-- Resolved link to drinks (exact names below; scripts/resolve_menus.py handles the rest)
+ALTER TABLE game_night_menu ADD COLUMN IF NOT EXISTS drink_id INT REFERENCES drinks(drink_id) ON DELETE SET NULL;
+CREATE INDEX IF NOT EXISTS idx_game_night_menu_drink_id ON game_night_menu(drink_id);
+
 -- Insert Game Night Menu items
 -- Note: Using exact drink names as they appear in the drinks table
 INSERT INTO game_night_menu (drink_name, description, display_order) VALUES
@@ -82,11 +86,18 @@ BEGIN
     END IF;
     
     -- Insert drink ingredients (using ON CONFLICT to avoid duplicates)
-    INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit)
+    -- amount_ml / is_approximate as computed by scripts/quantities.py to_ml(amount, unit)
+    INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate)
     VALUES 
-        (gimlet_drink_id, gin_id, '2', 'oz'),
-        (gimlet_drink_id, simple_syrup_id, '3/4', 'oz'),
-        (gimlet_drink_id, lime_juice_id, '1/2', 'oz')
+        (gimlet_drink_id, gin_id, '2', 'oz', 60.00, FALSE),
+        (gimlet_drink_id, simple_syrup_id, '3/4', 'oz', 22.50, FALSE),
+        (gimlet_drink_id, lime_juice_id, '1/2', 'oz', 15.00, FALSE)
     ON CONFLICT (drink_id, ingredient_id) DO NOTHING;
 END $$;
 
+-- Link menu items to drinks by exact (case-insensitive) name, now that Gimlet exists
+UPDATE game_night_menu m
+SET drink_id = d.drink_id
+FROM drinks d
+WHERE LOWER(m.drink_name) = LOWER(d.name)
+  AND m.drink_id IS DISTINCT FROM d.drink_id;
@@ -0,0 +1,14 @@
+-- Stamp a new catalog data version once a seed run has finished.
+-- Python query caches (scripts/query_cache.py) key their entries on this value,
+-- so every cached result is dropped when it changes. Run it after any manual
+-- data change as well, or use: python scripts/query_cache.py stamp
+
+CREATE TABLE IF NOT EXISTS catalog_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO catalog_metadata (key, value, updated_at)
+VALUES ('data_version', to_char(clock_timestamp(), 'YYYYMMDD-HH24MISS-US'), now())
+ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at;
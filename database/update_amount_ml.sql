@@ -0,0 +1,398 @@
+-- UPDATE statements to backfill amount_ml / is_approximate on existing drink_ingredients
+-- Generated from seed_data_new.sql by scripts/generate_amount_ml_updates.py
+
+ALTER TABLE drink_ingredients ADD COLUMN IF NOT EXISTS amount_ml NUMERIC(8,2);
+ALTER TABLE drink_ingredients ADD COLUMN IF NOT EXISTS is_approximate BOOLEAN NOT NULL DEFAULT FALSE;
+CREATE INDEX IF NOT EXISTS idx_drink_ingredients_amount_ml ON drink_ingredients(amount_ml);
+
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Between the Sheets' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Between the Sheets' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Between the Sheets' AND i.name = 'Triple Sec';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Between the Sheets' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tequila Sunrise' AND i.name = 'Tequila';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tequila Sunrise' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tequila Sunrise' AND i.name = 'Grenadine Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paper Plane' AND i.name = 'Bourbon Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paper Plane' AND i.name = 'Amaro Nonino';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paper Plane' AND i.name = 'Aperol';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paper Plane' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Corpse Reviver #2' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Corpse Reviver #2' AND i.name = 'Cointreau';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Corpse Reviver #2' AND i.name = 'Lillet Blanc';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Corpse Reviver #2' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 75.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mimosa' AND i.name = 'Freshly Squeezed Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 75.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mimosa' AND i.name = 'Prosecco';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Cuban' AND i.name = 'Aged Rum';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Cuban' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Cuban' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Cuban' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Cuban' AND i.name = 'Brut Champagne or Prosecco';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sea Breeze' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sea Breeze' AND i.name = 'Cranberry Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sea Breeze' AND i.name = 'Grapefruit Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Margarita' AND i.name = 'Tequila 100% Agave';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Margarita' AND i.name = 'Triple Sec';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Margarita' AND i.name = 'Freshly Squeezed Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'New York Sour' AND i.name = 'Rye Whiskey or Bourbon';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'New York Sour' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'New York Sour' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'New York Sour' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'New York Sour' AND i.name = 'Red Wine';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Lemon Drop Martini' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Lemon Drop Martini' AND i.name = 'Triple Sec';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Lemon Drop Martini' AND i.name = 'Fresh Squeezed Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Dark ‘N’ Stormy' AND i.name = 'Goslings Rum';
+UPDATE drink_ingredients di SET amount_ml = 105.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Dark ‘N’ Stormy' AND i.name = 'Ginger Beer';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Naked and Famous' AND i.name = 'Mezcal';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Naked and Famous' AND i.name = 'Yellow Chartreuse';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Naked and Famous' AND i.name = 'Aperol';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Naked and Famous' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Moscow Mule' AND i.name = 'Smirnoff Vodka';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Moscow Mule' AND i.name = 'Ginger Beer';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Moscow Mule' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Fernandito' AND i.name = 'Fernet Branca';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Fernandito' AND i.name = 'Cola';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French Connection' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French Connection' AND i.name = 'Amaretto';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Kir' AND i.name = 'Dry White Wine';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Kir' AND i.name = 'Crème de Cassis';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Sour' AND i.name = 'Pisco';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Sour' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Sour' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Russian Spring Punch' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Russian Spring Punch' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Russian Spring Punch' AND i.name = 'Creme de Cassis';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Russian Spring Punch' AND i.name = 'Sugar Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Russian Spring Punch' AND i.name = 'Sparkling Wine';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Caipirinha' AND i.name = 'Cachaça';
+UPDATE drink_ingredients di SET amount_ml = 20.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Caipirinha' AND i.name = 'White Cane Sugar';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Fizz' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Fizz' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Fizz' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Fizz' AND i.name = 'Soda Water';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Clover Club' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Clover Club' AND i.name = 'Raspberry Syrup';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Clover Club' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Clover Club' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Fashioned' AND i.name = 'Bourbon or Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Fashioned' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Old Fashioned' AND i.name = 'Plain Water';
+UPDATE drink_ingredients di SET amount_ml = 52.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Brandy';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Maraschinoluxardo';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Curacao';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Brandy Crusta' AND i.name = 'Aromatic Bitters';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Tequila';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Cointreau';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Long Island Iced Tea' AND i.name = 'Cola';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Espresso Martini' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Espresso Martini' AND i.name = 'Coffee Liqueur';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Espresso Martini' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Espresso Martini' AND i.name = 'Strong Espresso';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bloody Mary' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bloody Mary' AND i.name = 'Tomato Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bloody Mary' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bloody Mary' AND i.name = 'Worcestershire Sauce';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bloody Mary' AND i.name = 'Tabasco';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sex on the Beach' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sex on the Beach' AND i.name = 'Peach Schnapps';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sex on the Beach' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sex on the Beach' AND i.name = 'Cranberry Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Irish Coffee' AND i.name = 'Irish Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Irish Coffee' AND i.name = 'Hot Coffee';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Irish Coffee' AND i.name = 'Fresh Cream';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Irish Coffee' AND i.name = 'Sugar';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Manhattan' AND i.name = 'Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Manhattan' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Manhattan' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grasshopper' AND i.name = 'Crème de Cacao';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grasshopper' AND i.name = 'Crème de Menthe';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grasshopper' AND i.name = 'Fresh Cream';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tuxedo' AND i.name = 'Old Tom Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tuxedo' AND i.name = 'Dry Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 2.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tuxedo' AND i.name = 'Maraschino Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 1.25, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tuxedo' AND i.name = 'Of Absinthe';
+UPDATE drink_ingredients di SET amount_ml = 3.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tuxedo' AND i.name = 'Orange Bitters';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Stinger' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Stinger' AND i.name = 'White Crème de Menthe';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Garibaldi' AND i.name = 'Bitter Campari';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Garibaldi' AND i.name = 'Freshly Squeezed Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Jungle Bird' AND i.name = 'Blackstrap Rum';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Jungle Bird' AND i.name = 'Campari';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Jungle Bird' AND i.name = 'Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Jungle Bird' AND i.name = 'Freshly Squeezed Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Jungle Bird' AND i.name = 'Demerara Sugar Syrup';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Martinez' AND i.name = 'London Dry Gin';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Martinez' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Martinez' AND i.name = 'Maraschinoluxardo';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Martinez' AND i.name = 'Orange Bitters';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paradise' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paradise' AND i.name = 'Apricot Brandy';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paradise' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bramble' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bramble' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bramble' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bramble' AND i.name = 'Crème de Mûre';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Cherry Sangue Morlacco';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Cointreau';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'DOM Bénédictine';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Grenadine Syrup';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Singapore Sling' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hemingway Special' AND i.name = 'Rum';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hemingway Special' AND i.name = 'Grapefruit Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hemingway Special' AND i.name = 'Maraschino Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hemingway Special' AND i.name = 'Fresh Lime';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Boulevardier' AND i.name = 'Bourbon or Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Boulevardier' AND i.name = 'Bitter Campari';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Boulevardier' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Don’s Special Daiquiri' AND i.name = 'Gold Jamaican Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Don’s Special Daiquiri' AND i.name = 'Cuban Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Don’s Special Daiquiri' AND i.name = 'Passion Fruit Syrup';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Don’s Special Daiquiri' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Don’s Special Daiquiri' AND i.name = 'Honey Syrup';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mary Pickford' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mary Pickford' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mary Pickford' AND i.name = 'Maraschino Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mary Pickford' AND i.name = 'Grenadine Syrup';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Last Word' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Last Word' AND i.name = 'Green Chartreuse';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Last Word' AND i.name = 'Maraschinoluxardo';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Last Word' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pina Colada' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pina Colada' AND i.name = 'Coconut Cream';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pina Colada' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rusty Nail' AND i.name = 'Scotch Whisky';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rusty Nail' AND i.name = 'Drambuie';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'John Collins' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'John Collins' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'John Collins' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'John Collins' AND i.name = 'Soda Water';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paloma' AND i.name = '100% Agave Tequila';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paloma' AND i.name = 'Fresh Lime';
+UPDATE drink_ingredients di SET amount_ml = 105.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Paloma' AND i.name = 'Pink Grapefruit Soda';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ve.N.To' AND i.name = 'White Smooth Grappa';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ve.N.To' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ve.N.To' AND i.name = 'Honey Mix (replace Water With Chamomile)*';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ve.N.To' AND i.name = 'Chamomile Cordial';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ve.N.To' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sazerac' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sazerac' AND i.name = 'Absinthe';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sazerac' AND i.name = 'Peychaud’s Bitters';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Negroni' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Negroni' AND i.name = 'Bitter Campari';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Negroni' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porn Star Martini' AND i.name = 'Vanilla Vodka';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porn Star Martini' AND i.name = 'Passion Fruit Liqueur';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porn Star Martini' AND i.name = 'Passion Fruit Puree';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porn Star Martini' AND i.name = 'Vanilla Sugar';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porn Star Martini' AND i.name = 'Champagne';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tommy’s Margarita' AND i.name = 'Tequila 100% Agave';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tommy’s Margarita' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tommy’s Margarita' AND i.name = 'Agave Nectar';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Remember the Maine' AND i.name = 'Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Remember the Maine' AND i.name = 'Sweet Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Remember the Maine' AND i.name = 'Cherry Brandy Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Remember the Maine' AND i.name = 'Absinthe';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rabo de Galo' AND i.name = 'Cachaca';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rabo de Galo' AND i.name = 'Sweet Vermouth Cinzano Rosso';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rabo de Galo' AND i.name = 'Cynar';
+UPDATE drink_ingredients di SET amount_ml = 0.10, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Rabo de Galo' AND i.name = 'Angostura';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Basil Smash' AND i.name = 'Freshly Squeezed Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Gin Basil Smash' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mojito' AND i.name = 'White Cuban Ron';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mojito' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mojito' AND i.name = 'White Cane Sugar';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grand Margarita' AND i.name = 'Tequila 100% Agave';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grand Margarita' AND i.name = 'Grand Marnier';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Grand Margarita' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Espadin Mezcal';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Jamaica Overproof White Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Falernum';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Maraschino Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Illegal' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Punch' AND i.name = 'Pisco';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Punch' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Punch' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Punch' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Pisco Punch' AND i.name = 'Dry White Wine';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mint Julep' AND i.name = 'Bourbon Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mint Julep' AND i.name = 'Powdered Sugar';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mint Julep' AND i.name = 'Water';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Horse’s Neck' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Horse’s Neck' AND i.name = 'Ginger Ale';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Horse’s Neck' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Amber Jamaican Rum';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Martinique Molasses Rhum*';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Orange Curacao';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Orgeat Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Fresh Squeezed Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Mai-Tai' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porto Flip' AND i.name = 'Brandy';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porto Flip' AND i.name = 'Red Tawny Port Wine';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Porto Flip' AND i.name = 'Egg Yolk';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Planters Punch' AND i.name = 'Jamaican Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Planters Punch' AND i.name = 'Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Planters Punch' AND i.name = 'Sugar Cane Juice';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Canchanchara' AND i.name = 'Cuban Aguardiente';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Canchanchara' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Canchanchara' AND i.name = 'Raw Honey';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Canchanchara' AND i.name = 'Water';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Cream';
+UPDATE drink_ingredients di SET amount_ml = 3.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Orange Flower Water';
+UPDATE drink_ingredients di SET amount_ml = 0.10, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Ramos Fizz' AND i.name = 'Vanilla Extract';
+UPDATE drink_ingredients di SET amount_ml = 105.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bellini' AND i.name = 'Prosecco';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bellini' AND i.name = 'White Peach Puree';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cosmopolitan' AND i.name = 'Vodka Citron';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cosmopolitan' AND i.name = 'Cointreau';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cosmopolitan' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cosmopolitan' AND i.name = 'Cranberry Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Whiskey Sour' AND i.name = 'Bourbon Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Whiskey Sour' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Whiskey Sour' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Whiskey Sour' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cardinale' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cardinale' AND i.name = 'Dry Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cardinale' AND i.name = 'Bitter Campari';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Aviation' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Aviation' AND i.name = 'Maraschinoluxardo';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Aviation' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Aviation' AND i.name = 'Crème de Violette';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Trinidad Sour' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Trinidad Sour' AND i.name = 'Orgeat Syrup';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Trinidad Sour' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Trinidad Sour' AND i.name = 'Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Black Russian' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Black Russian' AND i.name = 'Coffee Liqueur';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Champagne Cocktail' AND i.name = 'Chilled Champagne';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Champagne Cocktail' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Champagne Cocktail' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Champagne Cocktail' AND i.name = 'Grand Marnier';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Suffering Bastard' AND i.name = 'Cognac or Brandy';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Suffering Bastard' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Suffering Bastard' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Suffering Bastard' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Suffering Bastard' AND i.name = 'Ginger Beer';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French Martini' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French Martini' AND i.name = 'Raspberry Liqueur';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French Martini' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Casino' AND i.name = 'Old Tom Gin';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Casino' AND i.name = 'Maraschinoluxardo';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Casino' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Casino' AND i.name = 'Orange Bitters';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sidecar' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sidecar' AND i.name = 'Triple Sec';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sidecar' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'White Lady' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'White Lady' AND i.name = 'Triple Sec';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'White Lady' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 52.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bee’s Knees' AND i.name = 'Dry Gin';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bee’s Knees' AND i.name = 'Honey Syrup';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bee’s Knees' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Bee’s Knees' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cuba Libre' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 120.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cuba Libre' AND i.name = 'Cola';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Cuba Libre' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tipperary' AND i.name = 'Irish Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tipperary' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tipperary' AND i.name = 'Green Chartreuse';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Tipperary' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Ron Profundo Havana Club';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Ron Smoky Havana Club';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Licor Amaretto';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Licor Frangelico';
+UPDATE drink_ingredients di SET amount_ml = 0.25, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Maraschino Luxardo';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Passion Fruit Puree';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'IBA Tiki' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Chartreuse Swizzle' AND i.name = 'Green Chartreuse';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Chartreuse Swizzle' AND i.name = 'Fresh Pineapple Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Chartreuse Swizzle' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Chartreuse Swizzle' AND i.name = 'Falernum';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Jamaican Dark Rum';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Gold Puerto Rican Rum';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Demerara Rum';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Falernum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Donn’s Mix*';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Grenadine Syrup';
+UPDATE drink_ingredients di SET amount_ml = 1.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 0.30, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Zombie' AND i.name = 'Pernod';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Angel Face' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Angel Face' AND i.name = 'Apricot Brandy';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Angel Face' AND i.name = 'Calvados';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French 75' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French 75' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French 75' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'French 75' AND i.name = 'Champagne';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vesper' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vesper' AND i.name = 'Vodka';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vesper' AND i.name = 'Lillet Blanc';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sherry Cobbler' AND i.name = 'Amontillado Sherry';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sherry Cobbler' AND i.name = 'Palo Cortado';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Sherry Cobbler' AND i.name = 'Superfine Sugar';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'South Side' AND i.name = 'London Dry Gin';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'South Side' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'South Side' AND i.name = 'Simple Syrup';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'South Side' AND i.name = 'Egg White';
+UPDATE drink_ingredients di SET amount_ml = 90.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spritz' AND i.name = 'Prosecco';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spritz' AND i.name = 'Aperol';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spritz' AND i.name = 'Soda Water';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Penicillin' AND i.name = 'Blended Scotch Whisky';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Penicillin' AND i.name = 'Lagavulin 16y';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Penicillin' AND i.name = 'Fresh Lemon Juice';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Penicillin' AND i.name = 'Honey Syrup';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Monkey Gland' AND i.name = 'Dry Gin';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Monkey Gland' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Monkey Gland' AND i.name = 'Absinthe';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Monkey Gland' AND i.name = 'Grenadine Syrup';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Missionary’s Downfall' AND i.name = 'White Rum';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Missionary’s Downfall' AND i.name = 'Peach Brandy';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Missionary’s Downfall' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Missionary’s Downfall' AND i.name = 'Honey Mix';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Dry Martini' AND i.name = 'Gin';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Dry Martini' AND i.name = 'Dry Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Rhum Martinique Agricole';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Blended Aged Rum';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Falernum';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Allspice Saint Elizabeth15 Ml Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Fresh Orange Juice';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Honey Syrup';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Three Dots and a Dash' AND i.name = 'Angostura Bitters';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hanky Panky' AND i.name = 'London Dry Gin';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hanky Panky' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 7.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Hanky Panky' AND i.name = 'Fernet';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Americano' AND i.name = 'Bitter Campari';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Americano' AND i.name = 'Sweet Red Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Americano' AND i.name = 'Soda Water';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vieux Carré' AND i.name = 'Rye Whiskey';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vieux Carré' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vieux Carré' AND i.name = 'Sweet Vermouth';
+UPDATE drink_ingredients di SET amount_ml = 5.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vieux Carré' AND i.name = 'Bénédictine';
+UPDATE drink_ingredients di SET amount_ml = 2.00, is_approximate = TRUE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Vieux Carré' AND i.name = 'Peychaud’s Bitters';
+UPDATE drink_ingredients di SET amount_ml = 45.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spicy Fifty' AND i.name = 'Vodka Vanilla';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spicy Fifty' AND i.name = 'Elderflower Cordial';
+UPDATE drink_ingredients di SET amount_ml = 15.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spicy Fifty' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Spicy Fifty' AND i.name = 'Monin Honey Syrup';
+UPDATE drink_ingredients di SET amount_ml = 60.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Daiquiri' AND i.name = 'White Cuban Ron';
+UPDATE drink_ingredients di SET amount_ml = 22.50, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Daiquiri' AND i.name = 'Fresh Lime Juice';
+UPDATE drink_ingredients di SET amount_ml = 10.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Daiquiri' AND i.name = 'Superfine Sugar';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Alexander' AND i.name = 'Cognac';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Alexander' AND i.name = 'Crème de Cacao';
+UPDATE drink_ingredients di SET amount_ml = 30.00, is_approximate = FALSE FROM drinks d, ingredients i WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id AND d.name = 'Alexander' AND i.name = 'Fresh Cream';
+
+-- Total updates: 389
@@ -0,0 +1,14 @@
+-- Post-setup checks, run last by backend/run-full-db-setup.js.
+-- Fails the setup when a data file added rows after the backfill that fills their derived columns.
+
+DO $$
+DECLARE
+    missing TEXT;
+BEGIN
+    -- search_drinks() only matches on search_document, so a drink without one can't be found
+    SELECT string_agg(name, ', ' ORDER BY name) INTO missing
+    FROM drinks WHERE search_document IS NULL;
+    IF missing IS NOT NULL THEN
+        RAISE EXCEPTION 'drinks without a search_document (run drink_search.sql after every data file): %', missing;
+    END IF;
+END $$;
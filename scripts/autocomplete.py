@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Prefix autocomplete for ingredients, garnishes and subcategories.
+
+Builds the same ingredient/garnish/subcategory items as GET /api/ingredients in
+server.js, weighted by how many drinks use them, and answers top-N prefix
+completions from a sorted-array index. Every word start is indexed, so "lime"
+completes "Fresh Lime Juice".
+
+Usage:
+    python autocomplete.py serve --port 3002          # GET /complete?q=lim&limit=10
+    python autocomplete.py export --output-dir ../frontend/public/autocomplete
+    python autocomplete.py query "lim"
+
+exclude parameters name items by kind and id, so excluding an ingredient never
+hides a garnish or subcategory with the same text:
+    GET /complete?q=gin&exclude=ingredient:12&exclude=subcategory:gin
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import os
+import re
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import db
+from search_documents import fold_accents
+
+# Prefixes up to this length get precomputed top-N lists (short prefixes match the most keys)
+PRECOMPUTE_DEPTH = 3
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+# Exported shard files are keyed by the first SHARD_LENGTH characters of the prefix
+SHARD_LENGTH = 2
+MAX_EXPORT_DEPTH = 8
+ITEM_TYPES = ('ingredient', 'garnish', 'subcategory')
+
+INGREDIENTS_QUERY = """
+    SELECT i.ingredient_id, i.name, i.subcategory, COUNT(di.drink_id)
+    FROM ingredients i
+    LEFT JOIN drink_ingredients di ON di.ingredient_id = i.ingredient_id
+    GROUP BY i.ingredient_id, i.name, i.subcategory
+    ORDER BY i.name
+"""
+
+GARNISHES_QUERY = """
+    SELECT garnish, COUNT(*)
+    FROM drinks
+    WHERE garnish IS NOT NULL AND garnish != ''
+    GROUP BY garnish
+    ORDER BY garnish
+"""
+
+SUBCATEGORIES_QUERY = """
+    SELECT i.subcategory, COUNT(di.drink_id)
+    FROM ingredients i
+    LEFT JOIN drink_ingredients di ON di.ingredient_id = i.ingredient_id
+    WHERE i.subcategory IS NOT NULL AND i.subcategory != ''
+    GROUP BY i.subcategory
+    ORDER BY i.subcategory
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, accent-fold and collapse punctuation to single spaces."""
+    return re.sub(r'[^a-z0-9]+', ' ', fold_accents(text).lower()).strip()
+
+
+def build_items(ingredient_rows: Iterable[tuple], garnish_rows: Iterable[tuple],
+                subcategory_rows: Iterable[tuple]) -> List[Dict]:
+    """
+    Merge ingredients, garnishes and subcategories the way /api/ingredients does.
+
+    Garnishes are only added when no ingredient has the same (case-insensitive) name;
+    subcategories are always added, typed 'subcategory' with an "(any)" display name.
+    """
+    all_items = {}
+
+    for ingredient_id, name, subcategory, uses in ingredient_rows:
+        all_items[name.lower()] = {
+            'ingredient_id': ingredient_id,
+            'name': name,
+            'type': 'ingredient',
+            'subcategory': subcategory,
+            'weight': int(uses),
+        }
+
+    for name, uses in garnish_rows:
+        key = name.lower()
+        if key not in all_items:
+            all_items[key] = {
+                'ingredient_id': None,
+                'name': name,
+                'type': 'garnish',
+                'weight': int(uses),
+            }
+
+    for name, uses in subcategory_rows:
+        key = f"[subcategory]{name.lower()}"
+        if key not in all_items:
+            all_items[key] = {
+                'ingredient_id': None,
+                'name': name,
+                'type': 'subcategory',
+                'displayName': f"{name} (any)",
+                'weight': int(uses),
+            }
+
+    return list(all_items.values())
+
+
+def item_key(item: Dict) -> Tuple:
+    """(type, id) of an item: ingredients by ingredient_id, garnishes and subcategories by lowercase name."""
+    if item['type'] == 'ingredient':
+        return ('ingredient', item['ingredient_id'])
+    return (item['type'], item['name'].lower())
+
+
+def parse_exclude(value: str) -> Tuple:
+    """'ingredient:12', 'garnish:Lime wheel' or 'subcategory:Gin' -> item key; raises ValueError otherwise."""
+    kind, separator, ident = value.partition(':')
+    if not separator or kind not in ITEM_TYPES or not ident.strip():
+        raise ValueError(f"exclude must be <{'|'.join(ITEM_TYPES)}>:<id or name>, got '{value}'")
+    if kind == 'ingredient':
+        return (kind, int(ident))
+    return (kind, ident.strip().lower())
+
+
+class AutocompleteIndex:
+    """Sorted array of word-start keys with popularity-ranked prefix lookups."""
+
+    def __init__(self, items: List[Dict]):
+        self.items = items
+        self.item_keys = [item_key(item) for item in items]
+        entries = []
+        for item_index, item in enumerate(items):
+            text = normalize_text(item['name'])
+            # Index the full name and every later word start: "fresh lime juice", "lime juice", "juice"
+            starts = [0] + [m.end() for m in re.finditer(' ', text)]
+            for start in starts:
+                entries.append((text[start:], item_index))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.item_indexes = [item_index for _, item_index in entries]
+        self.top = {}
+        for prefix in {key[:length] for key in self.keys for length in range(1, PRECOMPUTE_DEPTH + 1)}:
+            self.top[prefix] = self._rank(prefix, MAX_LIMIT)
+
+    def _rank(self, prefix: str, limit: int, exclude: Optional[set] = None) -> List[int]:
+        """Return item indexes whose keys start with prefix, most used first."""
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + '\uffff')
+        candidates = {
+            self.item_indexes[i] for i in range(lo, hi)
+            if not exclude or self.item_keys[self.item_indexes[i]] not in exclude
+        }
+        return heapq.nsmallest(
+            limit, candidates,
+            key=lambda i: (self._type_order(i), -self.items[i]['weight'], self.items[i]['name']),
+        )
+
+    def _type_order(self, item_index: int) -> int:
+        # Subcategories first, matching the ordering of /api/ingredients
+        return 0 if self.items[item_index]['type'] == 'subcategory' else 1
+
+    def complete(self, text: str, limit: int = DEFAULT_LIMIT, exclude: Iterable[Tuple] = ()) -> List[Dict]:
+        """Top-N items whose name (or any word in it) starts with text, skipping excluded item keys."""
+        prefix = normalize_text(text)
+        if not prefix:
+            return []
+        exclude = set(exclude)
+        limit = max(1, min(limit, MAX_LIMIT))
+        ranked = [i for i in self.top.get(prefix, []) if self.item_keys[i] not in exclude][:limit]
+        # Fall back to a range scan if the prefix isn't precomputed or exclusions used up the list
+        if len(ranked) < limit and (prefix not in self.top or len(self.top[prefix]) == MAX_LIMIT):
+            ranked = self._rank(prefix, limit, exclude)
+        return [self.items[i] for i in ranked]
+
+    def export_shards(self, output_dir: str, limit: int = DEFAULT_LIMIT) -> int:
+        """
+        Write <shard>.json files mapping each prefix to its top-N items.
+
+        A client fetches shard normalize(q)[:SHARD_LENGTH] once and then looks up every
+        longer prefix locally; prefixes shorter than SHARD_LENGTH go to _short.json.
+        Past MAX_EXPORT_DEPTH characters, filter the deepest exported list client-side.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        prefixes = {key[:length] for key in self.keys for length in range(1, min(len(key), MAX_EXPORT_DEPTH) + 1)}
+        shards = {}
+        for prefix in prefixes:
+            shard = prefix[:SHARD_LENGTH] if len(prefix) >= SHARD_LENGTH else '_short'
+            shards.setdefault(shard, {})[prefix] = [self.items[i] for i in self._rank(prefix, limit)]
+
+        for shard, completions in shards.items():
+            filename = os.path.join(output_dir, f"{shard.replace(' ', '_')}.json")
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(completions, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        return len(shards)
+
+
+def load_index(conn) -> AutocompleteIndex:
+    """Fetch usage-weighted items from the database and index them."""
+    cursor = conn.cursor()
+    cursor.execute(INGREDIENTS_QUERY)
+    ingredient_rows = cursor.fetchall()
+    cursor.execute(GARNISHES_QUERY)
+    garnish_rows = cursor.fetchall()
+    cursor.execute(SUBCATEGORIES_QUERY)
+    subcategory_rows = cursor.fetchall()
+    cursor.close()
+    return AutocompleteIndex(build_items(ingredient_rows, garnish_rows, subcategory_rows))
+
+
+def make_handler(index: AutocompleteIndex):
+    """Build a request handler bound to an index."""
+
+    class AutocompleteHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != '/complete':
+                self.send_json(404, {'error': 'Route not found', 'path': url.path})
+                return
+            params = parse_qs(url.query)
+            try:
+                limit = int(params.get('limit', [DEFAULT_LIMIT])[0])
+            except ValueError:
+                self.send_json(400, {'error': 'limit must be an integer'})
+                return
+            try:
+                exclude = [parse_exclude(value) for value in params.get('exclude', [])]
+            except ValueError as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            results = index.complete(params.get('q', [''])[0], limit, exclude)
+            self.send_json(200, results)
+
+        def send_json(self, status: int, body) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Cache-Control', 'public, max-age=300')
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return AutocompleteHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prefix autocomplete for ingredients, garnishes and subcategories')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='Serve completions over HTTP')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=3002, help='Port (default: 3002)')
+
+    export_parser = subparsers.add_parser('export', help='Write precomputed completions as sharded JSON')
+    export_parser.add_argument('--output-dir', default='autocomplete', help='Directory for shard files')
+    export_parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='Completions per prefix')
+
+    query_parser = subparsers.add_parser('query', help='Print completions for one prefix')
+    query_parser.add_argument('prefix', help='Text typed so far')
+    query_parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='Maximum completions')
+
+    args = parser.parse_args()
+
+    conn = db.connect()
+    try:
+        index = load_index(conn)
+    except Exception as e:
+        print(f"Error loading autocomplete data: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if args.command == 'query':
+        for item in index.complete(args.prefix, args.limit):
+            print(f"  {item.get('displayName') or item['name']:<40} {item['type']:<12} {item['weight']}")
+    elif args.command == 'export':
+        shards = index.export_shards(args.output_dir, args.limit)
+        print(f"✓ Wrote {shards} shards for {len(index.items)} items to {args.output_dir}")
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), make_handler(index))
+        print(f"Autocomplete running on http://{args.host}:{args.port}/complete?q=")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
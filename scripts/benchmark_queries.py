@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Benchmark the backend's route queries against scale-loaded synthetic catalogs.
+
+Each scale gets its own schema (bench_1k, bench_10k, ...) in a local Postgres,
+built from database/commands.sql and filled with COPY. The SQL used by the
+server.js routes is then replayed with Zipf-distributed parameters under a
+configurable number of concurrent connections, and p50/p95/p99 latency and
+throughput are reported per route. The *_substitutes routes replay the
+?substitutes=true / include_substitutes variants against substitutes computed
+with substitutions.py at load time.
+
+Data and query parameters are drawn from separate generators seeded by --seed,
+so a --skip-load run replays exactly the same requests as the run that loaded.
+
+Usage:
+    python benchmark_queries.py --scales 1k,10k --concurrency 8 --requests 200
+    python benchmark_queries.py --scales 100k --skip-load --output run2.json --compare run1.json
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import db
+from substitutions import compute_substitutes
+
+SCHEMA_FILE = os.path.join(db.PROJECT_ROOT, 'database', 'commands.sql')
+# Applied after the data is loaded (functions + backfills of derived columns)
+POST_LOAD_FILES = [os.path.join(db.PROJECT_ROOT, 'database', 'drink_search.sql')]
+
+SCALES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+BASE_SPIRITS = {
+    'Gin': 'Gin', 'Dry Gin': 'Gin', 'Vodka': 'Vodka', 'White Rum': 'Rum', 'Aged Rum': 'Rum',
+    'Bourbon Whiskey': 'Whiskey', 'Rye Whiskey': 'Whiskey', 'Tequila': 'Tequila', 'Mezcal': 'Mezcal',
+    'Cognac': 'Cognac', 'Brandy': 'Brandy', 'Cachaça': 'Cachaça',
+}
+MODIFIERS = [
+    'Fresh Lime Juice', 'Fresh Lemon Juice', 'Simple Syrup', 'Angostura Bitters', 'Sweet Red Vermouth',
+    'Dry Vermouth', 'Campari', 'Cointreau', 'Soda Water', 'Egg White', 'Orange Bitters', 'Maraschino',
+]
+GLASSES = ['Martini', 'Coupe', 'Rocks', 'Highball', 'Flute', 'Hurricane', 'Julep', 'Copo']
+METHODS = ['Shaken', 'Stirred', 'In Glass', 'Blended']
+GARNISHES = ['Lemon Twist', 'Lime Wheel', 'Orange Peel', 'Cherry', 'Olive', 'Mint', None]
+
+
+# ---------------------------------------------------------------------------
+# Route queries (kept in sync with backend/server.js, $n placeholders -> %s)
+# ---------------------------------------------------------------------------
+
+SEARCH_SQL = """
+    SELECT drink_id, name, glass_type, build_method, garnish
+    FROM search_drinks(%s, 20)
+"""
+
+DRINK_DETAIL_SQL = """
+    SELECT drink_id, name, description, glass_type, build_method, garnish FROM drinks WHERE LOWER(name) = LOWER(%s)
+"""
+
+DRINK_INGREDIENTS_SQL = """
+    SELECT i.name, di.amount, di.unit
+    FROM drink_ingredients di
+    JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+    WHERE di.drink_id = %s
+    ORDER BY i.name
+"""
+
+BY_INGREDIENT_CONDITION = """(
+    EXISTS (
+      SELECT 1
+      FROM drink_ingredients di
+      JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+      WHERE di.drink_id = d.drink_id
+      AND LOWER(i.name) LIKE LOWER(%s)
+    )
+    OR LOWER(d.garnish) LIKE LOWER(%s){substitutes}
+)"""
+
+BY_INGREDIENT_SUBSTITUTE_CONDITION = """
+    OR EXISTS (
+      SELECT 1
+      FROM drink_ingredients di
+      JOIN ingredient_substitutes s ON s.ingredient_id = di.ingredient_id
+      JOIN ingredients sub ON s.substitute_id = sub.ingredient_id
+      WHERE di.drink_id = d.drink_id
+      AND LOWER(sub.name) LIKE LOWER(%s)
+    )"""
+
+BY_SUBCATEGORY_CONDITION = """(
+    EXISTS (
+      SELECT 1
+      FROM drink_ingredients di
+      JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+      WHERE di.drink_id = d.drink_id
+      AND LOWER(i.subcategory) = %s
+    )
+)"""
+
+BY_INGREDIENTS_SQL = """
+    SELECT DISTINCT d.drink_id, d.name, d.glass_type, d.build_method, d.garnish
+    FROM drinks d
+    WHERE {conditions}
+    ORDER BY d.name
+"""
+
+RECOMMENDATIONS_SQL = """
+    WITH target_ingredients AS (
+      SELECT ingredient_id FROM drink_ingredients WHERE drink_id = %(drink_id)s
+    ),
+    drink_similarity AS (
+      SELECT
+        d.drink_id, d.name, d.glass_type, d.build_method, d.garnish,
+        COUNT(DISTINCT di.ingredient_id) FILTER (
+          WHERE di.ingredient_id IN (SELECT ingredient_id FROM target_ingredients)
+        ) as common_ingredients,
+        COUNT(DISTINCT di.ingredient_id) as total_ingredients,
+        COUNT(DISTINCT CASE
+          WHEN di.ingredient_id IN (SELECT ingredient_id FROM target_ingredients)
+          THEN di.ingredient_id
+        END) + COUNT(DISTINCT CASE
+          WHEN di.ingredient_id NOT IN (SELECT ingredient_id FROM target_ingredients)
+          THEN di.ingredient_id
+        END) as union_ingredients
+      FROM drinks d
+      JOIN drink_ingredients di ON d.drink_id = di.drink_id
+      WHERE d.drink_id != %(drink_id)s
+      GROUP BY d.drink_id, d.name, d.glass_type, d.build_method, d.garnish
+    )
+    SELECT drink_id, name, glass_type, build_method, garnish, common_ingredients, total_ingredients,
+      CASE
+        WHEN union_ingredients > 0
+        THEN ROUND((common_ingredients::NUMERIC / union_ingredients::NUMERIC) * 100, 2)
+        ELSE 0
+      END as similarity_score
+    FROM drink_similarity
+    WHERE union_ingredients > 0
+    ORDER BY similarity_score DESC, common_ingredients DESC
+    LIMIT %(limit)s
+"""
+
+RECOMMENDATIONS_BY_INGREDIENTS_SQL = """
+    WITH drink_stats AS (
+      SELECT
+        d.drink_id, d.name, d.glass_type, d.build_method, d.garnish,
+        COUNT(DISTINCT di.ingredient_id) FILTER (
+          WHERE {available}
+        ) as matched_ingredients,
+        COUNT(DISTINCT di.ingredient_id) as total_ingredients,
+        ARRAY_AGG(i.name) FILTER (
+          WHERE NOT {available}
+        ) as missing_ingredients,
+        ARRAY_AGG(i.name) FILTER (
+          WHERE di.ingredient_id != ALL(%(ids)s::INT[]) AND {available}
+        ) as substituted_ingredients
+      FROM drinks d
+      JOIN drink_ingredients di ON d.drink_id = di.drink_id
+      JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+      GROUP BY d.drink_id, d.name, d.glass_type, d.build_method, d.garnish
+    )
+    SELECT drink_id, name, glass_type, build_method, garnish, matched_ingredients, total_ingredients,
+      ROUND((matched_ingredients::NUMERIC / NULLIF(total_ingredients, 0) * 100), 2) as match_percentage,
+      COALESCE(missing_ingredients, ARRAY[]::TEXT[]) as missing_ingredients{substituted}
+    FROM drink_stats
+    WHERE (matched_ingredients::NUMERIC / NULLIF(total_ingredients, 0) * 100) >= %(min_match)s
+    ORDER BY match_percentage DESC, total_ingredients ASC
+    LIMIT 20
+"""
+
+AVAILABLE_CONDITION = "di.ingredient_id = ANY(%(ids)s::INT[])"
+
+AVAILABLE_WITH_SUBSTITUTES_CONDITION = """(di.ingredient_id = ANY(%(ids)s::INT[]) OR EXISTS (
+            SELECT 1 FROM ingredient_substitutes s
+            WHERE s.ingredient_id = di.ingredient_id AND s.substitute_id = ANY(%(ids)s::INT[])
+          ))"""
+
+SUBSTITUTED_COLUMN = """,
+      COALESCE(substituted_ingredients, ARRAY[]::TEXT[]) as substituted_ingredients"""
+
+
+# ---------------------------------------------------------------------------
+# Synthetic catalog
+# ---------------------------------------------------------------------------
+
+class Catalog:
+    """Names of a generated catalog, used to draw realistic query parameters."""
+
+    def __init__(self, n_drinks: int, seed: int = 0):
+        self.n_drinks = n_drinks
+        # Data generation and query parameters use separate streams, so skipping the load
+        # doesn't shift the parameters drawn for the workload
+        self.rng = np.random.default_rng([seed, 0])
+        self.params_rng = np.random.default_rng([seed, 1])
+        base_names = list(BASE_SPIRITS) + MODIFIERS
+        # Ingredient vocabulary grows sub-linearly with the catalog, like real recipe data
+        n_extra = max(0, int(40 * np.sqrt(n_drinks / 200)) - len(base_names))
+        extra_bases = [base_names[i % len(base_names)] for i in range(n_extra)]
+        self.ingredient_names = base_names + [f"House {base} No. {i}" for i, base in enumerate(extra_bases)]
+        self.ingredient_subcategories = [BASE_SPIRITS.get(base) for base in base_names + extra_bases]
+        self.drink_names = [f"Synthetic {GLASSES[i % len(GLASSES)]} {i}" for i in range(n_drinks)]
+
+    def zipf_index(self, size: int, n: int, a: float = 1.3, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Draw popularity-skewed indexes in [0, n) from rng (default: the data generator)."""
+        return ((rng or self.rng).zipf(a, size=size) - 1) % n
+
+    def recipe_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (drink_index, ingredient_index) with up to 6 distinct ingredients per drink."""
+        per_drink = self.rng.integers(2, 7, size=self.n_drinks)
+        drink_index = np.repeat(np.arange(self.n_drinks), per_drink)
+        ingredient_index = self.zipf_index(len(drink_index), len(self.ingredient_names))
+        # Drop duplicate (drink, ingredient) pairs so the primary key holds
+        pairs = np.unique(drink_index.astype(np.int64) * len(self.ingredient_names) + ingredient_index)
+        return pairs // len(self.ingredient_names), pairs % len(self.ingredient_names)
+
+
+def copy_rows(cursor, table: str, columns: List[str], rows, chunk_size: int = 100_000) -> None:
+    """COPY an iterable of tuples into a table in chunks."""
+    buffer = io.StringIO()
+    count = 0
+
+    def flush():
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    for row in rows:
+        buffer.write('\t'.join('\\N' if value is None else str(value) for value in row) + '\n')
+        count += 1
+        if count % chunk_size == 0:
+            flush()
+    if count % chunk_size:
+        flush()
+
+
+def load_catalog(conn, schema: str, catalog: Catalog) -> None:
+    """Create a fresh schema from commands.sql, bulk-load the synthetic catalog and apply POST_LOAD_FILES."""
+    with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
+        schema_sql = f.read()
+
+    cursor = conn.cursor()
+    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path TO {schema}")
+    cursor.execute(schema_sql)
+
+    copy_rows(cursor, 'ingredients', ['ingredient_id', 'name', 'category', 'subcategory', 'abv'], (
+        (i + 1, name, 'Liquor' if subcat else None, subcat, '40.00' if subcat else None)
+        for i, (name, subcat) in enumerate(zip(catalog.ingredient_names, catalog.ingredient_subcategories))
+    ))
+
+    glasses = catalog.rng.integers(0, len(GLASSES), size=catalog.n_drinks)
+    methods = catalog.rng.integers(0, len(METHODS), size=catalog.n_drinks)
+    garnishes = catalog.rng.integers(0, len(GARNISHES), size=catalog.n_drinks)
+    copy_rows(cursor, 'drinks', ['drink_id', 'name', 'description', 'glass_type', 'build_method', 'garnish'], (
+        (i + 1, name, 'Shake with ice and strain.', GLASSES[glasses[i]], METHODS[methods[i]], GARNISHES[garnishes[i]])
+        for i, name in enumerate(catalog.drink_names)
+    ))
+
+    drink_index, ingredient_index = catalog.recipe_rows()
+    amounts = catalog.rng.choice(['1/2', '3/4', '1', '1 1/2', '2'], size=len(drink_index))
+    copy_rows(cursor, 'drink_ingredients', ['drink_id', 'ingredient_id', 'amount', 'unit'], (
+        (int(d) + 1, int(i) + 1, a, 'oz') for d, i, a in zip(drink_index, ingredient_index, amounts)
+    ))
+
+    # Substitutes feed the *_substitutes routes
+    substitutes = compute_substitutes(
+        drink_index, ingredient_index, catalog.ingredient_names,
+        ['Liquor' if subcat else None for subcat in catalog.ingredient_subcategories],
+        catalog.ingredient_subcategories,
+    )
+    copy_rows(cursor, 'ingredient_substitutes', ['ingredient_id', 'substitute_id', 'score', 'rank'], (
+        (int(i) + 1, int(sub) + 1, round(float(score), 4), int(rank))
+        for i, sub, score, rank in zip(substitutes['ingredient'], substitutes['substitute'],
+                                       substitutes['score'], substitutes['rank'])
+    ))
+
+    for filename in POST_LOAD_FILES:
+        with open(filename, 'r', encoding='utf-8') as f:
+            cursor.execute(f.read())
+
+    cursor.execute("SELECT setval('drinks_drink_id_seq', (SELECT MAX(drink_id) FROM drinks))")
+    cursor.execute("SELECT setval('ingredients_ingredient_id_seq', (SELECT MAX(ingredient_id) FROM ingredients))")
+    cursor.execute("ANALYZE")
+    conn.commit()
+    cursor.close()
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+def build_workload(catalog: Catalog) -> Dict[str, Callable[[], Tuple[str, object]]]:
+    """Map route name -> function returning (sql, params) for one request."""
+    rng = catalog.params_rng
+    n_ingredients = len(catalog.ingredient_names)
+    subcategory_names = sorted({s for s in catalog.ingredient_subcategories if s})
+
+    def zipf_index(size: int, n: int) -> np.ndarray:
+        return catalog.zipf_index(size, n, rng=rng)
+
+    def search():
+        name = catalog.drink_names[zipf_index(1, catalog.n_drinks)[0]]
+        # Users type a partial word
+        return SEARCH_SQL, (name.split()[1][:4],)
+
+    def drink_detail():
+        return DRINK_DETAIL_SQL, (catalog.drink_names[zipf_index(1, catalog.n_drinks)[0]].lower(),)
+
+    def drink_ingredients():
+        return DRINK_INGREDIENTS_SQL, (int(zipf_index(1, catalog.n_drinks)[0]) + 1,)
+
+    def by_ingredients(include_substitutes: bool = False):
+        count = int(rng.integers(1, 4))
+        picked = zipf_index(count, n_ingredients)
+        like_condition = BY_INGREDIENT_CONDITION.format(
+            substitutes=BY_INGREDIENT_SUBSTITUTE_CONDITION if include_substitutes else '')
+        conditions, params = [], []
+        for index in picked:
+            # Mix whole names, partial words and subcategory terms like the frontend sends;
+            # subcategories get server.js's exact-match condition
+            if rng.random() < 0.3 and subcategory_names:
+                conditions.append(BY_SUBCATEGORY_CONDITION)
+                params.append(subcategory_names[int(rng.integers(0, len(subcategory_names)))].lower())
+                continue
+            name = catalog.ingredient_names[index]
+            if rng.random() < 0.5:
+                name = name.split()[0]
+            conditions.append(like_condition)
+            params.extend([f"%{name}%"] * like_condition.count('%s'))
+        return BY_INGREDIENTS_SQL.format(conditions=' AND '.join(conditions)), tuple(params)
+
+    def recommendations():
+        return RECOMMENDATIONS_SQL, {'drink_id': int(zipf_index(1, catalog.n_drinks)[0]) + 1, 'limit': 10}
+
+    def recommendations_by_ingredients(include_substitutes: bool = False):
+        ids = sorted({int(i) + 1 for i in zipf_index(int(rng.integers(3, 12)), n_ingredients)})
+        sql = RECOMMENDATIONS_BY_INGREDIENTS_SQL.format(
+            available=AVAILABLE_WITH_SUBSTITUTES_CONDITION if include_substitutes else AVAILABLE_CONDITION,
+            substituted=SUBSTITUTED_COLUMN if include_substitutes else '',
+        )
+        return sql, {'ids': ids, 'min_match': 50}
+
+    return {
+        'search': search,
+        'drink_detail': drink_detail,
+        'drink_ingredients': drink_ingredients,
+        'by_ingredients': by_ingredients,
+        'by_ingredients_substitutes': lambda: by_ingredients(include_substitutes=True),
+        'recommendations': recommendations,
+        'recommendations_by_ingredients': recommendations_by_ingredients,
+        'recommendations_by_ingredients_substitutes': lambda: recommendations_by_ingredients(include_substitutes=True),
+    }
+
+
+def run_route(schema: str, make_request: Callable, requests: int, concurrency: int) -> Dict[str, float]:
+    """Replay one route with N concurrent connections and summarize latency."""
+    local = threading.local()
+    connections = []
+    lock = threading.Lock()
+    # Draw parameters up front so the RNG isn't shared across threads
+    work = [make_request() for _ in range(requests)]
+
+    def get_cursor():
+        if not hasattr(local, 'cursor'):
+            conn = db.connect()
+            conn.autocommit = True
+            with lock:
+                connections.append(conn)
+            local.cursor = conn.cursor()
+            local.cursor.execute(f"SET search_path TO {schema}")
+        return local.cursor
+
+    def execute(item):
+        sql, params = item
+        cursor = get_cursor()
+        start = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        return time.perf_counter() - start
+
+    try:
+        # Warm up one connection per worker before timing
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(execute, work[:concurrency]))
+            wall_start = time.perf_counter()
+            latencies = np.array(list(pool.map(execute, work)))
+            wall = time.perf_counter() - wall_start
+    finally:
+        for conn in connections:
+            conn.close()
+
+    p50, p95, p99 = np.percentile(latencies * 1000, [50, 95, 99])
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(latencies.mean() * 1000), 3),
+        'throughput_rps': round(requests / wall, 1) if wall > 0 else None,
+    }
+
+
+def print_results(results: Dict, previous: Dict = None) -> None:
+    """Print a latency table, with p95 change vs a previous run when given."""
+    for scale, routes in results['scales'].items():
+        print(f"\n{scale}:")
+        print(f"  {'route':<32} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+        for route, stats in routes.items():
+            line = (f"  {route:<32} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+                    f"{stats['p99_ms']:>9.2f} {stats['throughput_rps'] or 0:>9.1f}")
+            before = (previous or {}).get('scales', {}).get(scale, {}).get(route)
+            if before and before['p95_ms']:
+                change = (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+                line += f"  p95 {change:+.1f}%"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark server.js route queries on synthetic catalogs')
+    parser.add_argument('--scales', default='1k,10k', help=f"Comma-separated scales from {', '.join(SCALES)} (default: 1k,10k)")
+    parser.add_argument('--routes', help='Comma-separated subset of routes to run (default: all)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent connections (default: 4)')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per route (default: 200)')
+    parser.add_argument('--skip-load', action='store_true', help='Reuse existing bench_* schemas')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for data and parameters')
+    parser.add_argument('--output', help='Write results as JSON for later comparison')
+    parser.add_argument('--compare', help='Previous JSON results to compare p95 against')
+    parser.add_argument('--allow-remote', action='store_true', help='Allow running against a non-local database')
+
+    args = parser.parse_args()
+
+    config = db.get_db_config()
+    target = config.get('dsn') or config.get('host', '')
+    if not args.allow_remote and not any(h in target for h in ('localhost', '127.0.0.1', '/tmp', '/var/run')):
+        print("Error: benchmark targets a non-local database. Point DB_HOST/DATABASE_URL at a local "
+              "Postgres or pass --allow-remote.", file=sys.stderr)
+        sys.exit(1)
+
+    scales = [s.strip().lower() for s in args.scales.split(',') if s.strip()]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        print(f"Error: unknown scale(s) {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    results = {'started_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'concurrency': args.concurrency,
+               'requests': args.requests, 'scales': {}}
+
+    for scale in scales:
+        schema = f"bench_{scale}"
+        catalog = Catalog(SCALES[scale], seed=args.seed)
+
+        if not args.skip_load:
+            print(f"Loading {SCALES[scale]} drinks into {schema}...")
+            start = time.perf_counter()
+            conn = db.connect()
+            try:
+                load_catalog(conn, schema, catalog)
+            finally:
+                conn.close()
+            print(f"  ✓ loaded in {time.perf_counter() - start:.1f}s")
+
+        workload = build_workload(catalog)
+        if args.routes:
+            selected = [r.strip() for r in args.routes.split(',')]
+            workload = {name: fn for name, fn in workload.items() if name in selected}
+
+        results['scales'][scale] = {}
+        for route, make_request in workload.items():
+            print(f"  running {route}...")
+            results['scales'][scale][route] = run_route(schema, make_request, args.requests, args.concurrency)
+
+    print_results(results, previous)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
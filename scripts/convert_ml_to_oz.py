@@ -3,10 +3,20 @@
 Convert ml measurements to oz in seed_data_new.sql
 - 30 ml = 1 oz (simplified conversion)
 - 5 ml = 1 barspoon
+
+Usage:
+    python convert_ml_to_oz.py [input_sql] [output_sql]    # defaults: seed_data_new.sql, in place
+    zcat seed.sql.gz | python convert_ml_to_oz.py - - | psql drinksdb
+    python convert_ml_to_oz.py seed.rir.gz                 # recipe IR, rewritten record by record
 """
 
+import argparse
 import re
 
+import recipe_ir
+from etl_io import message_stream, open_input, open_output
+from quantities import recompute_amount_ml_sql, to_ml
+
 def convert_ml_to_oz(amount_str, unit):
     """Convert ml amount to oz or barspoon."""
     if unit.lower() != 'ml':
@@ -30,15 +40,12 @@ def convert_ml_to_oz(amount_str, unit):
     else:
         return f"{oz_amount:.2f}", 'oz'
 
-def convert_sql_file(input_file, output_file):
-    """Convert ml to oz in SQL INSERT statements."""
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern to match: 'amount', 'ml')
-    # Match: '45', 'ml') or '52.5', 'ml')
-    # The pattern needs to match: quote, number, quote comma space quote, 'ml', closing paren
-    pattern = r"(')(\d+(?:\.\d+)?)('\s*,\s*')('ml')(\))"
+def convert_sql_content(content):
+    """Convert ml to oz in a chunk of SQL INSERT statements."""
+    # Pattern to match: 'amount', 'ml') or 'amount', 'ml', <amount_ml>, <is_approximate>)
+    # Match: '45', 'ml') or '52.5', 'ml', 52.50, FALSE)
+    # The pattern needs to match: quote, number, quote comma space quote, 'ml', closing paren or comma
+    pattern = r"(')(\d+(?:\.\d+)?)('\s*,\s*')('ml')(\)|,)"
     
     def replace_ml(match):
         quote1 = match.group(1)  # Opening quote
@@ -59,7 +66,7 @@ def convert_sql_file(input_file, output_file):
     # Debug: check if any replacements happened
     if ml_before > 0 and "'ml'" in converted_content:
         # Try a different pattern - maybe there are spaces
-        pattern2 = r"('\s*)(\d+(?:\.\d+)?)(\s*',\s*')('ml')(\))"
+        pattern2 = r"('\s*)(\d+(?:\.\d+)?)(\s*',\s*')('ml')(\)|,)"
         converted_content = re.sub(pattern2, lambda m: f"{m.group(1)}{convert_ml_to_oz(m.group(2), 'ml')[0]}{m.group(3)}'{convert_ml_to_oz(m.group(2), 'ml')[1]}'{m.group(5)}", converted_content)
     
     # If still not working, try simpler pattern
@@ -75,25 +82,65 @@ def convert_sql_file(input_file, output_file):
                 return full_match.replace(f"'{amount}'", f"'{new_amount}'").replace("'ml'", f"'{new_unit}'")
             return full_match
         
-        # Match the whole pattern: 'number', 'ml')
-        simple_pattern = r"'\d+(?:\.\d+)?'\s*,\s*'ml'\)"
+        # Match the whole pattern: 'number', 'ml') or 'number', 'ml', (amount_ml is recomputed afterwards)
+        simple_pattern = r"'\d+(?:\.\d+)?'\s*,\s*'ml'[,)]"
         converted_content = re.sub(simple_pattern, replace_simple, converted_content)
     
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(converted_content)
+    return converted_content
+
+def convert_sql_file(input_file, output_file):
+    """Convert ml to oz in SQL INSERT statements, streaming one line at a time."""
+    log = message_stream(output_file)
+    ml_count = oz_count = barspoon_count = 0
+    
+    # Output is written to a temp file and replaces the target only after the input is fully read
+    with open_output(output_file) as fout, open_input(input_file) as fin:
+        for line in fin:
+            # amount_ml follows the rewritten amount text (see quantities.py)
+            converted_line = recompute_amount_ml_sql(convert_sql_content(line)) if "'ml'" in line else line
+            fout.write(converted_line)
+            
+            # Count conversions
+            ml_count += len(re.findall(r"'ml'", line))
+            oz_count += len(re.findall(r"'oz'", converted_line))
+            barspoon_count += len(re.findall(r"'barspoon'", converted_line))
     
-    print(f"✓ Converted {input_file} -> {output_file}")
+    print(f"✓ Converted {input_file} -> {output_file}", file=log)
+    print(f"  - Found {ml_count} ml measurements", file=log)
+    print(f"  - Converted to {oz_count} oz measurements", file=log)
+    print(f"  - Converted {barspoon_count} to barspoon (5ml)", file=log)
+
+def convert_ir_file(input_file, output_file):
+    """Convert ml to oz in the quantity records of a recipe IR stream."""
+    counts = {'ml': 0, 'oz': 0, 'barspoon': 0}
     
-    # Count conversions
-    ml_count = len(re.findall(r"'ml'", content))
-    oz_count = len(re.findall(r"'oz'", converted_content))
-    barspoon_count = len(re.findall(r"'barspoon'", converted_content))
+    def convert_quantity(quantity):
+        if quantity.unit != 'ml' or not re.fullmatch(r"\d+(?:\.\d+)?", quantity.amount or ''):
+            return quantity
+        amount, unit = convert_ml_to_oz(quantity.amount, quantity.unit)
+        counts['ml'] += 1
+        counts[unit] += 1
+        amount_ml, is_approximate = to_ml(amount, unit)
+        return quantity._replace(amount=amount, unit=unit, amount_ml=amount_ml, is_approximate=is_approximate)
     
-    print(f"  - Found {ml_count} ml measurements")
-    print(f"  - Converted to {oz_count} oz measurements")
-    print(f"  - Converted {barspoon_count} to barspoon (5ml)")
+    recipe_ir.rewrite_quantities(input_file, output_file, convert_quantity)
+    
+    log = message_stream(output_file)
+    print(f"✓ Converted {input_file} -> {output_file}", file=log)
+    print(f"  - Found {counts['ml']} ml measurements", file=log)
+    print(f"  - Converted to {counts['oz']} oz measurements", file=log)
+    print(f"  - Converted {counts['barspoon']} to barspoon (5ml)", file=log)
 
 if __name__ == '__main__':
-    convert_sql_file('seed_data_new.sql', 'seed_data_new.sql')
+    parser = argparse.ArgumentParser(description='Convert ml measurements to oz in a seed SQL file')
+    parser.add_argument('input', nargs='?', default='seed_data_new.sql',
+                        help='Input SQL file, optionally compressed, - for stdin (default: seed_data_new.sql)')
+    parser.add_argument('output', nargs='?', help='Output SQL file, - for stdout (default: overwrite input)')
+    parser.add_argument('--ir', action='store_true', help='Input and output are recipe IR (implied by .rir names)')
+    args = parser.parse_args()
+    output = args.output or args.input
+    if args.ir or recipe_ir.is_ir_path(args.input):
+        convert_ir_file(args.input, output)
+    else:
+        convert_sql_file(args.input, output)
 
@@ -7,6 +7,9 @@ Usage:
 
 Or with separate ingredients file:
     python csv_to_sql.py --drinks drinks.csv --ingredients drink_ingredients.csv --ingredient-catalog ingredients.csv --flavors flavor_profiles.csv --output seed_data.sql
+
+Inputs and --output may be compressed (.gz, .bz2, .xz, .zst) or '-' for stdin/stdout:
+    python csv_to_sql.py --drinks drinks.csv.gz --ingredients drink_ingredients.csv.gz --output - | psql drinksdb
 """
 
 import csv
@@ -15,6 +18,11 @@ import sys
 from collections import defaultdict
 from typing import Dict, List, Set, Optional
 
+from etl_io import message_stream, open_input, open_output
+from quantities import to_ml, format_amount_ml_sql, format_bool_sql
+from search_documents import generate_search_documents_sql
+from validate_tables import validate_tables, MERGE_POLICIES
+
 
 def escape_sql_string(s: Optional[str]) -> str:
     """Escape single quotes in SQL strings."""
@@ -26,7 +34,7 @@ def escape_sql_string(s: Optional[str]) -> str:
 def read_csv_file(filename: str) -> List[Dict[str, str]]:
     """Read a CSV file and return a list of dictionaries."""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open_input(filename, newline='') as f:
             reader = csv.DictReader(f)
             return list(reader)
     except FileNotFoundError:
@@ -87,7 +95,7 @@ def generate_drinks_sql(drinks: List[Dict[str, str]]) -> str:
 def generate_drink_ingredients_sql(drink_ingredients: List[Dict[str, str]]) -> str:
     """Generate SQL INSERT statements for drink_ingredients relationships."""
     sql = "-- Insert drink_ingredients relationships\n"
-    sql += "INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit) VALUES\n"
+    sql += "INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate) VALUES\n"
     
     values = []
     for di in drink_ingredients:
@@ -95,11 +103,12 @@ def generate_drink_ingredients_sql(drink_ingredients: List[Dict[str, str]]) -> s
         ingredient_name = escape_sql_string(di.get('ingredient_name', ''))
         amount = escape_sql_string(di.get('amount', ''))
         unit = escape_sql_string(di.get('unit', ''))
+        amount_ml, is_approximate = to_ml(di.get('amount'), di.get('unit'))
         
         values.append(
             f"((SELECT drink_id FROM drinks WHERE name = {drink_name}), "
             f"(SELECT ingredient_id FROM ingredients WHERE name = {ingredient_name}), "
-            f"{amount}, {unit})"
+            f"{amount}, {unit}, {format_amount_ml_sql(amount_ml)}, {format_bool_sql(is_approximate)})"
         )
     
     sql += ",\n".join(values) + ";\n\n"
@@ -147,21 +156,20 @@ def main():
     parser.add_argument('--ingredients', required=True, help='CSV file with drink_ingredients relationships')
     parser.add_argument('--ingredient-catalog', help='Optional CSV file with ingredient catalog (category, subcategory, abv)')
     parser.add_argument('--flavors', help='Optional CSV file with flavor profiles')
-    parser.add_argument('--output', default='seed_data.sql', help='Output SQL file (default: seed_data.sql)')
+    parser.add_argument('--output', default='seed_data.sql',
+                        help='Output SQL file, .gz/.bz2/.xz/.zst to compress, - for stdout (default: seed_data.sql)')
+    parser.add_argument('--aliases', help='Optional CSV file with raw_name,canonical_name ingredient aliases')
+    parser.add_argument('--on-duplicate', choices=MERGE_POLICIES, default='error',
+                        help='What to do when a drink lists the same canonical ingredient twice (default: error)')
+    parser.add_argument('--validate-only', action='store_true', help='Validate the CSV files without writing SQL')
     
     args = parser.parse_args()
+    log = message_stream(args.output)
     
-    # Read CSV files
+    # Read CSV files (any of them may be compressed, or - for stdin)
     drinks = read_csv_file(args.drinks)
     drink_ingredients = read_csv_file(args.ingredients)
     
-    # Collect all unique ingredients from drink_ingredients
-    all_ingredients = set()
-    for di in drink_ingredients:
-        ingredient_name = di.get('ingredient_name', '').strip()
-        if ingredient_name:
-            all_ingredients.add(ingredient_name)
-    
     # Read ingredient catalog if provided
     ingredient_catalog = None
     if args.ingredient_catalog:
@@ -181,27 +189,50 @@ def main():
     if args.flavors:
         flavor_profiles = read_csv_file(args.flavors)
     
-    # Generate SQL
-    sql_output = "-- Sample data insert statements based on Google Sheets data\n"
-    sql_output += "-- Note: Flavor profiles are placeholder estimates and should be refined based on actual tastings\n\n"
-    
-    sql_output += generate_ingredients_sql(all_ingredients, ingredient_catalog)
-    sql_output += generate_drinks_sql(drinks)
-    sql_output += generate_drink_ingredients_sql(drink_ingredients)
+    # Read ingredient aliases if provided
+    aliases = {}
+    if args.aliases:
+        for row in read_csv_file(args.aliases):
+            raw_name = row.get('raw_name', '').strip()
+            canonical_name = row.get('canonical_name', '').strip()
+            if raw_name and canonical_name:
+                aliases[raw_name] = canonical_name
+    
+    # Validate everything before writing any SQL, reporting all problems at once
+    drink_ingredients, report = validate_tables(
+        drinks, drink_ingredients, flavor_profiles, ingredient_catalog, aliases, args.on_duplicate
+    )
+    if report.errors or report.warnings:
+        print(report.format(), file=sys.stderr)
+    if not report.ok:
+        print(f"✗ Validation failed with {len(report.errors)} error(s); no SQL written.", file=sys.stderr)
+        sys.exit(1)
+    if args.validate_only:
+        print(f"✓ Validation passed ({len(drinks)} drinks, {len(drink_ingredients)} drink-ingredient rows)", file=log)
+        return
     
-    if flavor_profiles:
-        sql_output += generate_flavor_profiles_sql(flavor_profiles)
+    # Collect all unique (canonical) ingredients from drink_ingredients
+    all_ingredients = {di['ingredient_name'] for di in drink_ingredients}
     
-    # Write output
-    with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(sql_output)
+    # Generate SQL, streaming each section to the output
+    with open_output(args.output) as f:
+        f.write("-- Sample data insert statements based on Google Sheets data\n")
+        f.write("-- Note: Flavor profiles are placeholder estimates and should be refined based on actual tastings\n\n")
+        
+        f.write(generate_ingredients_sql(all_ingredients, ingredient_catalog))
+        f.write(generate_drinks_sql(drinks))
+        f.write(generate_drink_ingredients_sql(drink_ingredients))
+        f.write(generate_search_documents_sql(drinks, drink_ingredients))
+        
+        if flavor_profiles:
+            f.write(generate_flavor_profiles_sql(flavor_profiles))
     
-    print(f"✓ Generated {args.output}")
-    print(f"  - {len(drinks)} drinks")
-    print(f"  - {len(all_ingredients)} ingredients")
-    print(f"  - {len(drink_ingredients)} drink-ingredient relationships")
+    print(f"✓ Generated {args.output}", file=log)
+    print(f"  - {len(drinks)} drinks", file=log)
+    print(f"  - {len(all_ingredients)} ingredients", file=log)
+    print(f"  - {len(drink_ingredients)} drink-ingredient relationships", file=log)
     if flavor_profiles:
-        print(f"  - {len(flavor_profiles)} flavor profiles")
+        print(f"  - {len(flavor_profiles)} flavor profiles", file=log)
 
 
 if __name__ == '__main__':
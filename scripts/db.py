@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Database connection helper for the Python batch jobs.
+
+Mirrors backend/db.js: reads DrinksDB.env from the project root, then uses
+DATABASE_URL if set, otherwise the individual DB_* parameters.
+"""
+
+import os
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_FILE = os.path.join(PROJECT_ROOT, 'DrinksDB.env')
+
+
+def load_env_file(path: str = ENV_FILE) -> None:
+    """Load KEY=VALUE lines from an env file without overriding existing variables."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+
+
+def get_db_config() -> Dict[str, str]:
+    """Return psycopg2 connection keyword arguments."""
+    load_env_file()
+
+    if os.getenv('DATABASE_URL'):
+        # Use connection string if provided (common for cloud databases like Render)
+        url = os.environ['DATABASE_URL']
+        config = {'dsn': url}
+        if 'render.com' in url:
+            config['sslmode'] = 'require'
+        return config
+
+    host = os.getenv('DB_HOST', 'localhost')
+    config = {
+        'user': os.getenv('DB_USER', 'postgres'),
+        'host': host,
+        'dbname': os.getenv('DB_NAME', 'drinksdb_81xl'),
+        'password': os.getenv('DB_PASSWORD', 'poopbutt'),
+        'port': os.getenv('DB_PORT', '5432'),
+    }
+    if 'render.com' in host:
+        config['sslmode'] = 'require'
+    return config
+
+
+def connect(**overrides):
+    """Open a psycopg2 connection using DrinksDB.env settings (keyword overrides win)."""
+    import psycopg2
+
+    config = get_db_config()
+    config.update(overrides)
+    return psycopg2.connect(**config)
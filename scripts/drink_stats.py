@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Compute per-drink volume, strength and dilution stats and bulk-load them into
+the drink_stats table.
+
+All drinks are computed at once with NumPy segment reductions over the
+drink x ingredient rows (amount_ml, abv), so "show me low-ABV drinks" becomes
+an indexed lookup instead of per-request recipe math.
+
+Usage:
+    python drink_stats.py              # compute from the database and load drink_stats
+    python drink_stats.py --dry-run    # compute and print a summary only
+    python drink_stats.py --benchmark 100000
+"""
+
+import argparse
+import io
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import db
+
+# Water added by ice, as a fraction of the undiluted volume
+DILUTION_BY_METHOD = {
+    'Shaken': 0.28,
+    'Stirred': 0.22,
+    'In Glass': 0.10,
+    'Blended': 0.40,
+}
+DEFAULT_DILUTION = 0.20
+
+# US standard drink: 14 g of ethanol / 0.789 g/ml
+STANDARD_DRINK_ETHANOL_ML = 14.0 / 0.789
+
+STATS_COLUMNS = [
+    'drink_id', 'total_volume_ml', 'ethanol_ml', 'final_volume_ml',
+    'final_abv', 'standard_drinks', 'ingredient_count', 'approximate_count',
+]
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS drink_stats (
+    drink_id INT PRIMARY KEY REFERENCES drinks(drink_id) ON DELETE CASCADE,
+    total_volume_ml NUMERIC(8,2),
+    ethanol_ml NUMERIC(8,2),
+    final_volume_ml NUMERIC(8,2),
+    final_abv NUMERIC(5,2),
+    standard_drinks NUMERIC(5,2),
+    ingredient_count INT,
+    approximate_count INT
+);
+CREATE INDEX IF NOT EXISTS idx_drink_stats_final_abv ON drink_stats(final_abv);
+CREATE INDEX IF NOT EXISTS idx_drink_stats_total_volume ON drink_stats(total_volume_ml);
+"""
+
+
+def dilution_for_methods(build_methods: List[Optional[str]]) -> np.ndarray:
+    """Map each drink's build_method to its dilution fraction."""
+    return np.array(
+        [DILUTION_BY_METHOD.get(method, DEFAULT_DILUTION) for method in build_methods],
+        dtype=np.float64,
+    )
+
+
+def compute_drink_stats(drink_index: np.ndarray, amount_ml: np.ndarray, abv: np.ndarray,
+                        is_approximate: np.ndarray, dilution: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute stats for every drink in one pass.
+
+    drink_index, amount_ml, abv and is_approximate have one entry per drink_ingredients
+    row; drink_index is the dense 0..n_drinks-1 position of that row's drink.
+    dilution has one entry per drink. NaN amounts/abv (unmeasured items, mixers) count as 0.
+    """
+    n_drinks = len(dilution)
+    amount = np.nan_to_num(amount_ml.astype(np.float64, copy=False), nan=0.0)
+    strength = np.nan_to_num(abv.astype(np.float64, copy=False), nan=0.0) / 100.0
+
+    total_volume = np.bincount(drink_index, weights=amount, minlength=n_drinks)
+    ethanol = np.bincount(drink_index, weights=amount * strength, minlength=n_drinks)
+    ingredient_count = np.bincount(drink_index, minlength=n_drinks)
+    approximate_count = np.bincount(drink_index, weights=is_approximate.astype(np.float64), minlength=n_drinks)
+
+    final_volume = total_volume * (1.0 + dilution)
+    final_abv = np.divide(ethanol * 100.0, final_volume, out=np.zeros(n_drinks), where=final_volume > 0)
+
+    return {
+        'total_volume_ml': total_volume,
+        'ethanol_ml': ethanol,
+        'final_volume_ml': final_volume,
+        'final_abv': final_abv,
+        'standard_drinks': ethanol / STANDARD_DRINK_ETHANOL_ML,
+        'ingredient_count': ingredient_count,
+        'approximate_count': approximate_count.astype(np.int64),
+    }
+
+
+def load_recipe_arrays(conn, only_drink_ids: Optional[List[int]] = None
+                       ) -> Tuple[np.ndarray, List[Optional[str]], Dict[str, np.ndarray]]:
+    """Fetch drinks and drink_ingredients rows as arrays aligned for compute_drink_stats (optionally a subset)."""
+    where, params = ('', None) if only_drink_ids is None else (' WHERE drink_id = ANY(%s)', (list(only_drink_ids),))
+    cursor = conn.cursor()
+    cursor.execute(f'SELECT drink_id, build_method FROM drinks{where} ORDER BY drink_id', params)
+    drink_rows = cursor.fetchall()
+    drink_ids = np.array([row[0] for row in drink_rows], dtype=np.int64)
+    build_methods = [row[1] for row in drink_rows]
+
+    cursor.execute(
+        """SELECT di.drink_id, di.amount_ml, di.is_approximate, i.abv
+           FROM drink_ingredients di
+           JOIN ingredients i ON di.ingredient_id = i.ingredient_id""" + where.replace('drink_id', 'di.drink_id'),
+        params,
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+
+    row_drink_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    recipe = {
+        # drink_ids is sorted, so searchsorted gives each row's dense drink position
+        'drink_index': np.searchsorted(drink_ids, row_drink_ids),
+        'amount_ml': np.array([np.nan if row[1] is None else float(row[1]) for row in rows], dtype=np.float64),
+        'is_approximate': np.array([bool(row[2]) for row in rows], dtype=bool),
+        'abv': np.array([np.nan if row[3] is None else float(row[3]) for row in rows], dtype=np.float64),
+    }
+    return drink_ids, build_methods, recipe
+
+
+def format_copy_rows(drink_ids: np.ndarray, stats: Dict[str, np.ndarray]) -> io.StringIO:
+    """Render stats as tab-separated COPY input."""
+    buffer = io.StringIO()
+    columns = [
+        drink_ids,
+        np.round(stats['total_volume_ml'], 2),
+        np.round(stats['ethanol_ml'], 2),
+        np.round(stats['final_volume_ml'], 2),
+        np.round(stats['final_abv'], 2),
+        np.round(stats['standard_drinks'], 2),
+        stats['ingredient_count'],
+        stats['approximate_count'],
+    ]
+    for row in zip(*columns):
+        buffer.write('\t'.join(str(value) for value in row) + '\n')
+    buffer.seek(0)
+    return buffer
+
+
+def write_drink_stats(conn, drink_ids: np.ndarray, stats: Dict[str, np.ndarray]) -> None:
+    """Replace the contents of drink_stats in a single transaction using COPY."""
+    cursor = conn.cursor()
+    cursor.execute(CREATE_TABLE_SQL)
+    cursor.execute('TRUNCATE drink_stats')
+    cursor.copy_expert(
+        f"COPY drink_stats ({', '.join(STATS_COLUMNS)}) FROM STDIN",
+        format_copy_rows(drink_ids, stats),
+    )
+    conn.commit()
+    cursor.close()
+
+
+def replace_drink_stats_rows(conn, drink_ids: np.ndarray, stats: Dict[str, np.ndarray],
+                            stale_drink_ids: List[int]) -> None:
+    """Replace the stats of stale_drink_ids with freshly computed rows, without committing."""
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM drink_stats WHERE drink_id = ANY(%s)', (list(stale_drink_ids),))
+    cursor.copy_expert(
+        f"COPY drink_stats ({', '.join(STATS_COLUMNS)}) FROM STDIN",
+        format_copy_rows(drink_ids, stats),
+    )
+    cursor.close()
+
+
+def run_benchmark(n_drinks: int, ingredients_per_drink: int = 5) -> None:
+    """Time compute_drink_stats on a synthetic catalog."""
+    rng = np.random.default_rng(0)
+    n_rows = n_drinks * ingredients_per_drink
+    drink_index = np.repeat(np.arange(n_drinks), ingredients_per_drink)
+    amount_ml = rng.choice([7.5, 15.0, 22.5, 30.0, 45.0, 60.0], size=n_rows)
+    abv = rng.choice([0.0, 0.0, 17.0, 24.0, 40.0, 43.0], size=n_rows)
+    is_approximate = rng.random(n_rows) < 0.05
+    methods = rng.choice(list(DILUTION_BY_METHOD), size=n_drinks)
+
+    start = time.perf_counter()
+    dilution = dilution_for_methods(list(methods))
+    stats = compute_drink_stats(drink_index, amount_ml, abv, is_approximate, dilution)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Computed stats for {n_drinks} drinks ({n_rows} rows) in {elapsed * 1000:.1f} ms")
+    print(f"  - mean final ABV: {stats['final_abv'].mean():.2f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute per-drink ABV, volume and dilution stats')
+    parser.add_argument('--dry-run', action='store_true', help='Compute and print a summary without writing')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Time the computation on N synthetic drinks')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    conn = db.connect()
+    try:
+        start = time.perf_counter()
+        drink_ids, build_methods, recipe = load_recipe_arrays(conn)
+        stats = compute_drink_stats(
+            recipe['drink_index'], recipe['amount_ml'], recipe['abv'],
+            recipe['is_approximate'], dilution_for_methods(build_methods),
+        )
+        elapsed = time.perf_counter() - start
+
+        if not args.dry_run:
+            write_drink_stats(conn, drink_ids, stats)
+    except Exception as e:
+        print(f"Error computing drink stats: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    print(f"✓ {'Computed' if args.dry_run else 'Loaded'} drink_stats for {len(drink_ids)} drinks in {elapsed * 1000:.1f} ms")
+    if len(drink_ids):
+        print(f"  - mean final ABV: {stats['final_abv'].mean():.2f}%")
+        print(f"  - mean volume: {stats['final_volume_ml'].mean():.1f} ml")
+
+
+if __name__ == '__main__':
+    main()
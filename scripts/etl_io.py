@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Text and binary streams for the ETL scripts, chosen by file extension.
+
+    .gz  -> gzip      .bz2 -> bz2      .xz / .lzma -> lzma
+    .zst / .zstd -> zstandard (optional: pip install zstandard)
+    '-'  -> stdin / stdout (uncompressed)
+    anything else -> plain text
+
+Outputs are written to a temporary file next to the target and moved into
+place when the block finishes, so a failed run never leaves a truncated file
+and a script can safely overwrite its own input (the post-processors'
+default). Example:
+
+    python csv_to_sql.py --drinks drinks.csv.gz --ingredients di.csv.gz --output - | psql drinksdb
+"""
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import sys
+from typing import IO, Iterator
+
+STDIO_PATH = '-'
+
+
+def _zstd_open(path: str, mode: str):
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(f"'{path}' is zstd-compressed; install zstandard (pip install zstandard) to read it")
+    return zstandard.open(path, mode)
+
+
+# Extension -> opener(path, binary mode)
+COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+    '.zst': _zstd_open,
+    '.zstd': _zstd_open,
+}
+
+
+def _binary_opener(path: str):
+    return COMPRESSED_OPENERS.get(os.path.splitext(path)[1].lower(), open)
+
+
+def is_stdio(path: str) -> bool:
+    return path == STDIO_PATH
+
+
+def message_stream(output_path: str) -> IO[str]:
+    """Where a script should print progress: stderr when its output is going to stdout."""
+    return sys.stderr if is_stdio(output_path) else sys.stdout
+
+
+@contextlib.contextmanager
+def open_binary_input(path: str) -> Iterator[IO[bytes]]:
+    """Open path (or stdin for '-') for reading bytes, decompressing by extension."""
+    if is_stdio(path):
+        yield sys.stdin.buffer
+        return
+    with _binary_opener(path)(path, 'rb') as f:
+        yield f
+
+
+@contextlib.contextmanager
+def open_binary_output(path: str) -> Iterator[IO[bytes]]:
+    """Open path (or stdout for '-') for writing bytes, compressing by extension, replaced atomically on success."""
+    if is_stdio(path):
+        try:
+            yield sys.stdout.buffer
+        finally:
+            sys.stdout.buffer.flush()
+        return
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with _binary_opener(path)(tmp_path, 'wb') as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def open_input(path: str, encoding: str = 'utf-8', newline: str = None) -> Iterator[IO[str]]:
+    """Open path (or stdin for '-') for reading text, decompressing by extension."""
+    with open_binary_input(path) as raw:
+        stream = io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+        try:
+            yield stream
+        finally:
+            stream.detach()
+
+
+@contextlib.contextmanager
+def open_output(path: str, encoding: str = 'utf-8', newline: str = None) -> Iterator[IO[str]]:
+    """Open path (or stdout for '-') for writing text, compressing by extension, replaced atomically on success."""
+    with open_binary_output(path) as raw:
+        stream = io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+        try:
+            yield stream
+        finally:
+            stream.flush()
+            stream.detach()
@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
-"""Simple script to fix oz measurements"""
+"""Simple script to fix oz measurements
 
+Usage: python fix_oz_simple.py [input_sql] [output_sql]  (default: ../database/seed_data_new.sql, in place)
+       python fix_oz_simple.py seed.rir.gz                (recipe IR, rewritten record by record)
+"""
+
+import argparse
 import re
 
+import recipe_ir
+from etl_io import message_stream, open_input, open_output
+from quantities import recompute_amount_ml_sql, to_ml
+
 # Conversion map based on user's reference
 conversions = {
     '1.67': '1 1/2',  # 50ml -> 45ml (1.5oz)
@@ -14,10 +23,7 @@ conversions = {
     '0.17': '1/6',    # 5ml = 0.17oz (1 tsp)
 }
 
-def fix_oz_file(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def fix_oz_content(content):
     # First, fix any incorrectly added parentheses: ('value', 'oz') -> 'value', 'oz')
     content = re.sub(r"\('([^']+)', 'oz'\)", r"'\1', 'oz')", content)
     
@@ -28,11 +34,38 @@ def fix_oz_file(input_file, output_file):
         replacement = f"'{standard}', 'oz'"
         content = re.sub(pattern, replacement, content)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return content
+
+def fix_oz_file(input_file, output_file):
+    # Stream line by line; the output replaces the target only after the input is fully read
+    with open_output(output_file) as fout, open_input(input_file) as fin:
+        for line in fin:
+            # amount_ml follows the rewritten amount text (see quantities.py)
+            fout.write(recompute_amount_ml_sql(fix_oz_content(line)) if "'oz'" in line else line)
+    
+    print(f"✓ Fixed oz measurements in {output_file}", file=message_stream(output_file))
+
+def fix_oz_ir_file(input_file, output_file):
+    def fix_quantity(quantity):
+        if quantity.unit == 'oz' and quantity.amount in conversions:
+            amount = conversions[quantity.amount]
+            amount_ml, is_approximate = to_ml(amount, quantity.unit)
+            return quantity._replace(amount=amount, amount_ml=amount_ml, is_approximate=is_approximate)
+        return quantity
     
-    print(f"✓ Fixed oz measurements in {output_file}")
+    recipe_ir.rewrite_quantities(input_file, output_file, fix_quantity)
+    print(f"✓ Fixed oz measurements in {output_file}", file=message_stream(output_file))
 
 if __name__ == '__main__':
-    fix_oz_file('../database/seed_data_new.sql', '../database/seed_data_new.sql')
+    parser = argparse.ArgumentParser(description='Replace decimal oz values with standard measurements')
+    parser.add_argument('input', nargs='?', default='../database/seed_data_new.sql',
+                        help='Input SQL file, optionally compressed, - for stdin')
+    parser.add_argument('output', nargs='?', help='Output SQL file, - for stdout (default: overwrite input)')
+    parser.add_argument('--ir', action='store_true', help='Input and output are recipe IR (implied by .rir names)')
+    args = parser.parse_args()
+    output = args.output or args.input
+    if args.ir or recipe_ir.is_ir_path(args.input):
+        fix_oz_ir_file(args.input, output)
+    else:
+        fix_oz_file(args.input, output)
 
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
-"""Fix double parentheses in SQL file"""
+"""Fix double parentheses in SQL file
 
+Usage: python fix_parentheses.py [input_sql] [output_sql]  (default: database/seed_data_new.sql, in place)
+"""
+
+import argparse
+import os
 import re
 
-def fix_parentheses(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+from etl_io import message_stream, open_input, open_output
+
+def fix_parentheses_content(content):
     # Fix double closing parentheses: 'value', 'oz')) -> 'value', 'oz')
     # This pattern matches: ), 'value', 'oz')) and replaces with ), 'value', 'oz')
     pattern = r"('oz')(\)\))"
@@ -19,20 +23,28 @@ def fix_parentheses(input_file, output_file):
     replacement2 = r"\1)"
     content = re.sub(pattern2, replacement2, content)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return content
+
+def fix_parentheses(input_file, output_file):
+    log = message_stream(output_file)
     
-    print(f"✓ Fixed double parentheses in {output_file}")
+    # Stream line by line; the output replaces the target only after the input is fully read
+    with open_output(output_file) as fout, open_input(input_file) as fin:
+        for line in fin:
+            fout.write(fix_parentheses_content(line) if '))' in line else line)
     
-    # Count how many were fixed
-    double_parens_before = len(re.findall(r"'oz'\)\)", content))
-    print(f"  - Removed double closing parentheses")
+    print(f"✓ Fixed double parentheses in {output_file}", file=log)
+    print(f"  - Removed double closing parentheses", file=log)
 
 if __name__ == '__main__':
-    import os
     # Get the script directory and go up one level
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
     sql_file = os.path.join(project_root, 'database', 'seed_data_new.sql')
-    fix_parentheses(sql_file, sql_file)
+    
+    parser = argparse.ArgumentParser(description='Fix double closing parentheses in a seed SQL file')
+    parser.add_argument('input', nargs='?', default=sql_file, help='Input SQL file, optionally compressed, - for stdin')
+    parser.add_argument('output', nargs='?', help='Output SQL file, - for stdout (default: overwrite input)')
+    args = parser.parse_args()
+    fix_parentheses(args.input, args.output or args.input)
 
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Generate UPDATE statements that backfill drink_ingredients.amount_ml and
+is_approximate for databases loaded from a seed file written before those
+columns existed.
+
+Usage: python generate_amount_ml_updates.py [seed_sql] [output_sql]  (either may be compressed or -)
+"""
+
+import os
+import re
+import sys
+
+from etl_io import message_stream, open_input, open_output
+from quantities import to_ml, format_amount_ml_sql, format_bool_sql
+
+seed_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join('..', 'database', 'seed_data_new.sql')
+sql_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join('..', 'database', 'update_amount_ml.sql')
+
+# Matches one drink_ingredients row: ((SELECT ... name = 'drink'), (SELECT ... name = 'ingredient'), 'amount', 'unit'
+row_pattern = re.compile(
+    r"\(\(SELECT drink_id FROM drinks WHERE name = '((?:[^']|'')*)'\), "
+    r"\(SELECT ingredient_id FROM ingredients WHERE name = '((?:[^']|'')*)'\), "
+    r"'((?:[^']|'')*)', '((?:[^']|'')*)'"
+)
+
+with open_input(seed_path) as f:
+    content = f.read()
+
+updates = []
+skipped = 0
+for drink_name, ingredient_name, amount, unit in row_pattern.findall(content):
+    amount_ml, is_approximate = to_ml(amount.replace("''", "'"), unit.replace("''", "'"))
+    if amount_ml is None and not is_approximate:
+        skipped += 1
+        continue
+
+    # Names are still SQL-escaped from the seed file, so they can be reused as-is
+    update_stmt = (
+        f"UPDATE drink_ingredients di SET amount_ml = {format_amount_ml_sql(amount_ml)}, "
+        f"is_approximate = {format_bool_sql(is_approximate)} "
+        f"FROM drinks d, ingredients i "
+        f"WHERE di.drink_id = d.drink_id AND di.ingredient_id = i.ingredient_id "
+        f"AND d.name = '{drink_name}' AND i.name = '{ingredient_name}';"
+    )
+    updates.append(update_stmt)
+
+# Write to SQL file
+with open_output(sql_path) as f:
+    f.write("-- UPDATE statements to backfill amount_ml / is_approximate on existing drink_ingredients\n")
+    f.write("-- Generated from seed_data_new.sql by scripts/generate_amount_ml_updates.py\n\n")
+    f.write("ALTER TABLE drink_ingredients ADD COLUMN IF NOT EXISTS amount_ml NUMERIC(8,2);\n")
+    f.write("ALTER TABLE drink_ingredients ADD COLUMN IF NOT EXISTS is_approximate BOOLEAN NOT NULL DEFAULT FALSE;\n")
+    f.write("CREATE INDEX IF NOT EXISTS idx_drink_ingredients_amount_ml ON drink_ingredients(amount_ml);\n\n")
+    for update in updates:
+        f.write(update + '\n')
+
+    f.write(f"\n-- Total updates: {len(updates)}\n")
+
+print(f"Generated {len(updates)} UPDATE statements in {sql_path}", file=message_stream(sql_path))
+print(f"  - {skipped} rows without a volume (pcs, wheel, ...) left as NULL", file=message_stream(sql_path))
@@ -1,11 +1,14 @@
 import csv
 import os
+import sys
 
-# Read the CSV file
-csv_path = os.path.join('..', 'database', 'cocktails_data (1).csv')
-sql_path = os.path.join('..', 'database', 'update_garnishes.sql')
+from etl_io import message_stream, open_input, open_output
 
-with open(csv_path, 'r', encoding='utf-8') as f:
+# Read the CSV file (paths may be overridden, compressed, or - for stdin/stdout)
+csv_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join('..', 'database', 'cocktails_data (1).csv')
+sql_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join('..', 'database', 'update_garnishes.sql')
+
+with open_input(csv_path, newline='') as f:
     reader = csv.DictReader(f)
     
     updates = []
@@ -41,7 +44,7 @@ with open(csv_path, 'r', encoding='utf-8') as f:
         updates.append(update_stmt)
 
 # Write to SQL file
-with open(sql_path, 'w', encoding='utf-8') as f:
+with open_output(sql_path) as f:
     f.write("-- UPDATE statements to add garnishes to existing drinks\n")
     f.write("-- Generated from cocktails_data (1).csv\n\n")
     for update in updates:
@@ -49,5 +52,5 @@ with open(sql_path, 'w', encoding='utf-8') as f:
     
     f.write(f"\n-- Total updates: {len(updates)}\n")
 
-print(f"Generated {len(updates)} UPDATE statements in {sql_path}")
+print(f"Generated {len(updates)} UPDATE statements in {sql_path}", file=message_stream(sql_path))
 
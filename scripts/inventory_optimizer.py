@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Pick the N bottles that unlock the most drinks.
+
+Each drink is a bitset of the requirements it needs (one bit per ingredient, or
+per subcategory with --substitutes, so any bottle of that subcategory will do).
+A greedy pass buys one requirement at a time. The next buy is the one with the
+best score per cost, where a drink contributes weight / missing to each
+requirement it still lacks. A drink one bottle away contributes its full
+weight, so completions are preferred while partial progress still breaks
+ties. Buying a requirement only updates the drinks that use it, found through
+an inverted index, so each step stays cheap on large catalogs.
+
+Usage:
+    python inventory_optimizer.py --bottles 12
+    python inventory_optimizer.py --bottles 20 --substitutes --menu game_night_menu --menu-weight 5
+    python inventory_optimizer.py --budget 300 --costs costs.csv --owned "Gin,Campari" --must-have "Sweet Vermouth"
+    python inventory_optimizer.py --benchmark 20000
+
+costs.csv has columns ingredient_name,cost; popularity.csv has drink_name,weight.
+"""
+
+import argparse
+import csv
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+import db
+from shopping_list import MENU_TABLES
+
+RECIPES_QUERY = """
+    SELECT d.drink_id, d.name, i.ingredient_id, i.name, i.subcategory
+    FROM drinks d
+    JOIN drink_ingredients di ON d.drink_id = di.drink_id
+    JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+    ORDER BY d.drink_id
+"""
+
+MENU_DRINKS_QUERY = """
+    SELECT DISTINCT d.drink_id
+    FROM {menu} m
+    JOIN drinks d ON m.drink_id = d.drink_id
+"""
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits in mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def requirement_key(bottle: Dict, substitutes: bool) -> tuple:
+    """What a bottle satisfies: its subcategory when substitutes are allowed, else itself."""
+    subcategory = (bottle.get('subcategory') or '').strip().lower()
+    if substitutes and subcategory:
+        return ('subcategory', subcategory)
+    return ('ingredient', bottle['ingredient_id'])
+
+
+def optimize_inventory(drinks: List[Dict], bottles: List[Dict], max_bottles: Optional[int] = None,
+                       budget: Optional[float] = None, costs: Optional[Dict[int, float]] = None,
+                       must_have: Iterable[int] = (), owned: Iterable[int] = (),
+                       substitutes: bool = False) -> Dict:
+    """
+    Greedy purchase plan.
+
+    drinks are {'drink_id', 'name', 'ingredient_ids', 'weight'}; bottles are
+    {'ingredient_id', 'name', 'subcategory', 'uses'}. costs maps ingredient_id -> price
+    (default 1 per bottle). must_have bottles are bought first in the given order; owned
+    bottles are free and already on the shelf. Returns {'steps', 'baseline', 'makeable', ...}.
+    Raises ValueError when the must_have bottles alone cost more than budget.
+    """
+    costs = costs or {}
+
+    # Requirement index; each requirement is bought through its cheapest (then most used) bottle
+    requirement_index = {}
+    requirement_of = {}
+    best_bottle = []
+    for bottle in bottles:
+        r = requirement_index.setdefault(requirement_key(bottle, substitutes), len(requirement_index))
+        requirement_of[bottle['ingredient_id']] = r
+        if r == len(best_bottle):
+            best_bottle.append(bottle)
+        else:
+            current = best_bottle[r]
+            if (costs.get(bottle['ingredient_id'], 1.0), -bottle.get('uses', 0)) < \
+                    (costs.get(current['ingredient_id'], 1.0), -current.get('uses', 0)):
+                best_bottle[r] = bottle
+    n_requirements = len(best_bottle)
+    cost = np.array([costs.get(bottle['ingredient_id'], 1.0) for bottle in best_bottle], dtype=np.float64)
+
+    masks = []
+    weights = np.array([drink.get('weight', 1.0) for drink in drinks], dtype=np.float64)
+    inverted = [[] for _ in range(n_requirements)]
+    for d, drink in enumerate(drinks):
+        mask = 0
+        for ingredient_id in drink['ingredient_ids']:
+            mask |= 1 << requirement_of[ingredient_id]
+        masks.append(mask)
+        for r in iter_bits(mask):
+            inverted[r].append(d)
+
+    have = 0
+    for ingredient_id in owned:
+        have |= 1 << requirement_of[ingredient_id]
+    is_owned = np.zeros(n_requirements, dtype=bool)
+    is_owned[list(iter_bits(have))] = True
+    missing = [(mask & ~have).bit_count() for mask in masks]
+    baseline = [d for d, m in enumerate(missing) if m == 0]
+    makeable = len(baseline)
+    weight_covered = float(weights[baseline].sum())
+
+    gain = np.zeros(n_requirements, dtype=np.float64)
+    for d, mask in enumerate(masks):
+        if missing[d]:
+            for r in iter_bits(mask & ~have):
+                gain[r] += weights[d] / missing[d]
+
+    def buy(r: int) -> List[int]:
+        """Mark requirement r as owned and update missing counts and gains of the drinks using it."""
+        nonlocal have
+        have |= 1 << r
+        is_owned[r] = True
+        completed = []
+        for d in inverted[r]:
+            m = missing[d]
+            if m == 0:
+                continue
+            missing[d] = m - 1
+            if m == 1:
+                completed.append(d)
+                continue
+            delta = weights[d] / (m - 1) - weights[d] / m
+            for other in iter_bits(masks[d] & ~have):
+                gain[other] += delta
+        gain[r] = 0.0
+        return completed
+
+    forced = list(dict.fromkeys(requirement_of[ingredient_id] for ingredient_id in must_have))
+    forced_cost = float(sum(cost[r] for r in forced if not is_owned[r]))
+    if budget is not None and forced_cost > budget + 1e-9:
+        names = ', '.join(best_bottle[r]['name'] for r in forced if not is_owned[r])
+        raise ValueError(f"must-have bottles ({names}) cost {forced_cost:.2f}, over the budget of {budget:.2f}")
+
+    steps = []
+    spent = 0.0
+    while max_bottles is None or len(steps) < max_bottles:
+        forced = [r for r in forced if not is_owned[r]]
+        if forced:
+            r = forced[0]
+            reason = 'must-have'
+        else:
+            affordable = ~is_owned if budget is None else ~is_owned & (cost <= budget - spent + 1e-9)
+            score = np.where(affordable, gain / np.maximum(cost, 1e-9), 0.0)
+            if n_requirements == 0 or score.max() <= 0:
+                break
+            r = int(np.argmax(score))
+            reason = 'greedy'
+        if budget is not None and spent + cost[r] > budget + 1e-9:
+            break
+        spent += cost[r]
+        completed = buy(r)
+        makeable += len(completed)
+        weight_covered += float(weights[completed].sum())
+        bottle = best_bottle[r]
+        steps.append({
+            'rank': len(steps) + 1,
+            'ingredient_id': bottle['ingredient_id'],
+            'ingredient': bottle['name'],
+            'covers': f"any {bottle['subcategory']}" if requirement_key(bottle, substitutes)[0] == 'subcategory'
+            else bottle['name'],
+            'cost': float(cost[r]),
+            'reason': reason,
+            'unlocks': [drinks[d]['name'] for d in completed],
+            'makeable': makeable,
+            'weight_covered': weight_covered,
+        })
+
+    return {
+        'steps': steps,
+        'baseline': [drinks[d]['name'] for d in baseline],
+        'makeable': [drinks[d]['name'] for d, m in enumerate(missing) if m == 0],
+        'total_drinks': len(drinks),
+        'spent': spent,
+    }
+
+
+def fetch_catalog(conn, menu: Optional[str] = None):
+    """Return (drinks, bottles, menu drink_ids) from the database."""
+    if menu and menu not in MENU_TABLES:
+        raise ValueError(f"unknown menu table '{menu}'")
+    cursor = conn.cursor()
+    cursor.execute(RECIPES_QUERY)
+    drinks = {}
+    bottles = {}
+    for drink_id, drink_name, ingredient_id, ingredient_name, subcategory in cursor.fetchall():
+        drink = drinks.setdefault(drink_id, {'drink_id': drink_id, 'name': drink_name, 'ingredient_ids': [],
+                                             'weight': 1.0})
+        drink['ingredient_ids'].append(ingredient_id)
+        bottle = bottles.setdefault(ingredient_id, {'ingredient_id': ingredient_id, 'name': ingredient_name,
+                                                    'subcategory': subcategory, 'uses': 0})
+        bottle['uses'] += 1
+    menu_ids = set()
+    if menu:
+        cursor.execute(MENU_DRINKS_QUERY.format(menu=menu))
+        menu_ids = {row[0] for row in cursor.fetchall()}
+    cursor.close()
+    return list(drinks.values()), list(bottles.values()), menu_ids
+
+
+def read_name_values(filename: str, name_field: str, value_field: str) -> Dict[str, float]:
+    """Read a two-column CSV into a lowercase name -> float map."""
+    values = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                name = (row.get(name_field) or '').strip()
+                if name:
+                    values[name.lower()] = float(row.get(value_field) or 0)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error reading '{filename}': {e}", file=sys.stderr)
+        sys.exit(1)
+    return values
+
+
+def resolve_bottle_names(names: str, bottles: List[Dict]) -> List[int]:
+    """Turn a comma-separated list of ingredient names into ingredient_ids, exiting on unknown names."""
+    ids_by_name = {bottle['name'].lower(): bottle['ingredient_id'] for bottle in bottles}
+    ids = []
+    for name in (part.strip() for part in (names or '').split(',')):
+        if not name:
+            continue
+        if name.lower() not in ids_by_name:
+            print(f"Error: ingredient '{name}' is not used by any drink.", file=sys.stderr)
+            sys.exit(1)
+        ids.append(ids_by_name[name.lower()])
+    return ids
+
+
+def synthetic_catalog(n_drinks: int, n_ingredients: int, seed: int = 0):
+    """Random catalog with Zipf-like ingredient popularity, for --benchmark."""
+    rng = np.random.default_rng(seed)
+    popularity = 1.0 / np.arange(1, n_ingredients + 1)
+    popularity /= popularity.sum()
+    bottles = [{'ingredient_id': i, 'name': f"Ingredient {i}", 'subcategory': f"Sub {i % (n_ingredients // 8 or 1)}",
+                'uses': 0} for i in range(n_ingredients)]
+    drinks = []
+    for d in range(n_drinks):
+        size = int(rng.integers(2, 7))
+        ingredient_ids = rng.choice(n_ingredients, size=size, replace=False, p=popularity).tolist()
+        drinks.append({'drink_id': d, 'name': f"Drink {d}", 'ingredient_ids': ingredient_ids, 'weight': 1.0})
+    return drinks, bottles
+
+
+def run_benchmark(n_drinks: int, n_ingredients: int, max_bottles: int) -> None:
+    drinks, bottles = synthetic_catalog(n_drinks, n_ingredients)
+    for substitutes in (False, True):
+        start = time.perf_counter()
+        plan = optimize_inventory(drinks, bottles, max_bottles=max_bottles, substitutes=substitutes)
+        elapsed = time.perf_counter() - start
+        print(f"✓ {n_drinks} drinks x {n_ingredients} ingredients, {len(plan['steps'])} bottles"
+              f"{' (substitutes)' if substitutes else ''}: {len(plan['makeable'])} makeable in {elapsed * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Choose the bottles that unlock the most drinks')
+    parser.add_argument('--bottles', type=int, help='Maximum bottles to buy (default: until nothing improves)')
+    parser.add_argument('--budget', type=float, help='Maximum total cost (uses --costs, default 1 per bottle)')
+    parser.add_argument('--costs', help='CSV file with ingredient_name,cost')
+    parser.add_argument('--popularity', help='CSV file with drink_name,weight')
+    parser.add_argument('--menu', choices=sorted(MENU_TABLES), help='Weight (or restrict to) drinks on this menu')
+    parser.add_argument('--menu-weight', type=float, default=3.0, help='Weight multiplier for menu drinks (default: 3)')
+    parser.add_argument('--menu-only', action='store_true', help='Only count drinks on --menu')
+    parser.add_argument('--must-have', help='Comma-separated bottles to buy first')
+    parser.add_argument('--owned', help='Comma-separated bottles already on the shelf')
+    parser.add_argument('--substitutes', action='store_true',
+                        help='Any bottle of the same subcategory satisfies a recipe')
+    parser.add_argument('--output', help='Optional CSV file to write the purchase plan to')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Time the optimizer on N synthetic drinks')
+    parser.add_argument('--benchmark-ingredients', type=int, default=5000,
+                        help='Ingredients in the --benchmark catalog (default: 5000)')
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, args.benchmark_ingredients, args.bottles or 50)
+        return
+    if args.menu_only and not args.menu:
+        parser.error('--menu-only requires --menu')
+
+    conn = db.connect()
+    try:
+        drinks, bottles, menu_ids = fetch_catalog(conn, args.menu)
+    finally:
+        conn.close()
+
+    popularity = read_name_values(args.popularity, 'drink_name', 'weight') if args.popularity else {}
+    for drink in drinks:
+        drink['weight'] = popularity.get(drink['name'].lower(), 1.0)
+        if drink['drink_id'] in menu_ids:
+            drink['weight'] *= args.menu_weight
+    if args.menu_only:
+        drinks = [drink for drink in drinks if drink['drink_id'] in menu_ids]
+
+    costs = {}
+    if args.costs:
+        cost_by_name = read_name_values(args.costs, 'ingredient_name', 'cost')
+        costs = {bottle['ingredient_id']: cost_by_name[bottle['name'].lower()]
+                 for bottle in bottles if bottle['name'].lower() in cost_by_name}
+
+    start = time.perf_counter()
+    try:
+        plan = optimize_inventory(
+            drinks, bottles, max_bottles=args.bottles, budget=args.budget, costs=costs,
+            must_have=resolve_bottle_names(args.must_have, bottles), owned=resolve_bottle_names(args.owned, bottles),
+            substitutes=args.substitutes,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Purchase plan ({elapsed * 1000:.1f} ms)")
+    print(f"  - {len(plan['baseline'])} of {plan['total_drinks']} drinks makeable with owned bottles")
+    for step in plan['steps']:
+        unlocked = ', '.join(step['unlocks'][:5]) + (' ...' if len(step['unlocks']) > 5 else '')
+        print(f"  {step['rank']:>3}. {step['ingredient']:<35} {step['cost']:>8.2f}  "
+              f"{step['makeable']:>5} makeable  +{len(step['unlocks'])} {unlocked}")
+    print(f"  - {len(plan['makeable'])} of {plan['total_drinks']} drinks makeable, spent {plan['spent']:.2f}")
+
+    if args.output:
+        fields = ['rank', 'ingredient_id', 'ingredient', 'covers', 'cost', 'reason', 'makeable', 'weight_covered',
+                  'unlocks']
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for step in plan['steps']:
+                writer.writerow(dict(step, unlocks='; '.join(step['unlocks'])))
+        print(f"✓ Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
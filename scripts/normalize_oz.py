@@ -2,10 +2,19 @@
 """
 Normalize oz measurements to standard cocktail measurements.
 Converts decimal oz values to common cocktail measurements.
+
+Usage:
+    python normalize_oz.py [input_sql] [output_sql]    # defaults: ../database/seed_data_new.sql, in place
+    python normalize_oz.py seed.rir.gz                  # recipe IR, rewritten record by record
 """
 
+import argparse
 import re
 
+import recipe_ir
+from etl_io import message_stream, open_input, open_output
+from quantities import recompute_amount_ml_sql, to_ml
+
 # Standard cocktail measurements in oz (based on user's reference)
 # Key: decimal value, Value: display string
 STANDARD_MEASUREMENTS = {
@@ -57,14 +66,11 @@ def find_closest_standard(value):
     # If still no match, round to closest standard
     return STANDARD_MEASUREMENTS[closest]
 
-def normalize_sql_file(input_file, output_file):
-    """Normalize oz measurements in SQL INSERT statements."""
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern to match: 'amount', 'oz')
-    # Match: '1.67', 'oz') or '0.50', 'oz')
-    pattern = r"(')(\d+(?:\.\d+)?)('\s*,\s*')('oz')(\))"
+def normalize_sql_content(content):
+    """Normalize oz measurements in a chunk of SQL INSERT statements."""
+    # Pattern to match: 'amount', 'oz') or 'amount', 'oz', <amount_ml>, <is_approximate>)
+    # Match: '1.67', 'oz') or '0.50', 'oz', 15.00, FALSE)
+    pattern = r"(')(\d+(?:\.\d+)?)('\s*,\s*')('oz')(\)|,)"
     
     def replace_oz(match):
         quote1 = match.group(1)
@@ -78,21 +84,61 @@ def normalize_sql_file(input_file, output_file):
         return f"{quote1}{normalized_amount}{quote_comma}'{unit_quote}'{closing_paren}"
     
     # Replace all oz measurements
-    converted_content = re.sub(pattern, replace_oz, content)
+    return re.sub(pattern, replace_oz, content)
+
+def normalize_sql_file(input_file, output_file):
+    """Normalize oz measurements in SQL INSERT statements, streaming one line at a time."""
+    log = message_stream(output_file)
+    oz_before = 0
     
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(converted_content)
+    # Output is written to a temp file and replaces the target only after the input is fully read
+    with open_output(output_file) as fout, open_input(input_file) as fin:
+        for line in fin:
+            # amount_ml follows the rewritten amount text (see quantities.py)
+            fout.write(recompute_amount_ml_sql(normalize_sql_content(line)) if "'oz'" in line else line)
+            
+            # Count changes
+            oz_before += len(re.findall(r"'oz'", line))
+    
+    print(f"✓ Normalized {input_file} -> {output_file}", file=log)
+    print(f"  - Found {oz_before} oz measurements", file=log)
+    print(f"  - Normalized to standard cocktail measurements", file=log)
+
+def normalize_ir_file(input_file, output_file):
+    """Normalize oz amounts in the quantity records of a recipe IR stream."""
+    counts = {'oz': 0, 'changed': 0}
     
-    print(f"✓ Normalized {input_file} -> {output_file}")
+    def normalize_quantity(quantity):
+        if quantity.unit != 'oz' or not re.fullmatch(r"\d+(?:\.\d+)?", quantity.amount or ''):
+            return quantity
+        counts['oz'] += 1
+        # find_closest_standard clamps larger pours to the biggest standard measure; leave them as written
+        if float(quantity.amount) > max(STANDARD_MEASUREMENTS) + TOLERANCE:
+            return quantity
+        normalized_amount = find_closest_standard(quantity.amount)
+        if normalized_amount == quantity.amount:
+            return quantity
+        counts['changed'] += 1
+        amount_ml, is_approximate = to_ml(normalized_amount, quantity.unit)
+        return quantity._replace(amount=normalized_amount, amount_ml=amount_ml, is_approximate=is_approximate)
     
-    # Count changes
-    oz_before = len(re.findall(r"'oz'", content))
-    oz_after = len(re.findall(r"'oz'", converted_content))
+    recipe_ir.rewrite_quantities(input_file, output_file, normalize_quantity)
     
-    print(f"  - Found {oz_before} oz measurements")
-    print(f"  - Normalized to standard cocktail measurements")
+    log = message_stream(output_file)
+    print(f"✓ Normalized {input_file} -> {output_file}", file=log)
+    print(f"  - Found {counts['oz']} numeric oz measurements", file=log)
+    print(f"  - Normalized {counts['changed']} to standard cocktail measurements", file=log)
 
 if __name__ == '__main__':
-    normalize_sql_file('../database/seed_data_new.sql', '../database/seed_data_new.sql')
+    parser = argparse.ArgumentParser(description='Normalize oz measurements in a seed SQL file')
+    parser.add_argument('input', nargs='?', default='../database/seed_data_new.sql',
+                        help='Input SQL file, optionally compressed, - for stdin (default: ../database/seed_data_new.sql)')
+    parser.add_argument('output', nargs='?', help='Output SQL file, - for stdout (default: overwrite input)')
+    parser.add_argument('--ir', action='store_true', help='Input and output are recipe IR (implied by .rir names)')
+    args = parser.parse_args()
+    output = args.output or args.input
+    if args.ir or recipe_ir.is_ir_path(args.input):
+        normalize_ir_file(args.input, output)
+    else:
+        normalize_sql_file(args.input, output)
 
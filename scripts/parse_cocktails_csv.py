@@ -7,14 +7,25 @@ The CSV format:
 - ingredients: Semicolon-separated list like "30 ml White Rum; 30 ml Cognac"
 - preparation: Instructions text
 - url: Recipe URL
+
+Input and output may be compressed (.gz, .bz2, .xz, .zst) or '-' for stdin/stdout:
+    python parse_cocktails_csv.py cocktails_data.csv.gz - | psql drinksdb
+
+An output ending in .rir (or --ir) gets the binary recipe IR instead; see recipe_ir.py.
 """
 
+import argparse
 import csv
 import re
 import sys
 from collections import defaultdict
 from typing import Dict, List, Set, Tuple, Optional
 
+import recipe_ir
+from etl_io import message_stream, open_binary_output, open_input, open_output
+from quantities import to_ml, format_amount_ml_sql, format_bool_sql
+from search_documents import generate_search_documents_sql
+
 
 def escape_sql_string(s: Optional[str]) -> str:
     """Escape single quotes in SQL strings."""
@@ -268,7 +279,7 @@ def extract_garnish(preparation: str) -> str:
 def read_csv_file(filename: str) -> List[Dict[str, str]]:
     """Read a CSV file and return a list of dictionaries."""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open_input(filename, newline='') as f:
             reader = csv.DictReader(f)
             return list(reader)
     except FileNotFoundError:
@@ -301,7 +312,7 @@ def generate_drinks_sql(drinks: List[Dict]) -> str:
     values = []
     for drink in drinks:
         name = escape_sql_string(drink['name'])
-        description = escape_sql_string(drink.get('description', drink.get('preparation', ''))[:200])  # Limit description length
+        description = escape_sql_string((drink.get('description') or drink.get('preparation') or '')[:200])  # Limit description length
         glass_type = escape_sql_string(drink.get('glass_type', 'NULL'))
         build_method = escape_sql_string(drink.get('build_method', 'NULL'))
         garnish = escape_sql_string(drink.get('garnish', 'NULL'))
@@ -315,7 +326,7 @@ def generate_drinks_sql(drinks: List[Dict]) -> str:
 def generate_drink_ingredients_sql(drink_ingredients: List[Dict]) -> str:
     """Generate SQL INSERT statements for drink_ingredients relationships."""
     sql = "-- Insert drink_ingredients relationships\n"
-    sql += "INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit) VALUES\n"
+    sql += "INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate) VALUES\n"
     
     values = []
     for di in drink_ingredients:
@@ -323,30 +334,51 @@ def generate_drink_ingredients_sql(drink_ingredients: List[Dict]) -> str:
         ingredient_name = escape_sql_string(di['ingredient_name'])
         amount = escape_sql_string(di['amount'])
         unit = escape_sql_string(di['unit'])
+        if 'amount_ml' in di:  # Already computed upstream (recipe IR quantities)
+            amount_ml, is_approximate = di['amount_ml'], di['is_approximate']
+        else:
+            amount_ml, is_approximate = to_ml(di['amount'], di['unit'])
         
         values.append(
             f"((SELECT drink_id FROM drinks WHERE name = {drink_name}), "
             f"(SELECT ingredient_id FROM ingredients WHERE name = {ingredient_name}), "
-            f"{amount}, {unit})"
+            f"{amount}, {unit}, {format_amount_ml_sql(amount_ml)}, {format_bool_sql(is_approximate)})"
         )
     
     sql += ",\n".join(values) + ";\n\n"
     return sql
 
 
+def write_seed_sql(output_file: str, drinks: List[Dict], ingredients: Dict[str, bool],
+                   drink_ingredients: List[Dict]) -> None:
+    """Generate SQL, streaming each section to the output."""
+    with open_output(output_file) as f:
+        f.write("-- Sample data insert statements parsed from cocktails_data.csv\n")
+        f.write("-- Note: Ingredient categories, subcategories, and ABV are NULL - update manually if needed\n")
+        f.write("-- Note: Flavor profiles are not included - add separately if needed\n\n")
+        
+        f.write(generate_ingredients_sql(set(ingredients.keys())))
+        f.write(generate_drinks_sql(drinks))
+        f.write(generate_drink_ingredients_sql(drink_ingredients))
+        f.write(generate_search_documents_sql(drinks, drink_ingredients))
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python parse_cocktails_csv.py <input_csv> [output_sql]")
-        print("Example: python parse_cocktails_csv.py cocktails_data.csv seed_data.sql")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else 'seed_data.sql'
-    
-    print(f"Reading {input_file}...")
+    parser = argparse.ArgumentParser(description='Parse cocktails CSV into seed SQL or recipe IR')
+    parser.add_argument('input', help='Input CSV file, optionally compressed, - for stdin')
+    parser.add_argument('output', nargs='?', default='seed_data.sql',
+                        help='Output file, - for stdout; a .rir file gets recipe IR (default: seed_data.sql)')
+    parser.add_argument('--ir', action='store_true', help='Write recipe IR regardless of the output name')
+    args = parser.parse_args()
+    
+    input_file = args.input
+    output_file = args.output
+    log = message_stream(output_file)
+    
+    print(f"Reading {input_file}...", file=log)
     rows = read_csv_file(input_file)
     
-    print(f"Parsing {len(rows)} drinks...")
+    print(f"Parsing {len(rows)} drinks...", file=log)
     
     drinks = []
     all_ingredients = {}  # Use dict to track canonical names
@@ -402,27 +434,26 @@ def main():
                 else:
                     print(f"Warning: Could not parse ingredient '{ingredient_part}' for {drink_name}", file=sys.stderr)
     
-    # Generate SQL
-    sql_output = "-- Sample data insert statements parsed from cocktails_data.csv\n"
-    sql_output += "-- Note: Ingredient categories, subcategories, and ABV are NULL - update manually if needed\n"
-    sql_output += "-- Note: Flavor profiles are not included - add separately if needed\n\n"
-    
-    sql_output += generate_ingredients_sql(set(all_ingredients.keys()))
-    sql_output += generate_drinks_sql(drinks)
-    sql_output += generate_drink_ingredients_sql(drink_ingredients_list)
-    
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(sql_output)
-    
-    print(f"\n✓ Generated {output_file}")
-    print(f"  - {len(drinks)} drinks")
-    print(f"  - {len(all_ingredients)} unique ingredients")
-    print(f"  - {len(drink_ingredients_list)} drink-ingredient relationships")
-    print(f"\nNote: You may want to:")
-    print(f"  1. Update ingredient categories, subcategories, and ABV values")
-    print(f"  2. Add flavor profiles for the drinks")
-    print(f"  3. Review and adjust glass types, build methods, and garnishes")
+    if args.ir or recipe_ir.is_ir_path(output_file):
+        # Typed records for the IR stages; SQL is rendered later by recipe_ir.py render
+        records = [recipe_ir.Ingredient(name) for name in sorted(all_ingredients)]
+        records += [recipe_ir.Drink(**drink) for drink in drinks]
+        records += [recipe_ir.Quantity(di['drink_name'], di['ingredient_name'], di['amount'], di['unit'],
+                                       *to_ml(di['amount'], di['unit']))
+                    for di in drink_ingredients_list]
+        with open_binary_output(output_file) as f:
+            recipe_ir.write_records(f, records)
+    else:
+        write_seed_sql(output_file, drinks, all_ingredients, drink_ingredients_list)
+    
+    print(f"\n✓ Generated {output_file}", file=log)
+    print(f"  - {len(drinks)} drinks", file=log)
+    print(f"  - {len(all_ingredients)} unique ingredients", file=log)
+    print(f"  - {len(drink_ingredients_list)} drink-ingredient relationships", file=log)
+    print(f"\nNote: You may want to:", file=log)
+    print(f"  1. Update ingredient categories, subcategories, and ABV values", file=log)
+    print(f"  2. Add flavor profiles for the drinks", file=log)
+    print(f"  3. Review and adjust glass types, build methods, and garnishes", file=log)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Convert free-text recipe amounts ('1 1/2', '1/6', 'top', 'splash') into a
+numeric quantity in ml.
+
+drink_ingredients keeps the display amount/unit as TEXT; these helpers compute
+the canonical amount_ml and is_approximate columns loaded alongside them, so
+volume, strength and scaling queries can run on numerics.
+
+The amount text is the source of truth: amount_ml is always to_ml(amount, unit)
+of the row as stored. Stages that rewrite the text (convert_ml_to_oz.py,
+normalize_oz.py, fix_oz_simple.py) recompute amount_ml from the new text, so
+'1 1/2' oz is 45 ml whether it came from the seed, the backfill
+(generate_amount_ml_updates.py) or refresh_daemon.py.
+"""
+
+import re
+from typing import Optional, Tuple
+
+# ml per unit. Keep oz/barspoon in line with convert_ml_to_oz.py (30 ml = 1 oz, 5 ml = 1 barspoon)
+UNIT_ML = {
+    'ml': 1.0,
+    'cl': 10.0,
+    'oz': 30.0,
+    'barspoon': 5.0,
+    'bar spoon': 5.0,
+    'bar spoons': 5.0,
+    'tsp': 5.0,
+    'teaspoon': 5.0,
+    'teaspoons': 5.0,
+    'tbsp': 15.0,
+    'tablespoon': 15.0,
+    'tablespoons': 15.0,
+}
+
+# Units without a fixed volume. The value is a best-effort estimate and the row is flagged approximate.
+APPROXIMATE_UNIT_ML = {
+    'dash': 1.0,
+    'dashes': 1.0,
+    'drop': 0.05,
+    'drops': 0.05,
+    'splash': 5.0,
+    'top': 60.0,   # "Top up with ..." - roughly what's left in a highball
+    'up': 60.0,    # parse_cocktails_csv.py stores "top up" as ('top', 'up')
+}
+
+# Words used as the amount itself (e.g. amount='splash', unit='splash')
+APPROXIMATE_AMOUNTS = {'top', 'splash', 'dash'}
+
+
+def parse_amount(amount: Optional[str]) -> Optional[float]:
+    """Parse '1', '0.75', '1/2', '1 1/2' or '2-3' into a float. Returns None if not numeric."""
+    if amount is None:
+        return None
+    text = str(amount).strip()
+    if not text:
+        return None
+
+    # Range like "2-3": use the midpoint
+    range_match = re.match(r'^(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)$', text)
+    if range_match:
+        low, high = range_match.groups()
+        return (float(low) + float(high)) / 2
+
+    # Mixed number like "1 1/2"
+    mixed_match = re.match(r'^(\d+)\s+(\d+)/(\d+)$', text)
+    if mixed_match:
+        whole, num, den = mixed_match.groups()
+        if int(den) == 0:
+            return None
+        return int(whole) + int(num) / int(den)
+
+    # Fraction like "3/4"
+    fraction_match = re.match(r'^(\d+)/(\d+)$', text)
+    if fraction_match:
+        num, den = fraction_match.groups()
+        if int(den) == 0:
+            return None
+        return int(num) / int(den)
+
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """Lowercase and collapse whitespace in a unit string."""
+    if unit is None:
+        return ''
+    return ' '.join(str(unit).lower().split())
+
+
+def to_ml(amount: Optional[str], unit: Optional[str]) -> Tuple[Optional[float], bool]:
+    """
+    Convert an (amount, unit) pair to (amount_ml, is_approximate).
+
+    amount_ml is None for count units (pcs, wheel, leaves, ...) that have no volume.
+    """
+    unit_key = normalize_unit(unit)
+    amount_key = str(amount).strip().lower() if amount is not None else ''
+    value = parse_amount(amount)
+
+    if unit_key in UNIT_ML:
+        if value is None:
+            return None, False
+        return round(value * UNIT_ML[unit_key], 2), bool(re.search(r'\d\s*-\s*\d', amount_key))
+
+    if unit_key in APPROXIMATE_UNIT_ML:
+        # 'top'/'splash' amounts carry no number; count them as one
+        if value is None:
+            value = 1.0
+        return round(value * APPROXIMATE_UNIT_ML[unit_key], 2), True
+
+    if amount_key in APPROXIMATE_AMOUNTS:
+        return APPROXIMATE_UNIT_ML.get(amount_key), True
+
+    return None, False
+
+
+def format_amount_ml_sql(amount_ml: Optional[float]) -> str:
+    """Format amount_ml as a SQL numeric literal."""
+    if amount_ml is None:
+        return 'NULL'
+    return f"{amount_ml:.2f}"
+
+
+def format_bool_sql(value: bool) -> str:
+    """Format a Python bool as a SQL boolean literal."""
+    return 'TRUE' if value else 'FALSE'
+
+
+# 'amount', 'unit', <amount_ml>, <is_approximate>) at the end of a generated drink_ingredients VALUES row
+SQL_QUANTITY_PATTERN = re.compile(
+    r"'((?:[^']|'')*)',\s*'((?:[^']|'')*)',\s*(?:NULL|\d+(?:\.\d+)?),\s*(?:TRUE|FALSE)(?=\s*\))")
+
+
+def recompute_amount_ml_sql(content: str) -> str:
+    """Recompute the amount_ml / is_approximate literals of generated VALUES rows from their amount text."""
+    def replace(match):
+        amount_ml, is_approximate = to_ml(match.group(1).replace("''", "'"), match.group(2).replace("''", "'"))
+        return (f"'{match.group(1)}', '{match.group(2)}', "
+                f"{format_amount_ml_sql(amount_ml)}, {format_bool_sql(is_approximate)}")
+    return SQL_QUANTITY_PATTERN.sub(replace, content)
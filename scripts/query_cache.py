@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Result cache for the Python query services, keyed on the catalog data version.
+
+Query answers only change when new data lands, so each entry is keyed on
+(data version, namespace, normalized request parameters). When a service sees
+a new data version, every entry is dropped at once; otherwise entries are
+evicted least-recently-used beyond max_entries, or when older than ttl seconds.
+Versions only move forward: a request still running against a version the
+cache has already moved past neither clears the cache nor stores its result.
+Hit, miss, eviction, expiration and invalidation counters are kept for /stats
+endpoints.
+
+The data version comes from one of:
+    - catalog_metadata.data_version, stamped after every seed run
+      (database/stamp_data_version.sql, or stamp_data_version() from Python)
+    - a snapshot hash of drinks/ingredients/drink_ingredients when no stamp exists
+    - a service's own snapshot id, e.g. the recommender model version
+
+Usage:
+    cache = QueryCache(DataVersion(lambda: fetch_data_version(conn)), max_entries=1024, ttl=300)
+    result = cache.get_or_compute('similar', {'drink_id': 12, 'limit': 10}, lambda: run_query(12, 10))
+
+    python query_cache.py version     # print the current catalog data version
+    python query_cache.py stamp       # stamp a new data version (after a manual data change)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import db
+
+DATA_VERSION_KEY = 'data_version'
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300.0
+VERSION_CHECK_SECONDS = 5.0
+RETIRED_VERSIONS_KEPT = 64
+
+STAMP_SQL = """
+    INSERT INTO catalog_metadata (key, value, updated_at) VALUES (%s, %s, now())
+    ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
+"""
+
+# Content hash of the base tables, used when the catalog was loaded without a stamp
+SNAPSHOT_QUERY = """
+    SELECT md5(concat_ws('|',
+        (SELECT md5(coalesce(string_agg(d::text, ',' ORDER BY d.drink_id), '')) FROM drinks d),
+        (SELECT md5(coalesce(string_agg(i::text, ',' ORDER BY i.ingredient_id), '')) FROM ingredients i),
+        (SELECT md5(coalesce(string_agg(di::text, ',' ORDER BY di.drink_id, di.ingredient_id), ''))
+         FROM drink_ingredients di)
+    ))
+"""
+
+_MISSING = object()
+
+
+def normalize_params(params: Dict[str, Any]) -> str:
+    """
+    Canonical cache key text for request parameters.
+
+    Keys are sorted, None values dropped, strings stripped with inner whitespace collapsed,
+    and sets sorted; list order is kept because it can change the answer.
+    """
+    def normalize(value):
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (set, frozenset)):
+            return sorted(normalize(v) for v in value)
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        if isinstance(value, str):
+            return ' '.join(value.split())
+        return value
+    return json.dumps(normalize(params), sort_keys=True, separators=(',', ':'), default=str)
+
+
+def fetch_data_version(conn) -> str:
+    """'stamp:<value>' from catalog_metadata, or 'snapshot:<md5>' of the base tables if there is no stamp."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT to_regclass('catalog_metadata') IS NOT NULL")
+        if cursor.fetchone()[0]:
+            cursor.execute('SELECT value FROM catalog_metadata WHERE key = %s', (DATA_VERSION_KEY,))
+            row = cursor.fetchone()
+            if row and row[0]:
+                return f"stamp:{row[0]}"
+        cursor.execute(SNAPSHOT_QUERY)
+        return f"snapshot:{cursor.fetchone()[0]}"
+    finally:
+        cursor.close()
+
+
+def stamp_data_version(conn, version: Optional[str] = None, commit: bool = True) -> str:
+    """Record a new catalog data version (default: a timestamp); commit=False leaves it in the open transaction."""
+    version = version or datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    cursor = conn.cursor()
+    cursor.execute(STAMP_SQL, (DATA_VERSION_KEY, version))
+    if commit:
+        conn.commit()
+    cursor.close()
+    return version
+
+
+def file_snapshot_version(paths: Iterable[str]) -> str:
+    """'files:<sha256>' over the paths' names, sizes and modification times."""
+    digest = hashlib.sha256()
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+    return f"files:{digest.hexdigest()[:32]}"
+
+
+class DataVersion:
+    """Calls fetch() at most once per check_interval seconds; between checks the last version is reused."""
+
+    def __init__(self, fetch: Callable[[], str], check_interval: float = VERSION_CHECK_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.fetch = fetch
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = None
+
+    def __call__(self) -> str:
+        with self._lock:
+            now = self.clock()
+            if self._checked_at is None or now - self._checked_at >= self.check_interval:
+                self._version = self.fetch()
+                self._checked_at = now
+            return self._version
+
+
+class QueryCache:
+    """
+    Thread-safe LRU + TTL result cache that empties itself when the data version changes.
+
+    Cached values are shared between requests, so callers must not mutate them. Two threads
+    missing the same key at once both compute it; the second result simply replaces the first.
+    """
+
+    def __init__(self, data_version: Optional[Callable[[], str]] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: Optional[float] = DEFAULT_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.data_version = data_version
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (version, namespace, params) -> (expires_at, value)
+        self._version = None
+        self._retired = OrderedDict()  # versions the cache has moved past, oldest first
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0,
+                         'version_changes': 0, 'stale_requests': 0}
+
+    def _current_version(self, version: Optional[str]) -> Optional[str]:
+        if version is None and self.data_version is not None:
+            version = self.data_version()
+        return version
+
+    def _observe_version(self, version: Optional[str]) -> bool:
+        """
+        Move to version if it is new, dropping everything cached for the previous one (caller holds the lock).
+
+        Returns False for a version the cache has already moved past; the caller must then leave the cache alone.
+        """
+        if version == self._version:
+            return True
+        if version in self._retired:
+            self.counters['stale_requests'] += 1
+            return False
+        if self._version is not None:
+            self.counters['version_changes'] += 1
+            self._retired[self._version] = None
+            while len(self._retired) > RETIRED_VERSIONS_KEPT:
+                self._retired.popitem(last=False)
+        self.counters['invalidations'] += len(self._entries)
+        self._entries.clear()
+        self._version = version
+        return True
+
+    def get(self, namespace: str, params: Dict[str, Any], version: Optional[str] = None, default=None):
+        """Cached value, or default on a miss (counted)."""
+        version = self._current_version(version)
+        key = (version, namespace, normalize_params(params))
+        with self._lock:
+            if not self._observe_version(version):
+                self.counters['misses'] += 1
+                return default
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    return value
+                del self._entries[key]
+                self.counters['expirations'] += 1
+            self.counters['misses'] += 1
+            return default
+
+    def put(self, namespace: str, params: Dict[str, Any], value, version: Optional[str] = None) -> None:
+        version = self._current_version(version)
+        if self.max_entries <= 0:
+            return
+        key = (version, namespace, normalize_params(params))
+        expires_at = self.clock() + self.ttl if self.ttl else None
+        with self._lock:
+            # Computed against data the cache has moved past: don't keep it
+            if not self._observe_version(version):
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters['evictions'] += 1
+
+    def get_or_compute(self, namespace: str, params: Dict[str, Any], compute: Callable[[], Any],
+                       version: Optional[str] = None):
+        version = self._current_version(version)
+        value = self.get(namespace, params, version, default=_MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(namespace, params, value, version)
+        return value
+
+    def invalidate(self) -> int:
+        """Drop every entry; returns how many were dropped."""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self.counters['invalidations'] += dropped
+            return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['misses']
+            return dict(self.counters, entries=len(self._entries), max_entries=self.max_entries, ttl=self.ttl,
+                        data_version=self._version,
+                        hit_rate=round(self.counters['hits'] / lookups, 4) if lookups else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show or stamp the catalog data version used by query caches')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('version', help='Print the current catalog data version')
+    stamp_parser = subparsers.add_parser('stamp', help='Stamp a new catalog data version')
+    stamp_parser.add_argument('--value', help='Version string (default: current timestamp)')
+    args = parser.parse_args()
+
+    conn = db.connect()
+    try:
+        if args.command == 'version':
+            print(fetch_data_version(conn))
+        else:
+            print(f"✓ Stamped data version {stamp_data_version(conn, args.value)}")
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Binary recipe IR: a typed, versioned record stream passed between ETL stages.
+
+Instead of each stage re-parsing the SQL text written by the previous one,
+parse_cocktails_csv.py can write ingredients, drinks and quantities as
+length-prefixed struct records. The unit post-processors (convert_ml_to_oz.py,
+normalize_oz.py, fix_oz_simple.py) rewrite the amount/unit fields of the
+quantity records directly, and SQL, COPY or JSON is rendered once at the end.
+fix_parentheses.py only repairs SQL text and has no IR mode.
+
+Layout (little-endian):
+
+    header   b'DRIR' | version u16 | flags u16
+    record   type u8 | payload length u32 | payload
+    payload  fields in schema order: strings are i32 byte length (-1 = NULL)
+             followed by UTF-8; floats are f64 (NaN = NULL); bools are u8
+
+Readers skip record types they don't know and ignore trailing payload bytes,
+so a stage can pass through records added by a newer writer. Files ending in
+.rir (optionally followed by .gz/.bz2/.xz/.zst) are treated as IR; use --ir for
+stdin/stdout.
+
+Usage:
+    python parse_cocktails_csv.py cocktails_data.csv seed.rir.gz
+    python convert_ml_to_oz.py seed.rir.gz
+    python normalize_oz.py seed.rir.gz
+    python recipe_ir.py render seed.rir.gz ../database/seed_data_new.sql
+    python recipe_ir.py render seed.rir.gz - --format copy | psql drinksdb
+    python recipe_ir.py info seed.rir.gz
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+from collections import Counter
+from typing import IO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from etl_io import COMPRESSED_OPENERS, message_stream, open_binary_input, open_binary_output, open_output
+from search_documents import generate_search_documents_sql
+
+MAGIC = b'DRIR'
+VERSION = 1
+IR_EXTENSION = '.rir'
+
+HEADER = struct.Struct('<4sHH')
+RECORD_HEADER = struct.Struct('<BI')
+STRING_LENGTH = struct.Struct('<i')
+FLOAT = struct.Struct('<d')
+BOOL = struct.Struct('<B')
+
+
+class Ingredient(NamedTuple):
+    name: str
+    category: Optional[str] = None
+    subcategory: Optional[str] = None
+    abv: Optional[float] = None
+
+
+class Drink(NamedTuple):
+    name: str
+    description: Optional[str] = None
+    glass_type: Optional[str] = None
+    build_method: Optional[str] = None
+    garnish: Optional[str] = None
+
+
+class Quantity(NamedTuple):
+    drink_name: str
+    ingredient_name: str
+    amount: Optional[str] = None
+    unit: Optional[str] = None
+    amount_ml: Optional[float] = None
+    is_approximate: bool = False
+
+
+# Record type code -> (record class, field kinds in order: s = string, f = float, b = bool)
+RECORD_TYPES = {
+    1: (Ingredient, 'sssf'),
+    2: (Drink, 'sssss'),
+    3: (Quantity, 'ssssfb'),
+}
+TYPE_CODES = {record_class: code for code, (record_class, _) in RECORD_TYPES.items()}
+
+
+def is_ir_path(path: str) -> bool:
+    """True for seed.rir, seed.rir.gz, ... (compression suffixes are ignored)."""
+    root, ext = os.path.splitext(path)
+    if ext.lower() in COMPRESSED_OPENERS:
+        ext = os.path.splitext(root)[1]
+    return ext.lower() == IR_EXTENSION
+
+
+def encode_record(record) -> bytes:
+    code = TYPE_CODES[type(record)]
+    parts = []
+    for kind, value in zip(RECORD_TYPES[code][1], record):
+        if kind == 's':
+            if value is None:
+                parts.append(STRING_LENGTH.pack(-1))
+            else:
+                data = str(value).encode('utf-8')
+                parts.append(STRING_LENGTH.pack(len(data)))
+                parts.append(data)
+        elif kind == 'f':
+            parts.append(FLOAT.pack(math.nan if value is None else float(value)))
+        else:
+            parts.append(BOOL.pack(1 if value else 0))
+    payload = b''.join(parts)
+    return RECORD_HEADER.pack(code, len(payload)) + payload
+
+
+def decode_payload(code: int, payload: bytes):
+    record_class, kinds = RECORD_TYPES[code]
+    view = memoryview(payload)
+    values = []
+    offset = 0
+    for kind in kinds:
+        if kind == 's':
+            (length,) = STRING_LENGTH.unpack_from(view, offset)
+            offset += STRING_LENGTH.size
+            if length < 0:
+                values.append(None)
+            else:
+                values.append(str(view[offset:offset + length], 'utf-8'))
+                offset += length
+        elif kind == 'f':
+            (value,) = FLOAT.unpack_from(view, offset)
+            offset += FLOAT.size
+            values.append(None if math.isnan(value) else value)
+        else:
+            (value,) = BOOL.unpack_from(view, offset)
+            offset += BOOL.size
+            values.append(bool(value))
+    return record_class(*values)
+
+
+def write_records(stream: IO[bytes], records: Iterable) -> int:
+    """Write the header and every record; returns the number of records written."""
+    stream.write(HEADER.pack(MAGIC, VERSION, 0))
+    count = 0
+    for record in records:
+        stream.write(encode_record(record))
+        count += 1
+    return count
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes:
+    data = stream.read(size)
+    while data and len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+def read_records(stream: IO[bytes]) -> Iterator:
+    """Yield Ingredient, Drink and Quantity records; raises ValueError on a malformed stream."""
+    header = _read_exact(stream, HEADER.size)
+    if len(header) < HEADER.size or header[:4] != MAGIC:
+        raise ValueError('not a recipe IR stream (bad magic)')
+    _, version, _ = HEADER.unpack(header)
+    if version > VERSION:
+        raise ValueError(f'recipe IR version {version} is newer than supported version {VERSION}')
+
+    while True:
+        record_header = _read_exact(stream, RECORD_HEADER.size)
+        if not record_header:
+            return
+        if len(record_header) < RECORD_HEADER.size:
+            raise ValueError('truncated recipe IR record header')
+        code, length = RECORD_HEADER.unpack(record_header)
+        payload = _read_exact(stream, length)
+        if len(payload) < length:
+            raise ValueError('truncated recipe IR record')
+        if code in RECORD_TYPES:
+            yield decode_payload(code, payload)
+
+
+def rewrite_quantities(input_path: str, output_path: str, rewrite: Callable[[Quantity], Quantity]) -> int:
+    """Stream an IR file to output_path, passing each Quantity through rewrite; returns records written."""
+    with open_binary_output(output_path) as fout, open_binary_input(input_path) as fin:
+        return write_records(fout, (rewrite(record) if isinstance(record, Quantity) else record
+                                    for record in read_records(fin)))
+
+
+def collect_records(records: Iterable) -> Dict[str, List]:
+    """Group records into {'ingredients', 'drinks', 'quantities'} lists, keeping stream order."""
+    grouped = {'ingredients': [], 'drinks': [], 'quantities': []}
+    for record in records:
+        if isinstance(record, Ingredient):
+            grouped['ingredients'].append(record)
+        elif isinstance(record, Drink):
+            grouped['drinks'].append(record)
+        else:
+            grouped['quantities'].append(record)
+    return grouped
+
+
+def render_sql(grouped: Dict[str, List], out: IO[str]) -> None:
+    """Render INSERT statements in the same shape as parse_cocktails_csv.py writes them."""
+    # Imported here because parse_cocktails_csv imports this module to write IR
+    from parse_cocktails_csv import escape_sql_string, generate_drink_ingredients_sql, generate_drinks_sql
+
+    drinks = [drink._asdict() for drink in grouped['drinks']]
+    quantities = [quantity._asdict() for quantity in grouped['quantities']]
+
+    out.write("-- Seed data rendered from recipe IR\n\n")
+    if grouped['ingredients']:
+        out.write("-- Insert ingredients first (these will be referenced by drinks)\n")
+        out.write("INSERT INTO ingredients (name, category, subcategory, abv) VALUES\n")
+        values = []
+        for ingredient in grouped['ingredients']:
+            abv = 'NULL' if ingredient.abv is None else f"{ingredient.abv:g}"
+            values.append(f"({escape_sql_string(ingredient.name)}, {escape_sql_string(ingredient.category)}, "
+                          f"{escape_sql_string(ingredient.subcategory)}, {abv})")
+        out.write(",\n".join(values) + ";\n\n")
+    if drinks:
+        out.write(generate_drinks_sql(drinks))
+    if quantities:
+        out.write(generate_drink_ingredients_sql(quantities))
+    out.write(generate_search_documents_sql(drinks, quantities))
+
+
+def copy_value(value) -> str:
+    """One field of PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _write_copy_block(out: IO[str], table: str, columns: List[str], rows: Iterable) -> None:
+    out.write(f"COPY {table} ({', '.join(columns)}) FROM stdin;\n")
+    for row in rows:
+        out.write('\t'.join(copy_value(value) for value in row) + '\n')
+    out.write("\\.\n\n")
+
+
+def render_copy(grouped: Dict[str, List], out: IO[str]) -> None:
+    """Render a psql script that loads the records with COPY (quantities go through a staging table)."""
+    out.write("-- Seed data rendered from recipe IR; load with psql\n\n")
+    _write_copy_block(out, 'ingredients', list(Ingredient._fields), grouped['ingredients'])
+    _write_copy_block(out, 'drinks', list(Drink._fields),
+                      (drink._replace(description=(drink.description or '')[:200] or None)
+                       for drink in grouped['drinks']))
+    out.write("CREATE TEMP TABLE drink_ingredients_staging (\n"
+              "    drink_name TEXT, ingredient_name TEXT, amount TEXT, unit TEXT,\n"
+              "    amount_ml NUMERIC(8,2), is_approximate BOOLEAN\n"
+              ");\n")
+    _write_copy_block(out, 'drink_ingredients_staging', list(Quantity._fields), grouped['quantities'])
+    out.write("INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit, amount_ml, is_approximate)\n"
+              "SELECT d.drink_id, i.ingredient_id, s.amount, s.unit, s.amount_ml, s.is_approximate\n"
+              "FROM drink_ingredients_staging s\n"
+              "JOIN drinks d ON d.name = s.drink_name\n"
+              "JOIN ingredients i ON i.name = s.ingredient_name;\n"
+              "DROP TABLE drink_ingredients_staging;\n\n")
+    out.write(generate_search_documents_sql([drink._asdict() for drink in grouped['drinks']],
+                                            [quantity._asdict() for quantity in grouped['quantities']]))
+
+
+def render_json(grouped: Dict[str, List], out: IO[str]) -> None:
+    document = {
+        'version': VERSION,
+        'ingredients': [ingredient._asdict() for ingredient in grouped['ingredients']],
+        'drinks': [drink._asdict() for drink in grouped['drinks']],
+        'drink_ingredients': [quantity._asdict() for quantity in grouped['quantities']],
+    }
+    json.dump(document, out, indent=2, ensure_ascii=False)
+    out.write('\n')
+
+
+RENDERERS = {
+    'sql': render_sql,
+    'copy': render_copy,
+    'json': render_json,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect and render recipe IR streams')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    render_parser = subparsers.add_parser('render', help='Render IR as SQL, a COPY script or JSON')
+    render_parser.add_argument('input', help='IR file, optionally compressed, - for stdin')
+    render_parser.add_argument('output', nargs='?', default='-', help='Output file, - for stdout (default: -)')
+    render_parser.add_argument('--format', choices=sorted(RENDERERS), default='sql', help='Output format (default: sql)')
+
+    info_parser = subparsers.add_parser('info', help='Print the record counts of an IR file')
+    info_parser.add_argument('input', help='IR file, optionally compressed, - for stdin')
+
+    args = parser.parse_args()
+
+    try:
+        with open_binary_input(args.input) as fin:
+            if args.command == 'info':
+                counts = Counter(type(record).__name__ for record in read_records(fin))
+                print(f"{args.input}:")
+                for name in ('Ingredient', 'Drink', 'Quantity'):
+                    print(f"  - {counts[name]} {name.lower()} records")
+                return
+            grouped = collect_records(read_records(fin))
+        with open_output(args.output) as fout:
+            RENDERERS[args.format](grouped, fout)
+    except (OSError, ValueError) as e:
+        print(f"Error reading recipe IR '{args.input}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+    log = message_stream(args.output)
+    print(f"✓ Rendered {args.input} -> {args.output} ({args.format})", file=log)
+    print(f"  - {len(grouped['drinks'])} drinks, {len(grouped['ingredients'])} ingredients, "
+          f"{len(grouped['quantities'])} quantities", file=log)
+
+
+if __name__ == '__main__':
+    main()
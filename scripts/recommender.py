@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Long-lived TF-IDF drink recommender.
+
+Trains a sparse TF-IDF matrix over each drink's ingredients, glass and build
+method, saves it as plain .npy arrays that load with mmap_mode='r', and serves
+cosine-similarity recommendations over HTTP from one process. Publishing a new
+model swaps the CURRENT pointer file atomically and prunes all but the newest
+--keep versions; a running server notices the change and reloads without
+dropping requests. Responses are cached per model
+version (query_cache.py), so a new model also invalidates every cached answer.
+
+Usage:
+    python recommender.py train --model-dir models/recommender
+    python recommender.py train --drinks drinks.csv --ingredients drink_ingredients.csv
+    python recommender.py train --if-changed      # skip when the catalog data version is unchanged
+    python recommender.py serve --model-dir models/recommender --port 3003
+    python recommender.py query --model-dir models/recommender "Negroni"
+
+Endpoints:
+    GET  /recommendations?drink_id=12&limit=10     (or ?name=Negroni)
+    POST /recommendations/batch  {"drink_ids": [1, 2], "names": ["Negroni"], "limit": 10}
+    GET  /health
+    GET  /stats                                   (cache hit/miss/eviction counters)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+from scipy import sparse
+
+import db
+from query_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, QueryCache, fetch_data_version, file_snapshot_version
+
+DEFAULT_MODEL_DIR = os.path.join(db.PROJECT_ROOT, 'models', 'recommender')
+CURRENT_FILE = 'CURRENT'
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+MAX_BATCH = 500
+RELOAD_INTERVAL_SECONDS = 5.0
+# Model versions kept on disk after publishing (servers may still map the previous one)
+KEEP_VERSIONS = 3
+# Upper bound on batch rows x drinks scored at once, so large batches over large catalogs stay bounded
+SCORE_CHUNK_ENTRIES = 4_000_000
+
+# Relative weight of each feature family before TF-IDF normalization
+FEATURE_WEIGHTS = {
+    'ingredient': 1.0,
+    'subcategory': 0.5,
+    'glass': 0.3,
+    'method': 0.3,
+}
+
+TRAINING_QUERY = """
+    SELECT d.drink_id, d.name, d.glass_type, d.build_method, i.name, i.subcategory
+    FROM drinks d
+    LEFT JOIN drink_ingredients di ON d.drink_id = di.drink_id
+    LEFT JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+    ORDER BY d.drink_id
+"""
+
+
+def drink_features(ingredients: Iterable[Tuple[str, Optional[str]]], glass_type: Optional[str],
+                   build_method: Optional[str]) -> Dict[str, float]:
+    """Map one drink to {feature: weight}, e.g. {'ingredient:gin': 1.0, 'glass:coupe': 0.3}."""
+    features = {}
+    for name, subcategory in ingredients:
+        if name:
+            features[f"ingredient:{name.strip().lower()}"] = FEATURE_WEIGHTS['ingredient']
+        if subcategory:
+            features[f"subcategory:{subcategory.strip().lower()}"] = FEATURE_WEIGHTS['subcategory']
+    if glass_type:
+        features[f"glass:{glass_type.strip().lower()}"] = FEATURE_WEIGHTS['glass']
+    if build_method:
+        features[f"method:{build_method.strip().lower()}"] = FEATURE_WEIGHTS['method']
+    return features
+
+
+class RecommenderModel:
+    """
+    Row-normalized TF-IDF matrix plus the lookups needed to serve it.
+
+    drink_ids is sorted, so drink_id -> row is a searchsorted, and name -> row is a dict.
+    """
+
+    def __init__(self, matrix: sparse.csr_matrix, drink_ids: np.ndarray, names: List[str],
+                 version: str = '', data_version: Optional[str] = None):
+        self.matrix = matrix
+        self.drink_ids = drink_ids
+        self.names = names
+        self.version = version
+        self.data_version = data_version  # catalog data version the model was trained from
+        self.rows_by_name = {name.lower(): row for row, name in enumerate(names)}
+
+    @classmethod
+    def train(cls, drinks: List[Dict], version: str = '') -> 'RecommenderModel':
+        """Build a model from [{'drink_id', 'name', 'features': {feature: weight}}]."""
+        drinks = sorted(drinks, key=lambda drink: drink['drink_id'])
+        vocabulary = {}
+        rows, cols, values = [], [], []
+        for row, drink in enumerate(drinks):
+            for feature, weight in drink['features'].items():
+                rows.append(row)
+                cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+                values.append(weight)
+
+        shape = (len(drinks), len(vocabulary))
+        matrix = sparse.csr_matrix(
+            (np.array(values, dtype=np.float32), (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+            shape=shape,
+        )
+
+        # Smoothed idf, as in scikit-learn's TfidfVectorizer
+        df = np.bincount(matrix.indices, minlength=shape[1])
+        idf = np.log((1.0 + shape[0]) / (1.0 + df)) + 1.0
+        matrix.data *= idf[matrix.indices].astype(np.float32)
+
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        matrix = sparse.csr_matrix(sparse.diags((1.0 / norms).astype(np.float32)) @ matrix)
+        matrix.sort_indices()
+
+        drink_ids = np.array([drink['drink_id'] for drink in drinks], dtype=np.int64)
+        return cls(matrix, drink_ids, [drink['name'] for drink in drinks], version)
+
+    def row_for(self, drink_id: Optional[int] = None, name: Optional[str] = None) -> Optional[int]:
+        """Row index for a drink_id or (case-insensitive) name, or None if unknown."""
+        if name is not None:
+            return self.rows_by_name.get(name.strip().lower())
+        row = int(np.searchsorted(self.drink_ids, drink_id))
+        if row < len(self.drink_ids) and self.drink_ids[row] == drink_id:
+            return row
+        return None
+
+    def recommend_rows(self, rows: List[int], limit: int = DEFAULT_LIMIT,
+                       exclude: Iterable[int] = ()) -> List[List[Dict]]:
+        """
+        Top-K most similar drinks for each row.
+
+        Scores stay sparse (only drinks sharing a feature get one) and rows are scored in chunks of at
+        most SCORE_CHUNK_ENTRIES rows x drinks, so memory doesn't grow with batch size x catalog size.
+        """
+        if not rows:
+            return []
+        if limit <= 0:
+            return [[] for _ in rows]
+        exclude_rows = np.array([row for row in (self.row_for(drink_id) for drink_id in exclude) if row is not None],
+                                dtype=np.int64)
+        chunk_size = max(1, SCORE_CHUNK_ENTRIES // max(self.matrix.shape[0], 1))
+
+        results = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            scores = sparse.csr_matrix(self.matrix[chunk] @ self.matrix.T)
+            for i, row in enumerate(chunk):
+                candidates = scores.indices[scores.indptr[i]:scores.indptr[i + 1]]
+                values = scores.data[scores.indptr[i]:scores.indptr[i + 1]]
+                keep = (values > 0) & (candidates != row)
+                if len(exclude_rows):
+                    keep &= ~np.isin(candidates, exclude_rows)
+                candidates, values = candidates[keep], values[keep]
+                if len(candidates) > limit:
+                    top = np.argpartition(-values, limit - 1)[:limit]
+                    candidates, values = candidates[top], values[top]
+                # Best first; ties in drink_id order
+                order = np.lexsort((candidates, -values))
+                results.append([
+                    {'drink_id': int(self.drink_ids[j]), 'name': self.names[j], 'similarity': round(float(score), 4)}
+                    for j, score in zip(candidates[order], values[order])
+                ])
+        return results
+
+    def save(self, model_dir: str, keep: int = KEEP_VERSIONS) -> str:
+        """Write a new model version under model_dir, point CURRENT at it atomically and prune old versions."""
+        version = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        version_dir = os.path.join(model_dir, version)
+        os.makedirs(version_dir)
+        np.save(os.path.join(version_dir, 'data.npy'), self.matrix.data)
+        np.save(os.path.join(version_dir, 'indices.npy'), self.matrix.indices)
+        np.save(os.path.join(version_dir, 'indptr.npy'), self.matrix.indptr)
+        np.save(os.path.join(version_dir, 'drink_ids.npy'), self.drink_ids)
+        with open(os.path.join(version_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'shape': list(self.matrix.shape), 'names': self.names, 'data_version': self.data_version},
+                      f, ensure_ascii=False)
+
+        pointer = os.path.join(model_dir, CURRENT_FILE)
+        tmp_pointer = f"{pointer}.{os.getpid()}.tmp"
+        with open(tmp_pointer, 'w', encoding='utf-8') as f:
+            f.write(version + '\n')
+        os.replace(tmp_pointer, pointer)
+        self.version = version
+        prune_versions(model_dir, keep)
+        return version
+
+    @classmethod
+    def load(cls, model_dir: str) -> 'RecommenderModel':
+        """Load the version named by model_dir/CURRENT, memory-mapping the arrays."""
+        with open(os.path.join(model_dir, CURRENT_FILE), 'r', encoding='utf-8') as f:
+            version = f.read().strip()
+        version_dir = os.path.join(model_dir, version)
+        with open(os.path.join(version_dir, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode='r')
+            for name in ('data', 'indices', 'indptr', 'drink_ids')
+        }
+        matrix = sparse.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                                   shape=tuple(meta['shape']), copy=False)
+        return cls(matrix, arrays['drink_ids'], meta['names'], version, meta.get('data_version'))
+
+
+def prune_versions(model_dir: str, keep: int = KEEP_VERSIONS) -> List[str]:
+    """
+    Delete all but the newest keep model versions (never the one CURRENT names); returns the deleted versions.
+
+    A server still mapping a deleted version keeps reading it until it reloads: unlinked files stay readable.
+    """
+    with open(os.path.join(model_dir, CURRENT_FILE), 'r', encoding='utf-8') as f:
+        current = f.read().strip()
+    # Version names are timestamps, so name order is age order
+    versions = sorted(name for name in os.listdir(model_dir)
+                      if os.path.isfile(os.path.join(model_dir, name, 'meta.json')))
+    stale = [version for version in versions[:-max(keep, 1)] if version != current]
+    for version in stale:
+        shutil.rmtree(os.path.join(model_dir, version), ignore_errors=True)
+    return stale
+
+
+class ModelStore:
+    """Holds the live model and swaps in a new one when CURRENT changes."""
+
+    def __init__(self, model_dir: str):
+        self.model_dir = model_dir
+        self.model = RecommenderModel.load(model_dir)
+        self._pointer_mtime = self._current_mtime()
+
+    def _current_mtime(self) -> float:
+        return os.stat(os.path.join(self.model_dir, CURRENT_FILE)).st_mtime_ns
+
+    def reload_if_changed(self) -> bool:
+        """Load the model CURRENT points at if it moved; keep serving the old one on failure."""
+        try:
+            mtime = self._current_mtime()
+            if mtime == self._pointer_mtime:
+                return False
+            model = RecommenderModel.load(self.model_dir)
+        except Exception as e:
+            print(f"Warning: model reload failed, keeping {self.model.version}: {e}", file=sys.stderr)
+            return False
+        self._pointer_mtime = mtime
+        if model.version == self.model.version:
+            return False
+        # Requests read self.model once, so a plain assignment is an atomic swap
+        self.model = model
+        print(f"✓ Loaded recommender model {model.version} ({len(model.names)} drinks)")
+        return True
+
+    def watch(self, interval: float = RELOAD_INTERVAL_SECONDS) -> threading.Thread:
+        """Poll for new models in a daemon thread that survives any error."""
+        def poll():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.reload_if_changed()
+                except Exception as e:
+                    print(f"Warning: model reload check failed: {e}", file=sys.stderr)
+        thread = threading.Thread(target=poll, name='recommender-reload', daemon=True)
+        thread.start()
+        return thread
+
+
+def current_data_version(model_dir: str) -> Optional[str]:
+    """Data version of the model CURRENT points at, or None if there is no model yet."""
+    try:
+        return RecommenderModel.load(model_dir).data_version
+    except (OSError, ValueError):
+        return None
+
+
+def fetch_training_drinks(conn) -> List[Dict]:
+    """Load every drink's features from the database in one query."""
+    cursor = conn.cursor()
+    cursor.execute(TRAINING_QUERY)
+    by_drink = {}
+    ingredients = defaultdict(list)
+    for drink_id, name, glass_type, build_method, ingredient, subcategory in cursor.fetchall():
+        by_drink[drink_id] = (name, glass_type, build_method)
+        if ingredient:
+            ingredients[drink_id].append((ingredient, subcategory))
+    cursor.close()
+    return [
+        {'drink_id': drink_id, 'name': name,
+         'features': drink_features(ingredients[drink_id], glass_type, build_method)}
+        for drink_id, (name, glass_type, build_method) in by_drink.items()
+    ]
+
+
+def read_training_csvs(drinks_file: str, ingredients_file: str,
+                       catalog_file: Optional[str] = None) -> List[Dict]:
+    """Build training drinks from the csv_to_sql.py input sheets (drink_id = sheet order)."""
+    from csv_to_sql import read_csv_file
+
+    subcategories = {}
+    if catalog_file:
+        for row in read_csv_file(catalog_file):
+            if (row.get('name') or '').strip():
+                subcategories[row['name'].strip().lower()] = (row.get('subcategory') or '').strip() or None
+
+    ingredients = defaultdict(list)
+    for row in read_csv_file(ingredients_file):
+        name = (row.get('ingredient_name') or '').strip()
+        if name:
+            ingredients[(row.get('drink_name') or '').strip().lower()].append((name, subcategories.get(name.lower())))
+
+    drinks = []
+    for drink_id, row in enumerate(read_csv_file(drinks_file), start=1):
+        name = (row.get('name') or '').strip()
+        if name:
+            drinks.append({'drink_id': drink_id, 'name': name,
+                           'features': drink_features(ingredients[name.lower()], row.get('glass_type'),
+                                                      row.get('build_method'))})
+    return drinks
+
+
+def clamp_limit(value) -> int:
+    return max(1, min(int(value), MAX_LIMIT))
+
+
+def make_handler(store: ModelStore, cache: Optional[QueryCache] = None):
+    """Build a request handler bound to a model store; results are cached per model version."""
+    cache = cache if cache is not None else QueryCache()
+
+    def cache_params(model: RecommenderModel, row: int, limit: int, exclude: List[int]) -> Dict:
+        # Keyed on the resolved drink_id, so name and drink_id lookups share entries
+        return {'drink_id': int(model.drink_ids[row]), 'limit': limit, 'exclude': sorted(set(exclude))}
+
+    class RecommenderHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            model = store.model
+            if url.path == '/health':
+                self.send_json(200, {'status': 'ok', 'model': model.version, 'drinks': len(model.names)})
+                return
+            if url.path == '/stats':
+                self.send_json(200, {'model': model.version, 'data_version': model.data_version,
+                                     'cache': cache.stats()})
+                return
+            if url.path != '/recommendations':
+                self.send_json(404, {'error': 'Route not found', 'path': url.path})
+                return
+
+            params = parse_qs(url.query)
+            try:
+                limit = clamp_limit(params.get('limit', [DEFAULT_LIMIT])[0])
+            except ValueError:
+                self.send_json(400, {'error': 'limit must be an integer'})
+                return
+            try:
+                exclude = [int(value) for value in params.get('exclude', [])]
+            except ValueError:
+                self.send_json(400, {'error': 'exclude must be integer drink_ids'})
+                return
+            try:
+                if 'name' in params:
+                    row = model.row_for(name=params['name'][0])
+                else:
+                    row = model.row_for(int(params['drink_id'][0]))
+            except (KeyError, ValueError):
+                self.send_json(400, {'error': 'drink_id (integer) or name is required'})
+                return
+            if row is None:
+                self.send_json(404, {'error': 'Drink not found'})
+                return
+            self.send_json(200, {
+                'drink_id': int(model.drink_ids[row]),
+                'name': model.names[row],
+                'recommendations': cache.get_or_compute(
+                    'recommendations', cache_params(model, row, limit, exclude),
+                    lambda: model.recommend_rows([row], limit, exclude)[0], version=model.version),
+            })
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path != '/recommendations/batch':
+                self.send_json(404, {'error': 'Route not found', 'path': url.path})
+                return
+            model = store.model
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                lookups = [('drink_id', int(drink_id)) for drink_id in body.get('drink_ids', [])]
+                lookups += [('name', str(name)) for name in body.get('names', [])]
+            except (ValueError, TypeError, AttributeError):
+                self.send_json(400, {'error': 'Body must be JSON with drink_ids and/or names'})
+                return
+            try:
+                limit = clamp_limit(body.get('limit', DEFAULT_LIMIT))
+            except (ValueError, TypeError):
+                self.send_json(400, {'error': 'limit must be an integer'})
+                return
+            try:
+                exclude = [int(value) for value in body.get('exclude', [])]
+            except (ValueError, TypeError):
+                self.send_json(400, {'error': 'exclude must be a list of integer drink_ids'})
+                return
+            if len(lookups) > MAX_BATCH:
+                self.send_json(400, {'error': f"At most {MAX_BATCH} drinks per batch"})
+                return
+
+            rows = [model.row_for(value) if kind == 'drink_id' else model.row_for(name=value)
+                    for kind, value in lookups]
+            by_row = {row: cache.get('recommendations', cache_params(model, row, limit, exclude), model.version)
+                      for row in rows if row is not None}
+            missing = [row for row, cached in by_row.items() if cached is None]
+            for row, recommendations in zip(missing, model.recommend_rows(missing, limit, exclude)):
+                by_row[row] = recommendations
+                cache.put('recommendations', cache_params(model, row, limit, exclude), recommendations, model.version)
+            results = []
+            for (kind, value), row in zip(lookups, rows):
+                if row is None:
+                    results.append({kind: value, 'error': 'Drink not found'})
+                else:
+                    results.append({'drink_id': int(model.drink_ids[row]), 'name': model.names[row],
+                                    'recommendations': by_row[row]})
+            self.send_json(200, {'model': model.version, 'results': results})
+
+        def send_json(self, status: int, body) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return RecommenderHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train and serve the TF-IDF drink recommender')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = subparsers.add_parser('train', help='Train a model and publish it as CURRENT')
+    train_parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR, help='Model directory')
+    train_parser.add_argument('--drinks', help='Train from a drinks CSV instead of the database')
+    train_parser.add_argument('--ingredients', help='drink_ingredients CSV (with --drinks)')
+    train_parser.add_argument('--ingredient-catalog', help='Optional ingredients CSV for subcategories (with --drinks)')
+    train_parser.add_argument('--if-changed', action='store_true',
+                              help='Skip training when the current model has the same catalog data version')
+    train_parser.add_argument('--keep', type=int, default=KEEP_VERSIONS,
+                              help='Model versions to keep on disk, including the new one (default: 3)')
+
+    serve_parser = subparsers.add_parser('serve', help='Serve recommendations over HTTP')
+    serve_parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR, help='Model directory')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=3003, help='Port (default: 3003)')
+    serve_parser.add_argument('--reload-interval', type=float, default=RELOAD_INTERVAL_SECONDS,
+                              help='Seconds between checks for a new model (default: 5)')
+    serve_parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_ENTRIES,
+                              help='Cached responses kept per model version, 0 to disable (default: 1024)')
+    serve_parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL_SECONDS,
+                              help='Seconds a cached response stays valid (default: 300)')
+
+    query_parser = subparsers.add_parser('query', help='Print recommendations for one drink')
+    query_parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR, help='Model directory')
+    query_parser.add_argument('drink', help='Drink name or drink_id')
+    query_parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='Maximum recommendations')
+
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        if args.drinks and not args.ingredients:
+            parser.error('--ingredients is required with --drinks')
+        conn = None if args.drinks else db.connect()
+        try:
+            if args.drinks:
+                data_version = file_snapshot_version(
+                    path for path in (args.drinks, args.ingredients, args.ingredient_catalog) if path)
+            else:
+                data_version = fetch_data_version(conn)
+            if args.if_changed and current_data_version(args.model_dir) == data_version:
+                print(f"✓ Model is up to date with data version {data_version}")
+                return
+            if args.drinks:
+                drinks = read_training_csvs(args.drinks, args.ingredients, args.ingredient_catalog)
+            else:
+                drinks = fetch_training_drinks(conn)
+        finally:
+            if conn is not None:
+                conn.close()
+        start = time.perf_counter()
+        model = RecommenderModel.train(drinks)
+        model.data_version = data_version
+        version = model.save(args.model_dir, args.keep)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Trained {len(drinks)} drinks x {model.matrix.shape[1]} features in {elapsed:.2f}s")
+        print(f"  - published {os.path.join(args.model_dir, version)}")
+        return
+
+    try:
+        store = ModelStore(args.model_dir)
+    except FileNotFoundError:
+        print(f"Error: no model in '{args.model_dir}'. Run 'recommender.py train' first.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == 'query':
+        model = store.model
+        row = model.row_for(int(args.drink)) if args.drink.isdigit() else model.row_for(name=args.drink)
+        if row is None:
+            print(f"Error: drink '{args.drink}' not found.", file=sys.stderr)
+            sys.exit(1)
+        for rec in model.recommend_rows([row], clamp_limit(args.limit))[0]:
+            print(f"  {rec['similarity']:.3f}  {rec['name']} (#{rec['drink_id']})")
+        return
+
+    store.watch(args.reload_interval)
+    cache = QueryCache(max_entries=args.cache_size, ttl=args.cache_ttl)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(store, cache))
+    print(f"Recommender running on http://{args.host}:{args.port} (model {store.model.version})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Refresh derived data incrementally from the catalog change log.
+
+database/change_log.sql adds row triggers to drinks, ingredients and
+drink_ingredients. Each trigger records the changed row and its changed columns
+in catalog_change_log and sends NOTIFY catalog_changes. This daemon LISTENs on
+that channel and waits for a burst of edits to settle. It then recomputes, in
+one transaction, only the derived rows that the changes affect:
+
+    ingredient added or renamed      -> liquor classification (classify_liquors.sql)
+    drink added or renamed           -> garnish from update_garnishes.sql, if it has none
+    amount or unit edited            -> drink_ingredients.amount_ml / is_approximate
+    names, garnish, recipe rows      -> drinks.search_document (drink_search.sql)
+    amounts, abv, build_method       -> drink_stats rows
+    recipe rows, ingredient names    -> ingredient_substitutes (only lists that changed)
+
+Finally it stamps a new catalog data version so query caches drop stale results
+(see query_cache.py). A step is skipped when its table or SQL function isn't
+installed. Handled log entries are deleted in the same transaction, so a failed
+refresh is retried on the next notification or sweep.
+
+A renamed ingredient is reclassified from its new name: a 'Liquor' classification
+that no longer matches is cleared to NULL, since the category it had before
+classification isn't kept. An UPDATE that sets category or subcategory along
+with the name keeps the values it wrote.
+
+Usage:
+    python refresh_daemon.py --install              # create the change log and triggers
+    python refresh_daemon.py                        # listen and refresh
+    python refresh_daemon.py --once                 # process pending changes and exit
+    python refresh_daemon.py --debounce 2 --max-delay 30
+"""
+
+import argparse
+import os
+import re
+import select
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+import db
+from drink_stats import compute_drink_stats, dilution_for_methods, load_recipe_arrays, replace_drink_stats_rows
+from quantities import to_ml
+from query_cache import stamp_data_version
+from substitutions import compute_substitutes, load_ingredient_arrays, sync_substitutes
+
+CHANNEL = 'catalog_changes'
+# Session setting that stops the triggers from logging the daemon's own writes
+REFRESHING_SETTING = 'drinksdb.refreshing'
+CHANGE_LOG_FILE = os.path.join(db.PROJECT_ROOT, 'database', 'change_log.sql')
+GARNISH_UPDATES_FILE = os.path.join(db.PROJECT_ROOT, 'database', 'update_garnishes.sql')
+
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_SWEEP_SECONDS = 60.0
+DEFAULT_BATCH_SIZE = 5000
+
+CHANGE_FIELDS = ['change_id', 'table_name', 'operation', 'drink_id', 'ingredient_id', 'columns']
+KEY_COLUMNS = {'drink_id', 'ingredient_id'}
+SEARCH_COLUMNS = {'name', 'garnish', 'description'}
+QUANTITY_COLUMNS = {'amount', 'unit', 'amount_ml', 'is_approximate'}
+SUBSTITUTE_COLUMNS = {'name', 'category', 'subcategory'}
+
+GARNISH_UPDATE_PATTERN = re.compile(
+    r"^UPDATE drinks SET garnish = '((?:[^']|'')*)' WHERE LOWER\(name\) = LOWER\('((?:[^']|'')*)'\);", re.M)
+
+
+class RefreshPlan:
+    """Derived rows to recompute for one batch of change log entries."""
+
+    def __init__(self):
+        self.classify_ingredients = set()
+        self.garnish_drinks = set()
+        self.amount_ml_rows = set()       # (drink_id, ingredient_id)
+        self.search_drinks = set()
+        self.search_ingredients = set()   # renamed: every drink using them needs a new document
+        self.stats_drinks = set()
+        self.stats_ingredients = set()    # abv changed: every drink using them needs new stats
+        self.substitutes = False
+
+    def __bool__(self) -> bool:
+        return bool(self.classify_ingredients or self.garnish_drinks or self.amount_ml_rows or self.search_drinks
+                    or self.search_ingredients or self.stats_drinks or self.stats_ingredients or self.substitutes)
+
+
+def plan_refresh(changes: Iterable[Dict]) -> RefreshPlan:
+    """
+    Map change log entries to the derived rows they invalidate.
+
+    An INSERT lists the columns it set, an UPDATE the columns it changed. Changes to derived
+    columns only (search_document, or an explicit amount_ml) don't trigger their own recompute.
+    """
+    plan = RefreshPlan()
+    for change in changes:
+        table, operation = change['table_name'], change['operation']
+        drink_id, ingredient_id = change.get('drink_id'), change.get('ingredient_id')
+        columns = set(change.get('columns') or ())
+
+        if table == 'drinks':
+            # Deleted drinks take their drink_stats row with them; their recipe rows log their own deletes
+            if operation == 'DELETE':
+                continue
+            if 'name' in columns:
+                plan.garnish_drinks.add(drink_id)
+            if columns & (SEARCH_COLUMNS | KEY_COLUMNS):
+                plan.search_drinks.add(drink_id)
+            if columns & ({'build_method'} | KEY_COLUMNS):
+                plan.stats_drinks.add(drink_id)
+
+        elif table == 'drink_ingredients':
+            if operation == 'DELETE':
+                plan.search_drinks.add(drink_id)
+                plan.stats_drinks.add(drink_id)
+                plan.substitutes = True
+                continue
+            if columns & {'amount', 'unit'} and 'amount_ml' not in columns:
+                plan.amount_ml_rows.add((drink_id, ingredient_id))
+            if columns & (QUANTITY_COLUMNS | KEY_COLUMNS):
+                plan.stats_drinks.add(drink_id)
+            if columns & KEY_COLUMNS:
+                plan.search_drinks.add(drink_id)
+                plan.substitutes = True
+
+        elif table == 'ingredients':
+            if operation == 'DELETE':
+                plan.substitutes = True
+                continue
+            # A rename is reclassified unless the same write set the classification itself
+            if 'name' in columns and (operation == 'INSERT' or not columns & {'category', 'subcategory'}):
+                plan.classify_ingredients.add(ingredient_id)
+            if 'name' in columns:
+                plan.search_ingredients.add(ingredient_id)
+            if columns & SUBSTITUTE_COLUMNS:
+                plan.substitutes = True
+            if 'abv' in columns:
+                plan.stats_ingredients.add(ingredient_id)
+    return plan
+
+
+class Debouncer:
+    """A burst of notifications is due once quiet for `quiet` seconds, or `max_delay` after its first one."""
+
+    def __init__(self, quiet: float = DEFAULT_DEBOUNCE_SECONDS, max_delay: float = DEFAULT_MAX_DELAY_SECONDS):
+        self.quiet = quiet
+        self.max_delay = max_delay
+        self.first = None
+        self.last = None
+
+    def notify(self, now: float) -> None:
+        if self.first is None:
+            self.first = now
+        self.last = now
+
+    def seconds_until_due(self, now: float) -> Optional[float]:
+        """0.0 when due, None when nothing is pending."""
+        if self.first is None:
+            return None
+        return max(0.0, min(self.last + self.quiet, self.first + self.max_delay) - now)
+
+    def reset(self) -> None:
+        self.first = self.last = None
+
+
+def load_garnish_updates(path: str = GARNISH_UPDATES_FILE) -> Dict[str, str]:
+    """lowercased drink name -> garnish, from the generated update_garnishes.sql statements."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return {name.replace("''", "'").lower(): garnish.replace("''", "'")
+            for garnish, name in GARNISH_UPDATE_PATTERN.findall(content)}
+
+
+def has_relation(cursor, name: str) -> bool:
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', (name,))
+    return cursor.fetchone()[0]
+
+
+def has_function(cursor, signature: str) -> bool:
+    cursor.execute('SELECT to_regprocedure(%s) IS NOT NULL', (signature,))
+    return cursor.fetchone()[0]
+
+
+def drinks_using(cursor, ingredient_ids: Iterable[int]) -> set:
+    ingredient_ids = sorted(ingredient_ids)
+    if not ingredient_ids:
+        return set()
+    cursor.execute('SELECT DISTINCT drink_id FROM drink_ingredients WHERE ingredient_id = ANY(%s)', (ingredient_ids,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def apply_plan(conn, plan: RefreshPlan, garnishes: Dict[str, str]) -> Dict[str, int]:
+    """Recompute the planned derived rows inside the current transaction; returns counts per step."""
+    counts = {}
+    cursor = conn.cursor()
+    cursor.execute(f"SET LOCAL {REFRESHING_SETTING} = 'on'")
+
+    if plan.classify_ingredients and has_function(cursor, 'classify_liquor_ingredients(integer[])'):
+        cursor.execute('SELECT classify_liquor_ingredients(%s)', (sorted(plan.classify_ingredients),))
+        counts['classified'] = len(plan.classify_ingredients)
+
+    if plan.garnish_drinks and garnishes:
+        cursor.execute('SELECT drink_id, name FROM drinks WHERE drink_id = ANY(%s) AND garnish IS NULL',
+                       (sorted(plan.garnish_drinks),))
+        updates = [(garnishes[name.lower()], drink_id) for drink_id, name in cursor.fetchall()
+                   if name and name.lower() in garnishes]
+        cursor.executemany('UPDATE drinks SET garnish = %s WHERE drink_id = %s', updates)
+        counts['garnishes'] = len(updates)
+
+    if plan.amount_ml_rows:
+        drink_ids, ingredient_ids = zip(*sorted(plan.amount_ml_rows))
+        cursor.execute(
+            """SELECT di.drink_id, di.ingredient_id, di.amount, di.unit
+               FROM drink_ingredients di
+               JOIN unnest(%s::int[], %s::int[]) AS t(drink_id, ingredient_id)
+                 ON t.drink_id = di.drink_id AND t.ingredient_id = di.ingredient_id""",
+            (list(drink_ids), list(ingredient_ids)),
+        )
+        updates = [(*to_ml(amount, unit), drink_id, ingredient_id)
+                   for drink_id, ingredient_id, amount, unit in cursor.fetchall()]
+        cursor.executemany('UPDATE drink_ingredients SET amount_ml = %s, is_approximate = %s '
+                           'WHERE drink_id = %s AND ingredient_id = %s', updates)
+        counts['amount_ml'] = len(updates)
+
+    search_drinks = plan.search_drinks | drinks_using(cursor, plan.search_ingredients)
+    if search_drinks and has_function(cursor, 'refresh_drink_search_documents(integer[])'):
+        cursor.execute('SELECT refresh_drink_search_documents(%s)', (sorted(search_drinks),))
+        counts['search_documents'] = cursor.fetchone()[0]
+
+    stats_drinks = sorted(plan.stats_drinks | drinks_using(cursor, plan.stats_ingredients))
+    if stats_drinks and has_relation(cursor, 'drink_stats'):
+        drink_ids, build_methods, recipe = load_recipe_arrays(conn, stats_drinks)
+        stats = compute_drink_stats(
+            recipe['drink_index'], recipe['amount_ml'], recipe['abv'],
+            recipe['is_approximate'], dilution_for_methods(build_methods),
+        )
+        replace_drink_stats_rows(conn, drink_ids, stats, stats_drinks)
+        counts['drink_stats'] = len(drink_ids)
+
+    if plan.substitutes and has_relation(cursor, 'ingredient_substitutes'):
+        ingredient_ids, drink_index, ingredient_index, catalog = load_ingredient_arrays(conn)
+        substitutes = compute_substitutes(drink_index, ingredient_index, catalog['names'], catalog['categories'],
+                                          catalog['subcategories'])
+        counts['substitute_lists'] = sync_substitutes(conn, ingredient_ids, substitutes)
+
+    if plan and has_relation(cursor, 'catalog_metadata'):
+        stamp_data_version(conn, commit=False)
+    cursor.close()
+    return counts
+
+
+def process_pending(conn, garnishes: Dict[str, str], batch_size: int = DEFAULT_BATCH_SIZE) -> Counter:
+    """Refresh from every pending change log entry, one transaction per batch; returns totals."""
+    totals = Counter()
+    while True:
+        cursor = conn.cursor()
+        # SKIP LOCKED lets a second daemon work on other entries instead of waiting
+        cursor.execute(f"SELECT {', '.join(CHANGE_FIELDS)} FROM catalog_change_log "
+                       "ORDER BY change_id LIMIT %s FOR UPDATE SKIP LOCKED", (batch_size,))
+        changes = [dict(zip(CHANGE_FIELDS, row)) for row in cursor.fetchall()]
+        if not changes:
+            conn.rollback()
+            cursor.close()
+            return totals
+        try:
+            counts = apply_plan(conn, plan_refresh(changes), garnishes)
+            cursor.execute('DELETE FROM catalog_change_log WHERE change_id = ANY(%s)',
+                           ([change['change_id'] for change in changes],))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        totals['changes'] += len(changes)
+        totals.update(counts)
+        if len(changes) < batch_size:
+            return totals
+
+
+def install_change_log(conn) -> None:
+    with open(CHANGE_LOG_FILE, 'r', encoding='utf-8') as f:
+        sql = f.read()
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    conn.commit()
+    cursor.close()
+
+
+def print_totals(totals: Counter, elapsed: float) -> None:
+    if not totals['changes']:
+        return
+    steps = ', '.join(f"{name.replace('_', ' ')} {count}" for name, count in totals.items() if name != 'changes')
+    print(f"✓ Refreshed from {totals['changes']} changes in {elapsed * 1000:.0f} ms"
+          + (f": {steps}" if steps else ''), flush=True)
+
+
+def refresh(conn, garnishes: Dict[str, str], batch_size: int) -> None:
+    start = time.perf_counter()
+    print_totals(process_pending(conn, garnishes, batch_size), time.perf_counter() - start)
+
+
+def listen(args, garnishes: Dict[str, str]) -> None:
+    """LISTEN for change notifications and refresh once each burst settles."""
+    listen_conn = db.connect()
+    listen_conn.autocommit = True
+    listen_conn.cursor().execute(f'LISTEN {CHANNEL}')
+    work_conn = db.connect()
+    debouncer = Debouncer(args.debounce, args.max_delay)
+
+    # Catch up on changes made while the daemon wasn't running
+    refresh(work_conn, garnishes, args.batch_size)
+    last_sweep = time.monotonic()
+    print(f"Listening on {CHANNEL} (debounce {args.debounce}s, max delay {args.max_delay}s)", flush=True)
+
+    while True:
+        now = time.monotonic()
+        timeout = debouncer.seconds_until_due(now)
+        if timeout is None:
+            timeout = max(0.0, last_sweep + args.sweep_interval - now)
+        if select.select([listen_conn], [], [], timeout)[0]:
+            listen_conn.poll()
+            if listen_conn.notifies:
+                listen_conn.notifies.clear()
+                debouncer.notify(time.monotonic())
+
+        now = time.monotonic()
+        due = debouncer.seconds_until_due(now)
+        # The periodic sweep picks up anything whose notification was missed (e.g. a failed refresh)
+        if due == 0.0 or (due is None and now - last_sweep >= args.sweep_interval):
+            debouncer.reset()
+            last_sweep = now
+            try:
+                refresh(work_conn, garnishes, args.batch_size)
+            except Exception as e:
+                if work_conn.closed:
+                    raise
+                print(f"Error refreshing derived data (will retry): {e}", file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally refresh derived tables from the change log')
+    parser.add_argument('--install', action='store_true', help='Create the change log table and triggers first')
+    parser.add_argument('--once', action='store_true', help='Process pending changes and exit')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                        help='Seconds without new notifications before refreshing (default: 1)')
+    parser.add_argument('--max-delay', type=float, default=DEFAULT_MAX_DELAY_SECONDS,
+                        help='Refresh at most this many seconds after the first notification (default: 10)')
+    parser.add_argument('--sweep-interval', type=float, default=DEFAULT_SWEEP_SECONDS,
+                        help='Seconds between checks for entries without a notification (default: 60)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Change log entries per transaction (default: 5000)')
+    args = parser.parse_args()
+
+    garnishes = load_garnish_updates()
+    try:
+        if args.install or args.once:
+            conn = db.connect()
+            try:
+                if args.install:
+                    install_change_log(conn)
+                    print(f"✓ Installed change log triggers from {CHANGE_LOG_FILE}")
+                if args.once:
+                    refresh(conn, garnishes, args.batch_size)
+            finally:
+                conn.close()
+        if not args.once:
+            listen(args, garnishes)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
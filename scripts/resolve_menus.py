@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Resolve menu entries to drinks once, at build time, and store the drink_id.
+
+The menu SQL files link exact (case-insensitive) name matches when they load.
+This stage also handles names that don't match exactly: it tries the canonical
+name key from validate_tables.py (case, accents, whitespace), then the name
+without a leading "The" or a trailing "(gin)" note, then difflib fuzzy
+matching. It prints a confidence report, and with --apply writes the accepted
+matches to the menu's drink_id column, so the menu endpoints join on
+m.drink_id = d.drink_id.
+
+Usage:
+    python resolve_menus.py                        # report only
+    python resolve_menus.py --apply                # store accepted matches
+    python resolve_menus.py --menu game_night_menu --min-confidence 0.9 --strict
+"""
+
+import argparse
+import csv
+import difflib
+import re
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import db
+from validate_tables import canonical_name_key
+
+# Name columns to try for each menu table, most specific first
+MENU_NAME_COLUMNS = {
+    'game_night_menu': ['drink_name'],
+    'drinks_with_risha_menu': ['db_drink_name', 'drink_name'],
+}
+
+DEFAULT_MIN_CONFIDENCE = 0.85
+# Fuzzy matches closer than this to the runner-up are reported as ambiguous, not applied
+AMBIGUITY_MARGIN = 0.03
+NORMALIZED_CONFIDENCE = 0.95
+
+REPORT_FIELDS = ['menu', 'menu_id', 'menu_name', 'drink_id', 'drink_name', 'method', 'confidence', 'status',
+                 'previous_drink_id']
+
+
+def simplify_menu_name(key: str) -> str:
+    """Drop menu decoration from a canonical key: 'the bijou' -> 'bijou', 'dirty martini (gin)' -> 'dirty martini'."""
+    key = re.sub(r'\s*\([^)]*\)\s*', ' ', key)
+    key = re.sub(r'^(the|a|an)\s+', '', key.strip())
+    return ' '.join(key.split())
+
+
+def build_drink_registry(drinks: List[Tuple[int, str]]) -> Dict[str, List[Tuple[int, str]]]:
+    """canonical_name_key -> [(drink_id, name)]; more than one entry means the name is ambiguous."""
+    registry = defaultdict(list)
+    for drink_id, name in drinks:
+        registry[canonical_name_key(name)].append((drink_id, name))
+    return registry
+
+
+def resolve_name(name: Optional[str], registry: Dict[str, List[Tuple[int, str]]]) -> Dict:
+    """Best drink for one menu name: {'drink_id', 'drink_name', 'method', 'confidence', 'ambiguous'}."""
+    unresolved = {'drink_id': None, 'drink_name': None, 'method': None, 'confidence': 0.0, 'ambiguous': False}
+    key = canonical_name_key(name)
+    if not key:
+        return unresolved
+
+    for candidate, method, confidence in ((key, 'exact', 1.0),
+                                          (simplify_menu_name(key), 'normalized', NORMALIZED_CONFIDENCE)):
+        matches = registry.get(candidate)
+        if matches:
+            drink_id, drink_name = matches[0]
+            return {'drink_id': drink_id, 'drink_name': drink_name, 'method': method,
+                    'confidence': confidence, 'ambiguous': len(matches) > 1}
+
+    simplified = simplify_menu_name(key)
+    scored = []
+    for candidate in {key, simplified}:
+        for match in difflib.get_close_matches(candidate, registry, n=3, cutoff=0.6):
+            scored.append((difflib.SequenceMatcher(None, candidate, match).ratio(), match))
+    if not scored:
+        return unresolved
+    scored.sort(reverse=True)
+    best_score, best_key = scored[0]
+    runner_up = next((score for score, match in scored[1:] if match != best_key), 0.0)
+    drink_id, drink_name = registry[best_key][0]
+    return {'drink_id': drink_id, 'drink_name': drink_name, 'method': 'fuzzy', 'confidence': round(best_score, 3),
+            'ambiguous': len(registry[best_key]) > 1 or best_score - runner_up < AMBIGUITY_MARGIN}
+
+
+def resolve_entries(entries: List[Dict], drinks: List[Tuple[int, str]],
+                    min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> List[Dict]:
+    """
+    Resolve menu entries ({'menu_id', 'names': [...], 'drink_id'}) against (drink_id, name) pairs.
+
+    Each name is tried in order and the most confident match wins. status is 'ok' (matches the
+    stored drink_id), 'update' (would change it), 'low-confidence', 'ambiguous' or 'unresolved'.
+    """
+    registry = build_drink_registry(drinks)
+    results = []
+    for entry in entries:
+        best = None
+        for name in entry['names']:
+            match = resolve_name(name, registry)
+            if match['drink_id'] is not None and (best is None or match['confidence'] > best['confidence']):
+                best = dict(match, menu_name=name)
+        if best is None:
+            best = {'drink_id': None, 'drink_name': None, 'method': None, 'confidence': 0.0, 'ambiguous': False,
+                    'menu_name': next((name for name in entry['names'] if name), None)}
+            status = 'unresolved'
+        elif best['ambiguous']:
+            status = 'ambiguous'
+        elif best['confidence'] < min_confidence:
+            status = 'low-confidence'
+        elif best['drink_id'] == entry.get('drink_id'):
+            status = 'ok'
+        else:
+            status = 'update'
+        results.append({
+            'menu_id': entry['menu_id'],
+            'menu_name': best['menu_name'],
+            'drink_id': best['drink_id'],
+            'drink_name': best['drink_name'],
+            'method': best['method'],
+            'confidence': best['confidence'],
+            'status': status,
+            'previous_drink_id': entry.get('drink_id'),
+        })
+    return results
+
+
+def fetch_menu_entries(conn, menu: str) -> List[Dict]:
+    """Load menu rows with the names to try and the currently stored drink_id."""
+    columns = MENU_NAME_COLUMNS[menu]
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT menu_id, {', '.join(columns)}, drink_id FROM {menu} ORDER BY display_order, menu_id")
+    entries = [{'menu_id': row[0], 'names': [name for name in row[1:-1] if name], 'drink_id': row[-1]}
+               for row in cursor.fetchall()]
+    cursor.close()
+    return entries
+
+
+def fetch_drinks(conn) -> List[Tuple[int, str]]:
+    cursor = conn.cursor()
+    cursor.execute('SELECT drink_id, name FROM drinks ORDER BY drink_id')
+    drinks = cursor.fetchall()
+    cursor.close()
+    return drinks
+
+
+def apply_matches(conn, menu: str, results: List[Dict]) -> int:
+    """Store drink_id for every 'update' result in one transaction; returns rows changed."""
+    updates = [(result['drink_id'], result['menu_id']) for result in results if result['status'] == 'update']
+    if updates:
+        cursor = conn.cursor()
+        cursor.executemany(f"UPDATE {menu} SET drink_id = %s WHERE menu_id = %s", updates)
+        cursor.close()
+    conn.commit()
+    return len(updates)
+
+
+def print_report(menu: str, results: List[Dict]) -> None:
+    print(f"{menu}:")
+    for result in results:
+        target = f"{result['drink_name']} (#{result['drink_id']})" if result['drink_id'] is not None else '-'
+        method = result['method'] or '-'
+        print(f"  {result['status']:<15} {result['menu_name'] or '?':<30} -> {target:<30} "
+              f"{method:<10} {result['confidence']:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve menu drink names to drink_id foreign keys')
+    parser.add_argument('--menu', choices=sorted(MENU_NAME_COLUMNS), action='append',
+                        help='Menu table to resolve (repeatable; default: all)')
+    parser.add_argument('--min-confidence', type=float, default=DEFAULT_MIN_CONFIDENCE,
+                        help='Minimum fuzzy match confidence to apply (default: 0.85)')
+    parser.add_argument('--apply', action='store_true', help='Write accepted matches to the menu tables')
+    parser.add_argument('--report', help='Optional CSV file for the full confidence report')
+    parser.add_argument('--strict', action='store_true',
+                        help='Exit with status 1 if any entry is unresolved, ambiguous or low-confidence')
+    args = parser.parse_args()
+
+    menus = args.menu or sorted(MENU_NAME_COLUMNS)
+    report_rows = []
+    conn = db.connect()
+    try:
+        drinks = fetch_drinks(conn)
+        for menu in menus:
+            results = resolve_entries(fetch_menu_entries(conn, menu), drinks, args.min_confidence)
+            print_report(menu, results)
+            if args.apply:
+                changed = apply_matches(conn, menu, results)
+                print(f"✓ Updated {changed} {menu} rows")
+            report_rows.extend(dict(result, menu=menu) for result in results)
+    except Exception as e:
+        print(f"Error resolving menus: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(report_rows)
+        print(f"✓ Wrote {args.report}")
+
+    problems = [row for row in report_rows if row['status'] in ('unresolved', 'ambiguous', 'low-confidence')]
+    if problems:
+        print(f"⚠ {len(problems)} menu entries need attention (set db_drink_name or fix the drink name)",
+              file=sys.stderr)
+        if args.strict:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
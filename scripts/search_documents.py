@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Build per-drink full-text search documents during ingestion.
+
+Each drink's name, ingredient names, garnish and description are combined into
+a weighted document and loaded into drinks.search_document (a tsvector searched
+by the search_drinks() SQL function in database/drink_search.sql). The same
+documents and tokenizer feed the offline BM25 index in search_index.py.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+# tsvector weight per field (A is ranked highest by ts_rank)
+SEARCH_FIELD_WEIGHTS = {
+    'name': 'A',
+    'ingredients': 'B',
+    'garnish': 'C',
+    'description': 'D',
+}
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'as', 'at', 'by', 'for', 'from', 'in', 'into', 'of', 'on', 'or',
+    'the', 'to', 'with', 'up', 'it', 'is', 'then', 'over',
+}
+
+
+def escape_sql_string(s: Optional[str]) -> str:
+    """Escape single quotes in SQL strings."""
+    if s is None:
+        return 'NULL'
+    return "'" + str(s).replace("'", "''") + "'"
+
+
+def fold_accents(text: str) -> str:
+    """Strip accents so 'Crème' and 'Creme' match."""
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase, accent-fold and split text into search terms."""
+    if not text:
+        return []
+    words = re.findall(r'[a-z0-9]+', fold_accents(text).lower())
+    return [word for word in words if word not in STOP_WORDS]
+
+
+def build_search_document(drink: Dict, ingredient_names: Iterable[str]) -> Dict[str, str]:
+    """Combine a drink's searchable text into one field -> text document."""
+    return {
+        'name': drink.get('name') or '',
+        'ingredients': ' '.join(ingredient_names),
+        'garnish': drink.get('garnish') or '',
+        'description': drink.get('description') or '',
+    }
+
+
+def generate_search_documents_sql(drinks: List[Dict], drink_ingredients: List[Dict]) -> str:
+    """Generate one UPDATE that loads drinks.search_document for every drink."""
+    ingredients_by_drink = defaultdict(list)
+    for di in drink_ingredients:
+        ingredients_by_drink[di.get('drink_name', '')].append(di.get('ingredient_name', ''))
+
+    values = []
+    for drink in drinks:
+        document = build_search_document(drink, ingredients_by_drink.get(drink.get('name', ''), []))
+        values.append(
+            f"({escape_sql_string(document['name'])}, {escape_sql_string(document['ingredients'])}, "
+            f"{escape_sql_string(document['garnish'])}, {escape_sql_string(document['description'])})"
+        )
+
+    if not values:
+        return ''
+
+    vector = ' || '.join(
+        f"setweight(to_tsvector('english', COALESCE(v.{field}, '')), '{weight}')"
+        for field, weight in SEARCH_FIELD_WEIGHTS.items()
+    )
+    sql = "-- Build weighted full-text search documents\n"
+    sql += f"UPDATE drinks d SET search_document = {vector}\nFROM (VALUES\n"
+    sql += ",\n".join(values)
+    sql += f"\n) AS v({', '.join(SEARCH_FIELD_WEIGHTS)})\nWHERE d.name = v.name;\n\n"
+    return sql
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+In-process BM25 index over drink search documents.
+
+Ranks the same weighted documents the ingestion scripts load into
+drinks.search_document (see search_documents.py), for offline or embedded use
+without a database. Matching follows search_drinks() in drink_search.sql: every
+query word is a prefix ('lim' matches 'lime' and 'limes') and a drink must
+match all of them. Differences from the SQL search:
+    - words are not stemmed (Postgres' english config is), so 'lemons' does
+      not match a document that only says 'lemon'; the prefix rule covers
+      the other direction
+    - stop words are the list in search_documents.py, not Postgres' list
+    - results are ranked by BM25F rather than ts_rank
+
+Usage:
+    python search_index.py build --output search_index.npz
+    python search_index.py query search_index.npz "gin lime"
+"""
+
+import argparse
+import bisect
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+import db
+from search_documents import build_search_document, tokenize
+
+# BM25F field boosts, in the same order as the tsvector weights in search_documents.py
+BM25_FIELD_BOOSTS = {
+    'name': 3.0,
+    'ingredients': 2.0,
+    'garnish': 1.0,
+    'description': 0.5,
+}
+
+
+class BM25Index:
+    """
+    BM25F inverted index over drink search documents.
+
+    Postings are stored as flat NumPy arrays (term -> slice of doc/weight arrays),
+    so scoring a query is a handful of vectorized adds over the matching postings.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_ids = np.zeros(0, dtype=np.int64)
+        self.doc_names: List[str] = []
+        self.doc_lengths = np.zeros(0, dtype=np.float32)
+        self.terms: Dict[str, int] = {}
+        self.term_list: List[str] = []  # sorted; position == term index, for prefix lookups
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.postings_doc = np.zeros(0, dtype=np.int32)
+        self.postings_tf = np.zeros(0, dtype=np.float32)
+
+    def build(self, documents: Iterable[Tuple[int, Dict[str, str]]]) -> 'BM25Index':
+        """Index (doc_id, field -> text) pairs."""
+        postings = defaultdict(list)
+        doc_ids = []
+        doc_names = []
+        doc_lengths = []
+
+        for position, (doc_id, fields) in enumerate(documents):
+            weighted_tf = Counter()
+            length = 0.0
+            for field, boost in BM25_FIELD_BOOSTS.items():
+                tokens = tokenize(fields.get(field))
+                length += boost * len(tokens)
+                for token in tokens:
+                    weighted_tf[token] += boost
+            for token, tf in weighted_tf.items():
+                postings[token].append((position, tf))
+            doc_ids.append(doc_id)
+            doc_names.append(fields.get('name', ''))
+            doc_lengths.append(length)
+
+        self.doc_ids = np.array(doc_ids, dtype=np.int64)
+        self.doc_names = doc_names
+        self.doc_lengths = np.array(doc_lengths, dtype=np.float32)
+
+        self.terms = {}
+        self.term_list = sorted(postings)
+        offsets = [0]
+        all_docs = []
+        all_tfs = []
+        for term in self.term_list:
+            entries = postings[term]
+            self.terms[term] = len(offsets) - 1
+            all_docs.extend(position for position, _ in entries)
+            all_tfs.extend(tf for _, tf in entries)
+            offsets.append(offsets[-1] + len(entries))
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.postings_doc = np.array(all_docs, dtype=np.int32)
+        self.postings_tf = np.array(all_tfs, dtype=np.float32)
+        return self
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[int, str, float]]:
+        """Return up to limit (doc_id, name, score) tuples, best first."""
+        n_docs = len(self.doc_ids)
+        if n_docs == 0:
+            return []
+
+        query_words = set(tokenize(query))
+        if not query_words:
+            return []
+
+        avg_length = float(self.doc_lengths.mean()) or 1.0
+        scores = np.zeros(n_docs, dtype=np.float32)
+        matches_all = np.ones(n_docs, dtype=bool)
+
+        for word in query_words:
+            matches_word = np.zeros(n_docs, dtype=bool)
+            # Every indexed term starting with the word, like the ':*' prefix query in SQL
+            lo = bisect.bisect_left(self.term_list, word)
+            hi = bisect.bisect_left(self.term_list, word + '\uffff')
+            for term_index in range(lo, hi):
+                start, end = self.offsets[term_index], self.offsets[term_index + 1]
+                docs = self.postings_doc[start:end]
+                tf = self.postings_tf[start:end]
+                df = end - start
+                idf = np.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                norm = self.k1 * (1.0 - self.b + self.b * self.doc_lengths[docs] / avg_length)
+                # Each doc appears once per term's postings, so fancy-index += is safe
+                scores[docs] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+                matches_word[docs] = True
+            matches_all &= matches_word
+
+        candidates = np.flatnonzero(matches_all)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(self.doc_ids[i]), self.doc_names[i], float(scores[i])) for i in ranked]
+
+    def save(self, filename: str) -> None:
+        """Save the index as an uncompressed .npz file (plain arrays only, so loading needs no pickle)."""
+        np.savez(
+            filename,
+            params=np.array([self.k1, self.b]),
+            doc_ids=self.doc_ids,
+            doc_names=np.array(self.doc_names, dtype=str),
+            doc_lengths=self.doc_lengths,
+            terms=np.array(self.term_list, dtype=str),
+            offsets=self.offsets,
+            postings_doc=self.postings_doc,
+            postings_tf=self.postings_tf,
+        )
+
+    @classmethod
+    def load(cls, filename: str) -> 'BM25Index':
+        """Load an index written by save()."""
+        data = np.load(filename)
+        index = cls(k1=float(data['params'][0]), b=float(data['params'][1]))
+        index.doc_ids = data['doc_ids']
+        index.doc_names = data['doc_names'].tolist()
+        index.doc_lengths = data['doc_lengths']
+        index.term_list = data['terms'].tolist()
+        index.terms = {term: i for i, term in enumerate(index.term_list)}
+        index.offsets = data['offsets']
+        index.postings_doc = data['postings_doc']
+        index.postings_tf = data['postings_tf']
+        return index
+
+
+def fetch_search_documents(conn) -> List[Tuple[int, Dict[str, str]]]:
+    """Load (drink_id, document) pairs for every drink in one query."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """SELECT d.drink_id, d.name, d.garnish, d.description,
+                  STRING_AGG(i.name, ' ' ORDER BY i.name)
+           FROM drinks d
+           LEFT JOIN drink_ingredients di ON d.drink_id = di.drink_id
+           LEFT JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+           GROUP BY d.drink_id, d.name, d.garnish, d.description
+           ORDER BY d.drink_id"""
+    )
+    documents = [
+        (row[0], build_search_document({'name': row[1], 'garnish': row[2], 'description': row[3]},
+                                       [row[4]] if row[4] else []))
+        for row in cursor.fetchall()
+    ]
+    cursor.close()
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the offline BM25 drink search index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the index from the database')
+    build_parser.add_argument('--output', default='search_index.npz', help='Index file (default: search_index.npz)')
+
+    query_parser = subparsers.add_parser('query', help='Run a query against a saved index')
+    query_parser.add_argument('index', help='Index file written by build')
+    query_parser.add_argument('query', help='Search text, e.g. "gin lime"')
+    query_parser.add_argument('--limit', type=int, default=20, help='Maximum results (default: 20)')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        conn = db.connect()
+        try:
+            documents = fetch_search_documents(conn)
+        finally:
+            conn.close()
+        index = BM25Index().build(documents)
+        index.save(args.output)
+        print(f"✓ Indexed {len(documents)} drinks ({len(index.terms)} terms) -> {args.output}")
+        return
+
+    try:
+        index = BM25Index.load(args.index)
+    except FileNotFoundError:
+        print(f"Error: File '{args.index}' not found.", file=sys.stderr)
+        sys.exit(1)
+    start = time.perf_counter()
+    results = index.search(args.query, args.limit)
+    elapsed = time.perf_counter() - start
+    for drink_id, name, score in results:
+        print(f"  {score:7.3f}  {name} (#{drink_id})")
+    print(f"✓ {len(results)} results in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Build an event shopping list from a menu table.
+
+Resolves every menu drink's ingredients in one query, scales them by the
+expected servings per drink, sums them per ingredient with NumPy and converts
+the totals to bottles and cases.
+
+Usage:
+    python shopping_list.py --menu game_night_menu --default-servings 10
+    python shopping_list.py --menu drinks_with_risha_menu --servings servings.csv --output shopping_list.csv
+    python shopping_list.py --menu game_night_menu --guests 40 --drinks-per-guest 3
+
+servings.csv has columns drink_name,servings. Drinks not listed fall back to
+--default-servings.
+"""
+
+import argparse
+import csv
+import math
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+import db
+from quantities import normalize_unit, parse_amount
+
+# Menu tables that may be interpolated into queries (drink_id is resolved at load time, see resolve_menus.py)
+MENU_TABLES = {'game_night_menu', 'drinks_with_risha_menu'}
+
+# Bottle size in ml by ingredients.category (anything else uses DEFAULT_BOTTLE_ML)
+BOTTLE_ML_BY_CATEGORY = {
+    'Liquor': 750.0,
+    'Liqueur': 750.0,
+    'Wine': 750.0,
+    'Juice': 1000.0,
+    'Mixer': 1000.0,
+}
+DEFAULT_BOTTLE_ML = 750.0
+BOTTLES_PER_CASE = 12
+
+RECIPE_QUERY = """
+    SELECT d.name, i.ingredient_id, i.name, i.category, di.amount, di.unit, di.amount_ml, di.is_approximate
+    FROM {menu} m
+    JOIN drinks d ON m.drink_id = d.drink_id
+    JOIN drink_ingredients di ON di.drink_id = d.drink_id
+    JOIN ingredients i ON di.ingredient_id = i.ingredient_id
+    ORDER BY m.display_order, i.name
+"""
+
+
+def read_servings_file(filename: str) -> Dict[str, float]:
+    """Read drink_name,servings rows into a lowercase name -> servings map."""
+    servings = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                name = (row.get('drink_name') or '').strip()
+                if name:
+                    servings[name.lower()] = float(row.get('servings') or 0)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error reading '{filename}': {e}", file=sys.stderr)
+        sys.exit(1)
+    return servings
+
+
+def fetch_menu_recipes(conn, menu: str) -> List[tuple]:
+    """Fetch every (drink, ingredient) row for a menu in a single query."""
+    if menu not in MENU_TABLES:
+        raise ValueError(f"unknown menu table '{menu}'")
+    cursor = conn.cursor()
+    cursor.execute(RECIPE_QUERY.format(menu=menu))
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def build_shopping_list(rows: List[tuple], servings_by_drink: Dict[str, float],
+                        default_servings: float = 0.0, waste: float = 0.0) -> List[Dict]:
+    """
+    Scale and aggregate recipe rows into a shopping list.
+
+    rows are (drink_name, ingredient_id, ingredient_name, category, amount, unit, amount_ml, is_approximate).
+    Liquids are summed in ml per ingredient and rounded up to bottles; counted items (pcs, wheels) are
+    summed per (ingredient, unit), so '2 pcs' and '1 wheel' of the same ingredient stay separate lines.
+    waste is added to both before rounding up.
+    """
+    if not rows:
+        return []
+
+    ingredient_ids = np.array([row[1] for row in rows], dtype=np.int64)
+    servings = np.array(
+        [servings_by_drink.get(row[0].lower(), default_servings) for row in rows], dtype=np.float64
+    )
+    amount_ml = np.array([np.nan if row[6] is None else float(row[6]) for row in rows], dtype=np.float64)
+    counts = np.array([parse_amount(row[4]) or 0.0 for row in rows], dtype=np.float64)
+    approximate = np.array([bool(row[7]) for row in rows], dtype=bool)
+    has_volume = ~np.isnan(amount_ml)
+
+    # Group liquids by ingredient (unit code 0) and counted items by (ingredient, unit)
+    unit_codes = {}
+    unit_code = np.array(
+        [0 if has_volume[i] else unit_codes.setdefault(normalize_unit(row[5]), len(unit_codes) + 1)
+         for i, row in enumerate(rows)],
+        dtype=np.int64,
+    )
+    groups, group_index = np.unique(np.column_stack([ingredient_ids, unit_code]), axis=0, return_inverse=True)
+    group_index = group_index.ravel()
+    n = len(groups)
+
+    scale = servings * (1.0 + waste)
+    total_ml = np.bincount(group_index, weights=np.where(has_volume, amount_ml, 0.0) * scale, minlength=n)
+    total_count = np.bincount(group_index, weights=np.where(has_volume, 0.0, counts) * scale, minlength=n)
+    any_approximate = np.bincount(group_index, weights=approximate.astype(np.float64), minlength=n) > 0
+
+    # First row per group supplies its name/category/unit
+    first_row = np.full(n, -1, dtype=np.int64)
+    first_row[group_index[::-1]] = np.arange(len(rows))[::-1]
+    categories = [rows[i][3] for i in first_row]
+    bottle_ml = np.array([BOTTLE_ML_BY_CATEGORY.get(category, DEFAULT_BOTTLE_ML) for category in categories])
+    bottles = np.ceil(total_ml / bottle_ml - 1e-9).astype(np.int64)
+
+    shopping_list = []
+    for i in range(n):
+        row = rows[first_row[i]]
+        is_liquid = groups[i, 1] == 0
+        if is_liquid and total_ml[i] > 0:
+            shopping_list.append({
+                'ingredient_id': int(groups[i, 0]),
+                'ingredient': row[2],
+                'category': row[3],
+                'total_ml': round(float(total_ml[i]), 1),
+                'total_count': None,
+                'count_unit': None,
+                'bottle_ml': float(bottle_ml[i]),
+                'bottles': int(bottles[i]),
+                'cases': int(bottles[i] // BOTTLES_PER_CASE),
+                'loose_bottles': int(bottles[i] % BOTTLES_PER_CASE),
+                'approximate': bool(any_approximate[i]),
+            })
+        elif not is_liquid and total_count[i] > 0:
+            shopping_list.append({
+                'ingredient_id': int(groups[i, 0]),
+                'ingredient': row[2],
+                'category': row[3],
+                'total_ml': None,
+                'total_count': math.ceil(total_count[i] - 1e-9),
+                'count_unit': row[5],
+                'bottle_ml': None,
+                'bottles': None,
+                'cases': None,
+                'loose_bottles': None,
+                'approximate': bool(any_approximate[i]),
+            })
+
+    shopping_list.sort(key=lambda item: (-(item['total_ml'] or 0), item['ingredient'], item['count_unit'] or ''))
+    return shopping_list
+
+
+def print_shopping_list(shopping_list: List[Dict]) -> None:
+    """Print the shopping list as a readable table."""
+    for item in shopping_list:
+        flag = ' (approx.)' if item['approximate'] else ''
+        if item['total_ml'] is not None:
+            print(f"  {item['ingredient']:<40} {item['total_ml']:>9.1f} ml  "
+                  f"{item['bottles']:>4} x {item['bottle_ml']:.0f} ml "
+                  f"({item['cases']} cases + {item['loose_bottles']}){flag}")
+        else:
+            print(f"  {item['ingredient']:<40} {item['total_count']:>9} {item['count_unit']}{flag}")
+
+
+def write_shopping_list_csv(shopping_list: List[Dict], filename: str) -> None:
+    """Write the shopping list to a CSV file."""
+    fields = ['ingredient_id', 'ingredient', 'category', 'total_ml', 'total_count', 'count_unit',
+              'bottle_ml', 'bottles', 'cases', 'loose_bottles', 'approximate']
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(shopping_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a scaled shopping list for a menu')
+    parser.add_argument('--menu', required=True, choices=sorted(MENU_TABLES), help='Menu table to plan for')
+    parser.add_argument('--servings', help='CSV file with drink_name,servings')
+    parser.add_argument('--default-servings', type=float, default=0.0,
+                        help='Servings for drinks not listed in --servings (default: 0)')
+    parser.add_argument('--guests', type=int, help='Spread guests x drinks-per-guest evenly across the menu')
+    parser.add_argument('--drinks-per-guest', type=float, default=2.0, help='Used with --guests (default: 2)')
+    parser.add_argument('--waste', type=float, default=0.05, help='Extra fraction for spillage (default: 0.05)')
+    parser.add_argument('--output', help='Optional CSV file to write the shopping list to')
+
+    args = parser.parse_args()
+
+    servings_by_drink = read_servings_file(args.servings) if args.servings else {}
+
+    conn = db.connect()
+    try:
+        rows = fetch_menu_recipes(conn, args.menu)
+    finally:
+        conn.close()
+
+    menu_drinks = sorted({row[0] for row in rows})
+    default_servings = args.default_servings
+    if args.guests:
+        default_servings = args.guests * args.drinks_per_guest / max(len(menu_drinks), 1)
+
+    unknown = set(servings_by_drink) - {name.lower() for name in menu_drinks}
+    for name in sorted(unknown):
+        print(f"Warning: '{name}' is not on {args.menu} (or has no ingredients)", file=sys.stderr)
+
+    shopping_list = build_shopping_list(rows, servings_by_drink, default_servings, args.waste)
+
+    print(f"✓ Shopping list for {args.menu}")
+    print(f"  - {len(menu_drinks)} drinks, {len(shopping_list)} ingredients")
+    print_shopping_list(shopping_list)
+
+    if args.output:
+        write_shopping_list_csv(shopping_list, args.output)
+        print(f"✓ Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Compute ingredient substitutes from co-occurrence and load them into the
+ingredient_substitutes table.
+
+The drink x ingredient incidence matrix A gives the co-occurrence matrix
+C = A^T A. Two ingredients are good substitutes when they are used *with* the
+same things (cosine similarity of their rows of C) but rarely together, when
+they share a subcategory, or when an "X or Y" ingredient name lists them as
+alternatives. Everything is computed with sparse matrix products, and the top-K
+per ingredient is stored so that queries can look up substitutes instead of
+building the graph per request.
+
+Usage:
+    python substitutions.py                  # compute and load ingredient_substitutes
+    python substitutions.py --dry-run        # compute and print the top substitutes only
+    python substitutions.py --top-k 10 --min-score 0.1
+"""
+
+import argparse
+import io
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+import db
+
+DEFAULT_TOP_K = 5
+DEFAULT_MIN_SCORE = 0.05
+
+# Score = CONTEXT_WEIGHT * context cosine + bonuses - penalty
+CONTEXT_WEIGHT = 1.0
+# Context similarity of rarely used ingredients is shrunk by uses / (uses + CONTEXT_SHRINKAGE)
+CONTEXT_SHRINKAGE = 2.0
+SUBCATEGORY_BONUS = 0.5
+ALTERNATIVE_BONUS = 0.5
+# Scaled by co-occurrences / min(uses): ingredients used together complement rather than replace each other
+COOCCURRENCE_PENALTY = 0.5
+
+SUBSTITUTE_COLUMNS = ['ingredient_id', 'substitute_id', 'score', 'rank']
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ingredient_substitutes (
+    ingredient_id INT REFERENCES ingredients(ingredient_id) ON DELETE CASCADE,
+    substitute_id INT REFERENCES ingredients(ingredient_id) ON DELETE CASCADE,
+    score NUMERIC(6,4),
+    rank SMALLINT,
+    PRIMARY KEY (ingredient_id, substitute_id)
+);
+CREATE INDEX IF NOT EXISTS idx_ingredient_substitutes_substitute ON ingredient_substitutes(substitute_id);
+"""
+
+
+def name_alternatives(name: Optional[str]) -> List[str]:
+    """Split 'Bourbon or Rye Whiskey' into ['bourbon', 'rye whiskey']; other names map to themselves."""
+    return [part.strip().lower() for part in re.split(r'\s+or\s+', name or '', flags=re.IGNORECASE) if part.strip()]
+
+
+def name_tokens(name: Optional[str]) -> frozenset:
+    """Lowercase word tokens of a name: 'Brut Champagne' -> {'brut', 'champagne'}."""
+    return frozenset(re.findall(r'[a-z0-9]+', (name or '').lower()))
+
+
+def alternative_matrix(names: List[str]) -> sparse.csr_matrix:
+    """
+    Ingredient x ingredient, 1 where an "X or Y" name lists the other ingredient as an alternative.
+
+    An alternative matches an ingredient whose tokens are a subset of the alternative's. One-word
+    alternatives borrow the trailing words of the multi-word ones ('Bourbon or Rye Whiskey' reads as
+    'Bourbon Whiskey or Rye Whiskey'), so it pairs with 'Bourbon Whiskey', and 'Brut Champagne or Prosecco'
+    pairs with 'Champagne'. More specific names don't match: 'Cognac or Brandy' does not pair with 'Apricot Brandy'.
+    """
+    tokens = [name_tokens(name) for name in names]
+    postings = defaultdict(set)
+    for position, name_token_set in enumerate(tokens):
+        for token in name_token_set:
+            postings[token].add(position)
+
+    rows, cols = [], []
+    for position, name in enumerate(names):
+        alternatives = name_alternatives(name)
+        if len(alternatives) < 2:
+            continue
+        shared = name_tokens(' '.join(word for part in alternatives for word in part.split()[1:]))
+        parts = [name_tokens(part) | shared if len(part.split()) == 1 else name_tokens(part)
+                 for part in alternatives]
+        matches = set()
+        for part in parts:
+            # A subset shares at least one token, so the postings give every candidate
+            candidates = set().union(*(postings[token] for token in part))
+            matches.update(other for other in candidates if tokens[other] and tokens[other] <= part)
+        matches.discard(position)
+        for other in matches:
+            rows += [position, other]
+            cols += [other, position]
+    matrix = sparse.coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(names), len(names))).tocsr()
+    matrix.data[:] = 1.0  # pairs found from both names count once
+    return matrix
+
+
+def indicator_matrix(labels: List[List[str]]) -> sparse.csr_matrix:
+    """Rows = items, columns = distinct labels, 1 where the item has the label."""
+    vocabulary = {}
+    rows, cols = [], []
+    for row, item_labels in enumerate(labels):
+        for label in set(item_labels):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(label, len(vocabulary)))
+    return sparse.csr_matrix((np.ones(len(rows), dtype=np.float64), (rows, cols)),
+                             shape=(len(labels), len(vocabulary)))
+
+
+def compute_substitutes(drink_index: np.ndarray, ingredient_index: np.ndarray, names: List[str],
+                        categories: List[Optional[str]], subcategories: List[Optional[str]],
+                        top_k: int = DEFAULT_TOP_K, min_score: float = DEFAULT_MIN_SCORE) -> Dict[str, np.ndarray]:
+    """
+    Score substitute pairs and keep the top_k per ingredient.
+
+    drink_index/ingredient_index are parallel arrays of drink_ingredients rows (0-based positions).
+    Returns arrays 'ingredient', 'substitute', 'score', 'rank' (rank starts at 1), sorted by ingredient, rank.
+    """
+    n_ingredients = len(names)
+    n_drinks = int(drink_index.max()) + 1 if len(drink_index) else 0
+    incidence = sparse.csr_matrix((np.ones(len(drink_index)), (drink_index, ingredient_index)),
+                                  shape=(n_drinks, n_ingredients))
+    incidence.data[:] = 1.0  # duplicate rows count once
+    cooccurrence = (incidence.T @ incidence).tocsr()
+    uses = cooccurrence.diagonal()
+
+    # Context vectors: what each ingredient is used with, excluding itself
+    context = cooccurrence - sparse.diags(uses)
+    context.eliminate_zeros()
+    context.data = np.log1p(context.data)
+    norms = np.sqrt(np.asarray(context.multiply(context).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    confidence = np.sqrt(uses / (uses + CONTEXT_SHRINKAGE))
+    context = sparse.diags(confidence / norms) @ context
+    scores = CONTEXT_WEIGHT * (context @ context.T)
+
+    subcategory_labels = [[s.strip().lower()] if s and s.strip() else [] for s in subcategories]
+    same_subcategory = indicator_matrix(subcategory_labels)
+    scores = scores + SUBCATEGORY_BONUS * (same_subcategory @ same_subcategory.T)
+
+    scores = scores + ALTERNATIVE_BONUS * alternative_matrix(names)
+
+    together = cooccurrence.tocoo()
+    penalty = sparse.csr_matrix(
+        (together.data / np.maximum(np.minimum(uses[together.row], uses[together.col]), 1.0),
+         (together.row, together.col)),
+        shape=cooccurrence.shape,
+    )
+    scores = (scores - COOCCURRENCE_PENALTY * penalty).tocoo()
+
+    # Drop self pairs, weak pairs and pairs from different categories (when both are known)
+    category_codes = {}
+    category_of = np.array([category_codes.setdefault(c.strip().lower(), len(category_codes))
+                            if c and c.strip() else -1 for c in categories], dtype=np.int64)
+    row, col, score = scores.row, scores.col, scores.data
+    cat_row, cat_col = category_of[row], category_of[col]
+    keep = (row != col) & (score >= min_score) & ((cat_row < 0) | (cat_col < 0) | (cat_row == cat_col))
+    row, col, score = row[keep], col[keep], score[keep]
+
+    # Rank within each ingredient: sort by (ingredient, -score), then position inside the group
+    order = np.lexsort((col, -score, row))
+    row, col, score = row[order], col[order], score[order]
+    group_start = np.searchsorted(row, row, side='left')
+    rank = np.arange(len(row)) - group_start + 1
+    top = rank <= top_k
+    return {'ingredient': row[top], 'substitute': col[top], 'score': score[top], 'rank': rank[top]}
+
+
+def load_ingredient_arrays(conn):
+    """Fetch ingredients and drink_ingredients as position arrays."""
+    cursor = conn.cursor()
+    cursor.execute('SELECT ingredient_id, name, category, subcategory FROM ingredients ORDER BY ingredient_id')
+    ingredients = cursor.fetchall()
+    cursor.execute('SELECT drink_id, ingredient_id FROM drink_ingredients')
+    pairs = cursor.fetchall()
+    cursor.close()
+
+    ingredient_ids = np.array([row[0] for row in ingredients], dtype=np.int64)
+    drink_ids = np.array([row[0] for row in pairs], dtype=np.int64)
+    _, drink_index = np.unique(drink_ids, return_inverse=True)
+    ingredient_index = np.searchsorted(ingredient_ids, np.array([row[1] for row in pairs], dtype=np.int64))
+    catalog = {
+        'names': [row[1] for row in ingredients],
+        'categories': [row[2] for row in ingredients],
+        'subcategories': [row[3] for row in ingredients],
+    }
+    return ingredient_ids, drink_index, ingredient_index, catalog
+
+
+def format_copy_rows(ingredient_ids: np.ndarray, substitutes: Dict[str, np.ndarray]) -> io.StringIO:
+    """Render substitutes as tab-separated COPY input."""
+    buffer = io.StringIO()
+    columns = [
+        ingredient_ids[substitutes['ingredient']],
+        ingredient_ids[substitutes['substitute']],
+        np.round(substitutes['score'], 4),
+        substitutes['rank'],
+    ]
+    for row in zip(*columns):
+        buffer.write('\t'.join(str(value) for value in row) + '\n')
+    buffer.seek(0)
+    return buffer
+
+
+def write_substitutes(conn, ingredient_ids: np.ndarray, substitutes: Dict[str, np.ndarray]) -> None:
+    """Replace the contents of ingredient_substitutes in a single transaction using COPY."""
+    cursor = conn.cursor()
+    cursor.execute(CREATE_TABLE_SQL)
+    cursor.execute('TRUNCATE ingredient_substitutes')
+    cursor.copy_expert(
+        f"COPY ingredient_substitutes ({', '.join(SUBSTITUTE_COLUMNS)}) FROM STDIN",
+        format_copy_rows(ingredient_ids, substitutes),
+    )
+    conn.commit()
+    cursor.close()
+
+
+def sync_substitutes(conn, ingredient_ids: np.ndarray, substitutes: Dict[str, np.ndarray]) -> int:
+    """Rewrite only the ingredients whose substitute list changed, without committing; returns how many."""
+    fresh = defaultdict(list)
+    for ingredient_id, substitute_id, score, rank in zip(ingredient_ids[substitutes['ingredient']],
+                                                          ingredient_ids[substitutes['substitute']],
+                                                          np.round(substitutes['score'], 4), substitutes['rank']):
+        fresh[int(ingredient_id)].append((int(substitute_id), float(score), int(rank)))
+
+    cursor = conn.cursor()
+    cursor.execute('SELECT ingredient_id, substitute_id, score, rank FROM ingredient_substitutes '
+                   'ORDER BY ingredient_id, rank')
+    stored = defaultdict(list)
+    for ingredient_id, substitute_id, score, rank in cursor.fetchall():
+        stored[ingredient_id].append((substitute_id, float(score), rank))
+
+    changed = sorted(i for i in set(fresh) | set(stored) if fresh.get(i, []) != stored.get(i, []))
+    if changed:
+        cursor.execute('DELETE FROM ingredient_substitutes WHERE ingredient_id = ANY(%s)', (changed,))
+        cursor.executemany(
+            f"INSERT INTO ingredient_substitutes ({', '.join(SUBSTITUTE_COLUMNS)}) VALUES (%s, %s, %s, %s)",
+            [(i, substitute_id, score, rank) for i in changed for substitute_id, score, rank in fresh.get(i, [])],
+        )
+    cursor.close()
+    return len(changed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute ingredient substitutes from co-occurrence')
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K, help='Substitutes kept per ingredient (default: 5)')
+    parser.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE,
+                        help='Minimum score to keep a pair (default: 0.05)')
+    parser.add_argument('--dry-run', action='store_true', help='Compute and print substitutes without writing')
+    args = parser.parse_args()
+
+    conn = db.connect()
+    try:
+        start = time.perf_counter()
+        ingredient_ids, drink_index, ingredient_index, catalog = load_ingredient_arrays(conn)
+        substitutes = compute_substitutes(drink_index, ingredient_index, catalog['names'], catalog['categories'],
+                                          catalog['subcategories'], args.top_k, args.min_score)
+        elapsed = time.perf_counter() - start
+
+        if not args.dry_run:
+            write_substitutes(conn, ingredient_ids, substitutes)
+    except Exception as e:
+        print(f"Error computing substitutes: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    covered = len(np.unique(substitutes['ingredient']))
+    print(f"✓ {'Computed' if args.dry_run else 'Loaded'} {len(substitutes['rank'])} substitutes "
+          f"for {covered} of {len(ingredient_ids)} ingredients in {elapsed * 1000:.1f} ms")
+    if args.dry_run:
+        names = catalog['names']
+        for i, j, score, rank in zip(substitutes['ingredient'], substitutes['substitute'],
+                                     substitutes['score'], substitutes['rank']):
+            if rank == 1:
+                print(f"  {names[i]:<40} -> {names[j]} ({score:.3f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Tests for the prefix autocomplete index"""
+
+import pytest
+
+from autocomplete import AutocompleteIndex, build_items, parse_exclude
+
+INGREDIENTS = [
+    (1, 'Gin', 'Gin', 40),
+    (2, 'Old Tom Gin', 'Gin', 3),
+    (3, 'Fresh Lime Juice', 'Citrus', 25),
+    (4, 'Lime', 'Citrus', 2),
+    (5, 'Ginger Beer', None, 8),
+]
+GARNISHES = [('Lime wheel', 12), ('lime', 4)]
+SUBCATEGORIES = [('Gin', 43), ('Citrus', 27)]
+
+
+@pytest.fixture
+def index():
+    return AutocompleteIndex(build_items(INGREDIENTS, GARNISHES, SUBCATEGORIES))
+
+
+def names(items):
+    return [(item['type'], item['name']) for item in items]
+
+
+def test_prefix_matches_every_word_start(index):
+    assert ('ingredient', 'Fresh Lime Juice') in names(index.complete('lim'))
+    assert ('ingredient', 'Old Tom Gin') in names(index.complete('to'))
+    assert index.complete('  ') == []
+    assert index.complete('zzz') == []
+
+
+def test_ranking_puts_subcategories_first_then_usage(index):
+    assert names(index.complete('gin')) == [
+        ('subcategory', 'Gin'), ('ingredient', 'Gin'), ('ingredient', 'Ginger Beer'), ('ingredient', 'Old Tom Gin'),
+    ]
+    assert names(index.complete('gi', limit=2)) == [('subcategory', 'Gin'), ('ingredient', 'Gin')]
+
+
+def test_garnish_with_an_ingredient_name_is_merged(index):
+    lime = [item for item in index.complete('lime') if item['name'].lower() == 'lime']
+    assert [item['type'] for item in lime] == ['ingredient']
+
+
+def test_exclude_is_by_kind_and_id(index):
+    # Excluding the Gin ingredient keeps the 'Gin (any)' subcategory
+    result = names(index.complete('gin', exclude=[parse_exclude('ingredient:1')]))
+    assert result == [('subcategory', 'Gin'), ('ingredient', 'Ginger Beer'), ('ingredient', 'Old Tom Gin')]
+    result = names(index.complete('gin', exclude=[parse_exclude('subcategory:GIN')]))
+    assert ('subcategory', 'Gin') not in result and ('ingredient', 'Gin') in result
+    # A long prefix is not precomputed, so the range scan applies the exclusion too
+    assert names(index.complete('lime whe', exclude=[parse_exclude('garnish:lime wheel')])) == []
+
+
+@pytest.mark.parametrize('value', ['Gin', 'drink:3', 'ingredient:', 'ingredient:gin'])
+def test_parse_exclude_rejects_malformed_values(value):
+    with pytest.raises(ValueError):
+        parse_exclude(value)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Tests for the route query benchmark's workload generation"""
+
+from benchmark_queries import Catalog, build_workload
+
+
+def draw(catalog, requests=20):
+    workload = build_workload(catalog)
+    return {route: [make_request() for _ in range(requests)] for route, make_request in workload.items()}
+
+
+def test_parameters_do_not_depend_on_loading_the_data():
+    skipped = Catalog(1_000, seed=7)
+    loaded = Catalog(1_000, seed=7)
+    # Consume the data generator the way load_catalog does
+    loaded.rng.integers(0, 8, size=3 * loaded.n_drinks)
+    loaded.recipe_rows()
+    assert draw(loaded) == draw(skipped)
+    assert draw(Catalog(1_000, seed=8)) != draw(Catalog(1_000, seed=7))
+
+
+def result_columns(sql):
+    return sql.rsplit('FROM drink_stats', 1)[0].rsplit('SELECT', 1)[1]
+
+
+def test_substitute_routes_mirror_the_server_sql():
+    workload = build_workload(Catalog(1_000, seed=3))
+    for _ in range(20):
+        sql, params = workload['by_ingredients_substitutes']()
+        assert sql.count('%s') == len(params)
+        assert 'ingredient_substitutes' in sql or 'LIKE' not in sql
+        plain_sql, plain_params = workload['by_ingredients']()
+        assert 'ingredient_substitutes' not in plain_sql and plain_sql.count('%s') == len(plain_params)
+
+    sql, params = workload['recommendations_by_ingredients_substitutes']()
+    assert 'ingredient_substitutes' in sql and 'substituted_ingredients' in result_columns(sql)
+    assert '{' not in sql and params['ids'] == sorted(set(params['ids']))
+    plain_sql, _ = workload['recommendations_by_ingredients']()
+    assert 'ingredient_substitutes' not in plain_sql and 'substituted_ingredients' not in result_columns(plain_sql)
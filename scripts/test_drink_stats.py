@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized drink stats computation"""
+
+import numpy as np
+
+from drink_stats import compute_drink_stats, dilution_for_methods, STANDARD_DRINK_ETHANOL_ML
+
+
+def test_compute_drink_stats():
+    # Drink 0: 60 ml gin (40%) + 30 ml vermouth (16%), stirred
+    # Drink 1: 45 ml rum (40%) + splash of soda (no abv), built in glass
+    drink_index = np.array([0, 0, 1, 1])
+    amount_ml = np.array([60.0, 30.0, 45.0, 5.0])
+    abv = np.array([40.0, 16.0, 40.0, np.nan])
+    is_approximate = np.array([False, False, False, True])
+    dilution = dilution_for_methods(['Stirred', 'In Glass'])
+
+    stats = compute_drink_stats(drink_index, amount_ml, abv, is_approximate, dilution)
+
+    assert np.allclose(stats['total_volume_ml'], [90.0, 50.0])
+    assert np.allclose(stats['ethanol_ml'], [28.8, 18.0])
+    assert np.allclose(stats['final_volume_ml'], [90.0 * 1.22, 50.0 * 1.10])
+    assert np.allclose(stats['final_abv'], [28.8 * 100 / (90.0 * 1.22), 18.0 * 100 / 55.0])
+    assert np.allclose(stats['standard_drinks'], [28.8 / STANDARD_DRINK_ETHANOL_ML, 18.0 / STANDARD_DRINK_ETHANOL_ML])
+    assert list(stats['ingredient_count']) == [2, 2]
+    assert list(stats['approximate_count']) == [0, 1]
+
+
+def test_drink_without_ingredients_has_zero_abv():
+    stats = compute_drink_stats(np.array([0]), np.array([30.0]), np.array([40.0]),
+                                np.array([False]), dilution_for_methods(['Shaken', None]))
+    assert stats['final_abv'][1] == 0.0
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for compressed / stdio ETL streams"""
+
+import os
+
+import pytest
+
+from etl_io import open_input, open_output
+
+TEXT = "INSERT INTO drinks (name) VALUES\n('Café Brûlot');\n"
+
+MAGIC = {'': b'INSERT', '.gz': b'\x1f\x8b', '.bz2': b'BZh', '.xz': b'\xfd7zXZ'}
+
+
+@pytest.mark.parametrize('extension', sorted(MAGIC))
+def test_round_trip_by_extension(tmp_path, extension):
+    path = str(tmp_path / f"seed.sql{extension}")
+    with open_output(path) as f:
+        f.write(TEXT)
+    with open_input(path) as f:
+        assert f.read() == TEXT
+    with open(path, 'rb') as f:
+        assert f.read().startswith(MAGIC[extension])
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_failed_write_keeps_existing_file(tmp_path):
+    path = str(tmp_path / 'seed.sql')
+    with open_output(path) as f:
+        f.write(TEXT)
+    with pytest.raises(RuntimeError):
+        with open_output(path) as f:
+            f.write('partial')
+            raise RuntimeError('boom')
+    with open_input(path) as f:
+        assert f.read() == TEXT
+    assert os.listdir(tmp_path) == ['seed.sql']
+
+
+def test_rewrite_in_place(tmp_path):
+    path = str(tmp_path / 'seed.sql.gz')
+    with open_output(path) as f:
+        f.write(TEXT)
+    with open_output(path) as fout, open_input(path) as fin:
+        for line in fin:
+            fout.write(line.upper())
+    with open_input(path) as f:
+        assert f.read() == TEXT.upper()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for the greedy bar inventory optimizer"""
+
+import pytest
+
+from inventory_optimizer import iter_bits, optimize_inventory
+
+BOTTLES = [
+    {'ingredient_id': 1, 'name': 'London Dry Gin', 'subcategory': 'Gin', 'uses': 3},
+    {'ingredient_id': 2, 'name': 'Old Tom Gin', 'subcategory': 'Gin', 'uses': 1},
+    {'ingredient_id': 3, 'name': 'Lime Juice', 'subcategory': None, 'uses': 2},
+    {'ingredient_id': 4, 'name': 'Simple Syrup', 'subcategory': None, 'uses': 2},
+    {'ingredient_id': 5, 'name': 'Campari', 'subcategory': None, 'uses': 1},
+    {'ingredient_id': 6, 'name': 'Sweet Vermouth', 'subcategory': None, 'uses': 1},
+]
+
+DRINKS = [
+    {'drink_id': 1, 'name': 'Gimlet', 'ingredient_ids': [1, 3, 4]},
+    {'drink_id': 2, 'name': 'Gin Sour', 'ingredient_ids': [2, 3, 4]},
+    {'drink_id': 3, 'name': 'Negroni', 'ingredient_ids': [1, 5, 6]},
+    {'drink_id': 4, 'name': 'Gin Rickey', 'ingredient_ids': [1, 3]},
+]
+
+
+def test_iter_bits():
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(0)) == []
+
+
+def test_greedy_unlocks_most_drinks():
+    plan = optimize_inventory(DRINKS, BOTTLES, max_bottles=3)
+    assert [step['ingredient'] for step in plan['steps']][:2] == ['London Dry Gin', 'Lime Juice']
+    assert plan['steps'][1]['unlocks'] == ['Gin Rickey']
+    assert sorted(plan['makeable']) == ['Gimlet', 'Gin Rickey']
+
+
+def test_substitutes_let_one_gin_cover_both():
+    plan = optimize_inventory(DRINKS, BOTTLES, max_bottles=3, substitutes=True)
+    assert plan['steps'][0]['ingredient'] == 'London Dry Gin'
+    assert plan['steps'][0]['covers'] == 'any Gin'
+    assert sorted(plan['makeable']) == ['Gimlet', 'Gin Rickey', 'Gin Sour']
+
+
+def test_owned_must_have_and_budget():
+    costs = {1: 30.0, 3: 5.0, 4: 5.0, 5: 25.0, 6: 15.0}
+    plan = optimize_inventory(DRINKS, BOTTLES, budget=45.0, costs=costs, owned=[1], must_have=[6])
+    assert plan['steps'][0]['ingredient'] == 'Sweet Vermouth'
+    assert plan['steps'][0]['reason'] == 'must-have'
+    assert all(step['ingredient'] != 'London Dry Gin' for step in plan['steps'])
+    assert plan['spent'] <= 45.0
+    # Old Tom Gin has no listed cost, so it defaults to 1 and fits in what's left
+    assert sorted(plan['makeable']) == ['Gimlet', 'Gin Rickey', 'Gin Sour']
+
+    weighted = [dict(drink, weight=10.0 if drink['name'] == 'Negroni' else 1.0) for drink in DRINKS]
+    plan = optimize_inventory(weighted, BOTTLES, max_bottles=3)
+    assert 'Negroni' in plan['makeable']
+
+
+def test_unaffordable_must_have_is_an_error():
+    costs = {1: 30.0, 3: 5.0, 4: 5.0, 5: 25.0, 6: 50.0}
+    with pytest.raises(ValueError, match='Sweet Vermouth'):
+        optimize_inventory(DRINKS, BOTTLES, budget=10.0, costs=costs, must_have=[6])
+    # An owned must-have costs nothing, so the budget still buys what fits
+    plan = optimize_inventory(DRINKS, BOTTLES, budget=10.0, costs=costs, must_have=[6], owned=[6])
+    assert plan['steps'] and plan['spent'] <= 10.0
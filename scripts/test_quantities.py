@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Tests for amount/unit -> amount_ml conversion"""
+
+from fix_oz_simple import fix_oz_content
+from quantities import parse_amount, recompute_amount_ml_sql, to_ml
+
+
+def test_parse_amount():
+    assert parse_amount('1') == 1.0
+    assert parse_amount('0.75') == 0.75
+    assert parse_amount('3/4') == 0.75
+    assert parse_amount('1 1/2') == 1.5
+    assert parse_amount('2-3') == 2.5
+    assert parse_amount('top') is None
+    assert parse_amount('') is None
+
+
+def test_to_ml_exact_units():
+    assert to_ml('1 1/2', 'oz') == (45.0, False)
+    assert to_ml('45', 'ml') == (45.0, False)
+    assert to_ml('2', 'cl') == (20.0, False)
+    assert to_ml('1', 'barspoon') == (5.0, False)
+    assert to_ml('1/2', 'Bar Spoon') == (2.5, False)
+    assert to_ml('2', 'tsp') == (10.0, False)
+
+
+def test_to_ml_approximate_units():
+    assert to_ml('2', 'dashes') == (2.0, True)
+    assert to_ml('splash', 'splash') == (5.0, True)
+    assert to_ml('top', 'up') == (60.0, True)
+
+
+def test_to_ml_counted_items():
+    assert to_ml('3', 'pcs') == (None, False)
+    assert to_ml('1', 'wheel') == (None, False)
+
+
+def test_rewritten_amounts_get_amount_ml_from_the_new_text():
+    line = ("((SELECT drink_id FROM drinks WHERE name = 'Gimlet'), (SELECT ingredient_id FROM ingredients "
+            "WHERE name = 'Lime'), '0.67', 'oz', 20.00, FALSE),\n")
+    assert recompute_amount_ml_sql(fix_oz_content(line)).endswith("'3/4', 'oz', 22.50, FALSE),\n")
+    assert recompute_amount_ml_sql("'2', 'dashes', NULL, FALSE)") == "'2', 'dashes', 2.00, TRUE)"
+    assert recompute_amount_ml_sql("('Gin', 'Spirit', 'Gin', 40)") == "('Gin', 'Spirit', 'Gin', 40)"
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Tests for the data-version-keyed query result cache"""
+
+from query_cache import DataVersion, QueryCache, file_snapshot_version, normalize_params
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_normalize_params_ignores_order_whitespace_and_nones():
+    assert normalize_params({'limit': 10, 'name': ' Old  Fashioned ', 'exclude': None}) == \
+        normalize_params({'name': 'Old Fashioned', 'limit': 10})
+    assert normalize_params({'ids': {3, 1, 2}}) == normalize_params({'ids': [1, 2, 3]})
+    assert normalize_params({'ids': [1, 2]}) != normalize_params({'ids': [2, 1]})
+
+
+def test_hits_misses_and_lru_eviction():
+    cache = QueryCache(max_entries=2, ttl=None)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value * 10
+
+    assert cache.get_or_compute('q', {'x': 1}, lambda: compute(1)) == 10
+    assert cache.get_or_compute('q', {'x': 1}, lambda: compute(1)) == 10
+    cache.get_or_compute('q', {'x': 2}, lambda: compute(2))
+    cache.get_or_compute('q', {'x': 1}, lambda: compute(1))   # x=1 becomes most recent
+    cache.get_or_compute('q', {'x': 3}, lambda: compute(3))   # evicts x=2
+    assert cache.get('q', {'x': 2}) is None
+    assert cache.get('other', {'x': 1}) is None               # namespaces don't share entries
+    assert calls == [1, 2, 3]
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['entries']) == (2, 5, 1, 2)
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = QueryCache(ttl=60, clock=clock)
+    cache.put('q', {'x': 1}, 'a')
+    clock.now = 59
+    assert cache.get('q', {'x': 1}) == 'a'
+    clock.now = 61
+    assert cache.get('q', {'x': 1}) is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_new_data_version_invalidates_everything():
+    version = {'value': 'v1'}
+    cache = QueryCache(data_version=lambda: version['value'])
+    cache.put('q', {'x': 1}, 'a')
+    cache.put('q', {'x': 2}, 'b')
+    assert cache.get('q', {'x': 1}) == 'a'
+
+    version['value'] = 'v2'
+    assert cache.get('q', {'x': 1}) is None
+    stats = cache.stats()
+    assert (stats['version_changes'], stats['invalidations'], stats['entries']) == (1, 2, 0)
+    assert stats['data_version'] == 'v2'
+
+    # A result computed against the old version is not stored under the new one
+    cache.put('q', {'x': 1}, 'stale', version='v1')
+    assert cache.get('q', {'x': 1}, version='v2') is None
+
+
+def test_requests_on_an_old_version_do_not_roll_the_cache_back():
+    cache = QueryCache(ttl=None)
+    cache.put('q', {'x': 1}, 'old', version='v1')
+    cache.put('q', {'x': 1}, 'new', version='v2')
+
+    # Interleaved requests still running on v1 and current ones on v2
+    for _ in range(3):
+        assert cache.get('q', {'x': 1}, version='v1') is None
+        cache.put('q', {'x': 2}, 'stale', version='v1')
+        assert cache.get('q', {'x': 1}, version='v2') == 'new'
+    assert cache.get('q', {'x': 2}, version='v2') is None
+
+    stats = cache.stats()
+    assert (stats['data_version'], stats['version_changes'], stats['entries']) == ('v2', 1, 1)
+    assert stats['stale_requests'] == 6
+
+    cache.put('q', {'x': 1}, 'newer', version='v3')
+    assert cache.get('q', {'x': 1}, version='v3') == 'newer'
+    assert cache.get('q', {'x': 1}, version='v2') is None
+
+
+def test_data_version_is_checked_at_most_once_per_interval():
+    clock = FakeClock()
+    versions = iter(['v1', 'v2'])
+    data_version = DataVersion(lambda: next(versions), check_interval=5, clock=clock)
+    assert data_version() == 'v1'
+    clock.now = 4
+    assert data_version() == 'v1'
+    clock.now = 5
+    assert data_version() == 'v2'
+
+
+def test_file_snapshot_version_changes_with_content(tmp_path):
+    path = tmp_path / 'drinks.csv'
+    path.write_text('name\nNegroni\n')
+    before = file_snapshot_version([str(path)])
+    assert before == file_snapshot_version([str(path)])
+    path.write_text('name\nNegroni\nGimlet\n')
+    assert file_snapshot_version([str(path)]) != before
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Tests for the binary recipe IR and its SQL/COPY/JSON renderers"""
+
+import io
+import json
+
+import pytest
+
+import recipe_ir
+from convert_ml_to_oz import convert_ir_file
+from etl_io import open_binary_input, open_binary_output
+from normalize_oz import normalize_ir_file
+from parse_cocktails_csv import generate_drink_ingredients_sql, generate_drinks_sql
+from recipe_ir import Drink, Ingredient, Quantity
+
+RECORDS = [
+    Ingredient('Gin', 'Spirit', 'Gin', 40.0),
+    Ingredient("Maraschino 'Luxardo'"),
+    Drink('Aviation', 'Shake\twith ice', 'Coupe', 'Shaken', None),
+    Drink('Café Brûlot'),
+    Quantity('Aviation', 'Gin', '60', 'ml', 60.0, False),
+    Quantity('Aviation', "Maraschino 'Luxardo'", '50', 'ml', 50.0, False),
+    Quantity('Café Brûlot', 'Gin', '5', 'ml', 5.0, False),
+    Quantity('Café Brûlot', 'Gin', '1', 'dash', 1.0, True),
+]
+
+
+def encode(records):
+    buffer = io.BytesIO()
+    recipe_ir.write_records(buffer, records)
+    return buffer.getvalue()
+
+
+def test_round_trip_keeps_types_and_nulls():
+    data = encode(RECORDS)
+    assert data.startswith(recipe_ir.MAGIC)
+    assert list(recipe_ir.read_records(io.BytesIO(data))) == RECORDS
+
+
+def test_unknown_records_are_skipped():
+    data = encode(RECORDS[:1])
+    data += recipe_ir.RECORD_HEADER.pack(200, 3) + b'new'
+    data += recipe_ir.encode_record(RECORDS[2])
+    assert list(recipe_ir.read_records(io.BytesIO(data))) == [RECORDS[0], RECORDS[2]]
+
+
+@pytest.mark.parametrize('data, message', [
+    (b'INSERT INTO drinks', 'bad magic'),
+    (recipe_ir.HEADER.pack(recipe_ir.MAGIC, recipe_ir.VERSION + 1, 0), 'newer'),
+    (encode(RECORDS)[:-3], 'truncated'),
+])
+def test_malformed_streams_raise(data, message):
+    with pytest.raises(ValueError, match=message):
+        list(recipe_ir.read_records(io.BytesIO(data)))
+
+
+def test_is_ir_path():
+    assert recipe_ir.is_ir_path('seed.rir')
+    assert recipe_ir.is_ir_path('seed.RIR.gz')
+    assert not recipe_ir.is_ir_path('seed.sql.gz')
+    assert not recipe_ir.is_ir_path('-')
+
+
+def test_unit_stages_rewrite_quantity_records(tmp_path):
+    path = str(tmp_path / 'seed.rir.gz')
+    with open_binary_output(path) as f:
+        recipe_ir.write_records(f, RECORDS)
+    convert_ir_file(path, path)
+    normalize_ir_file(path, path)
+    with open_binary_input(path) as f:
+        records = list(recipe_ir.read_records(f))
+
+    quantities = [(q.amount, q.unit, q.amount_ml) for q in records if isinstance(q, Quantity)]
+    assert quantities == [('2', 'oz', 60.0), ('1 1/2', 'oz', 45.0), ('1', 'barspoon', 5.0), ('1', 'dash', 1.0)]
+    assert [r for r in records if not isinstance(r, Quantity)] == RECORDS[:4]
+
+
+def test_render_sql_matches_parse_cocktails_output():
+    grouped = recipe_ir.collect_records(RECORDS)
+    out = io.StringIO()
+    recipe_ir.render_sql(grouped, out)
+    sql = out.getvalue()
+
+    assert "('Gin', 'Spirit', 'Gin', 40)" in sql
+    assert "('Maraschino ''Luxardo''', NULL, NULL, NULL)" in sql
+    assert generate_drinks_sql([d._asdict() for d in grouped['drinks']]) in sql
+    expected = generate_drink_ingredients_sql([
+        {'drink_name': q.drink_name, 'ingredient_name': q.ingredient_name, 'amount': q.amount, 'unit': q.unit}
+        for q in grouped['quantities']
+    ])
+    assert expected in sql
+
+
+def test_render_copy_escapes_fields():
+    out = io.StringIO()
+    recipe_ir.render_copy(recipe_ir.collect_records(RECORDS), out)
+    script = out.getvalue()
+    assert "Aviation\tShake\\twith ice\tCoupe\tShaken\t\\N\n" in script
+    assert "Café Brûlot\tGin\t1\tdash\t1.00\tt\n" in script
+    assert script.count('\\.\n') == 3
+
+
+def test_render_json():
+    out = io.StringIO()
+    recipe_ir.render_json(recipe_ir.collect_records(RECORDS), out)
+    document = json.loads(out.getvalue())
+    assert document['version'] == recipe_ir.VERSION
+    assert document['drinks'][1] == {'name': 'Café Brûlot', 'description': None, 'glass_type': None,
+                                     'build_method': None, 'garnish': None}
+    assert document['drink_ingredients'][3]['is_approximate'] is True
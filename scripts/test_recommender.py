@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Tests for the TF-IDF recommender model and hot reload"""
+
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import numpy as np
+import pytest
+
+from query_cache import QueryCache
+import recommender
+from recommender import ModelStore, RecommenderModel, drink_features, make_handler
+
+DRINKS = [
+    {'drink_id': 30, 'name': 'Daiquiri',
+     'features': drink_features([('Rum', 'Rum'), ('Lime Juice', None), ('Simple Syrup', None)], 'Coupe', 'Shaken')},
+    {'drink_id': 10, 'name': 'Gimlet',
+     'features': drink_features([('Gin', 'Gin'), ('Lime Juice', None), ('Simple Syrup', None)], 'Coupe', 'Shaken')},
+    {'drink_id': 20, 'name': 'Negroni',
+     'features': drink_features([('Gin', 'Gin'), ('Campari', None), ('Sweet Vermouth', None)], 'Rocks', 'Stirred')},
+    {'drink_id': 40, 'name': 'Martini',
+     'features': drink_features([('Gin', 'Gin'), ('Dry Vermouth', None)], 'Coupe', 'Stirred')},
+]
+
+
+def test_row_lookup():
+    model = RecommenderModel.train(DRINKS)
+    assert list(model.drink_ids) == [10, 20, 30, 40]
+    assert model.row_for(30) == 2
+    assert model.row_for(25) is None
+    assert model.row_for(name='  negroni') == 1
+    assert model.row_for(name='Mojito') is None
+
+
+def test_recommendations_rank_by_cosine_similarity():
+    model = RecommenderModel.train(DRINKS)
+    norms = np.sqrt(np.asarray(model.matrix.multiply(model.matrix).sum(axis=1)).ravel())
+    assert np.allclose(norms, 1.0)
+
+    recs = model.recommend_rows([model.row_for(30)], limit=2)[0]
+    assert [rec['name'] for rec in recs] == ['Gimlet', 'Martini']
+    assert all(rec['drink_id'] != 30 for rec in recs)
+
+    recs = model.recommend_rows([model.row_for(30)], limit=5, exclude=[10])[0]
+    assert 'Gimlet' not in [rec['name'] for rec in recs]
+
+
+def test_batch_matches_single_queries():
+    model = RecommenderModel.train(DRINKS)
+    batch = model.recommend_rows([0, 1, 2, 3], limit=3)
+    for row in range(4):
+        assert batch[row] == model.recommend_rows([row], limit=3)[0]
+
+
+def test_chunked_scoring_matches_a_single_chunk(monkeypatch):
+    model = RecommenderModel.train(DRINKS)
+    expected = model.recommend_rows([0, 1, 2, 3], limit=2, exclude=[40])
+    monkeypatch.setattr(recommender, 'SCORE_CHUNK_ENTRIES', 1)
+    assert model.recommend_rows([0, 1, 2, 3], limit=2, exclude=[40]) == expected
+    assert model.recommend_rows([0], limit=0) == [[]]
+
+
+def test_save_prunes_old_versions(tmp_path):
+    model_dir = str(tmp_path)
+    model = RecommenderModel.train(DRINKS)
+    versions = [model.save(model_dir, keep=2) for _ in range(4)]
+    assert sorted(name for name in os.listdir(model_dir) if name != 'CURRENT') == versions[-2:]
+    assert RecommenderModel.load(model_dir).version == versions[-1]
+
+
+def test_reload_survives_unexpected_errors(tmp_path, monkeypatch):
+    model_dir = str(tmp_path)
+    RecommenderModel.train(DRINKS).save(model_dir)
+    store = ModelStore(model_dir)
+    version = store.model.version
+
+    def broken_load(cls, model_dir):
+        raise RuntimeError('corrupt model')
+
+    monkeypatch.setattr(RecommenderModel, 'load', classmethod(broken_load))
+    os.utime(os.path.join(model_dir, 'CURRENT'), ns=(0, store._pointer_mtime + 1))
+    assert not store.reload_if_changed()
+    assert store.model.version == version
+
+
+def test_save_load_and_hot_reload(tmp_path):
+    model_dir = str(tmp_path)
+    first = RecommenderModel.train(DRINKS[:3])
+    first.save(model_dir)
+    store = ModelStore(model_dir)
+    # Arrays stay memory-mapped (read-only) rather than copied into the process
+    assert not store.model.matrix.data.flags.writeable
+    assert store.model.recommend_rows([2], limit=3) == first.recommend_rows([2], limit=3)
+    assert not store.reload_if_changed()
+
+    second = RecommenderModel.train(DRINKS)
+    version = second.save(model_dir)
+    os.utime(os.path.join(model_dir, 'CURRENT'), ns=(0, store._pointer_mtime + 1))
+    assert store.reload_if_changed()
+    assert store.model.version == version
+    assert store.model.row_for(40) == 3
+
+
+def test_service_caches_per_model_version(tmp_path):
+    model_dir = str(tmp_path)
+    model = RecommenderModel.train(DRINKS[:3])
+    model.data_version = 'stamp:1'
+    model.save(model_dir)
+    store = ModelStore(model_dir)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(store, QueryCache(max_entries=10)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def get(path):
+        with urlopen(base + path) as response:
+            return json.loads(response.read())
+
+    def post(path, body):
+        request = Request(base + path, data=json.dumps(body).encode('utf-8'),
+                          headers={'Content-Type': 'application/json'})
+        with urlopen(request) as response:
+            return json.loads(response.read())
+
+    try:
+        first = get('/recommendations?drink_id=30&limit=2')
+        # Same drink by name: resolved to drink_id 30 before keying, so it is a hit
+        assert get('/recommendations?name=daiquiri&limit=2')['recommendations'] == first['recommendations']
+        batch = post('/recommendations/batch', {'drink_ids': [30, 10], 'limit': 2})
+        assert batch['results'][0]['recommendations'] == first['recommendations']
+        stats = get('/stats')
+        assert stats['data_version'] == 'stamp:1'
+        assert (stats['cache']['hits'], stats['cache']['misses'], stats['cache']['entries']) == (2, 2, 2)
+
+        RecommenderModel.train(DRINKS).save(model_dir)
+        os.utime(os.path.join(model_dir, 'CURRENT'), ns=(0, store._pointer_mtime + 1))
+        assert store.reload_if_changed()
+        get('/recommendations?drink_id=30&limit=2')
+        stats = get('/stats')['cache']
+        assert (stats['version_changes'], stats['invalidations'], stats['entries']) == (1, 2, 1)
+
+        # Bad parameters are named in the error instead of blamed on the drink lookup
+        for path, message in [('/recommendations?drink_id=30&limit=abc', 'limit'),
+                              ('/recommendations?drink_id=30&exclude=x', 'exclude'),
+                              ('/recommendations?limit=2', 'drink_id')]:
+            with pytest.raises(HTTPError) as error:
+                get(path)
+            assert error.value.code == 400
+            assert json.loads(error.value.read())['error'].startswith(message)
+        with pytest.raises(HTTPError) as error:
+            post('/recommendations/batch', {'drink_ids': [30], 'limit': 'abc'})
+        assert error.value.code == 400 and json.loads(error.value.read())['error'].startswith('limit')
+    finally:
+        server.shutdown()
+        server.server_close()
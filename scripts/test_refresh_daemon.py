@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for change-driven incremental refresh of derived data
+
+test_refresh_end_to_end runs the change log triggers, NOTIFY and the refresh
+against a real Postgres in a throwaway schema. Point TEST_DATABASE_URL at a
+local server (default: dbname=postgres host=localhost user=postgres); without
+one the test is skipped, so check pytest's -rs summary. Set
+REQUIRE_TEST_DATABASE=1 to fail instead of skipping.
+"""
+
+import os
+import select
+import uuid
+
+import pytest
+
+import db
+from refresh_daemon import CHANNEL, Debouncer, load_garnish_updates, plan_refresh, process_pending
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL', 'dbname=postgres host=localhost user=postgres')
+
+
+def change(table, operation, columns=None, drink_id=None, ingredient_id=None):
+    return {'table_name': table, 'operation': operation, 'columns': columns,
+            'drink_id': drink_id, 'ingredient_id': ingredient_id}
+
+
+def test_new_drink_gets_garnish_search_and_stats():
+    plan = plan_refresh([change('drinks', 'INSERT', ['build_method', 'drink_id', 'name'], drink_id=7)])
+    assert plan.garnish_drinks == {7}
+    assert plan.search_drinks == {7}
+    assert plan.stats_drinks == {7}
+    assert not plan.substitutes
+
+
+def test_amount_edit_recomputes_quantity_and_stats_only():
+    plan = plan_refresh([change('drink_ingredients', 'UPDATE', ['amount'], drink_id=3, ingredient_id=9)])
+    assert plan.amount_ml_rows == {(3, 9)}
+    assert plan.stats_drinks == {3}
+    assert not plan.search_drinks and not plan.substitutes
+
+
+def test_explicit_amount_ml_is_kept():
+    plan = plan_refresh([change('drink_ingredients', 'UPDATE', ['amount', 'amount_ml'], drink_id=3, ingredient_id=9)])
+    assert not plan.amount_ml_rows
+    assert plan.stats_drinks == {3}
+
+
+def test_recipe_membership_changes():
+    plan = plan_refresh([
+        change('drink_ingredients', 'INSERT', ['amount', 'drink_id', 'ingredient_id', 'unit'], 1, 2),
+        change('drink_ingredients', 'DELETE', drink_id=4, ingredient_id=2),
+    ])
+    assert plan.amount_ml_rows == {(1, 2)}
+    assert plan.search_drinks == {1, 4}
+    assert plan.stats_drinks == {1, 4}
+    assert plan.substitutes
+
+
+def test_ingredient_changes_fan_out_to_drinks():
+    plan = plan_refresh([
+        change('ingredients', 'UPDATE', ['name'], ingredient_id=5),
+        change('ingredients', 'UPDATE', ['abv'], ingredient_id=6),
+    ])
+    assert plan.classify_ingredients == {5}
+    assert plan.search_ingredients == {5}
+    assert plan.stats_ingredients == {6}
+    assert plan.substitutes
+
+
+def test_rename_with_explicit_category_is_not_reclassified():
+    plan = plan_refresh([
+        change('ingredients', 'UPDATE', ['category', 'name'], ingredient_id=5),
+        change('ingredients', 'INSERT', ['category', 'ingredient_id', 'name'], ingredient_id=6),
+    ])
+    assert plan.classify_ingredients == {6}
+    assert plan.search_ingredients == {5, 6}
+
+
+def test_derived_column_changes_plan_nothing():
+    assert not plan_refresh([
+        change('drinks', 'UPDATE', ['search_document'], drink_id=1),
+        change('drinks', 'DELETE', drink_id=2),
+        change('ingredients', 'UPDATE', ['description'], ingredient_id=3),
+    ])
+
+
+def test_debouncer_waits_for_quiet_but_not_past_max_delay():
+    debouncer = Debouncer(quiet=1.0, max_delay=3.0)
+    assert debouncer.seconds_until_due(0.0) is None
+    debouncer.notify(10.0)
+    assert debouncer.seconds_until_due(10.5) == 0.5
+    debouncer.notify(10.8)
+    assert debouncer.seconds_until_due(11.0) == pytest.approx(0.8)
+    for now in (11.5, 12.2, 12.9):
+        debouncer.notify(now)
+    assert debouncer.seconds_until_due(12.9) == pytest.approx(0.1)
+    assert debouncer.seconds_until_due(13.5) == 0.0
+    debouncer.reset()
+    assert debouncer.seconds_until_due(13.5) is None
+
+
+def test_load_garnish_updates(tmp_path):
+    path = tmp_path / 'update_garnishes.sql'
+    path.write_text("-- header\n"
+                    "UPDATE drinks SET garnish = 'a lime slice.' WHERE LOWER(name) = LOWER('Grand Margarita');\n"
+                    "UPDATE drinks SET garnish = 'Mint' WHERE LOWER(name) = LOWER('Queen''s Park Swizzle');\n",
+                    encoding='utf-8')
+    assert load_garnish_updates(str(path)) == {'grand margarita': 'a lime slice.', "queen's park swizzle": 'Mint'}
+    assert load_garnish_updates(str(tmp_path / 'missing.sql')) == {}
+
+
+@pytest.fixture
+def catalog_schema():
+    """A throwaway schema with the catalog tables, search documents and change log triggers."""
+    psycopg2 = pytest.importorskip('psycopg2')
+    schema = f"refresh_test_{uuid.uuid4().hex[:8]}"
+    try:
+        admin = psycopg2.connect(TEST_DATABASE_URL, connect_timeout=2)
+    except psycopg2.OperationalError as e:
+        if os.environ.get('REQUIRE_TEST_DATABASE'):
+            pytest.fail(f"REQUIRE_TEST_DATABASE is set but TEST_DATABASE_URL is unreachable: {e}")
+        pytest.skip(f"no test database (set TEST_DATABASE_URL): {e}")
+    admin.autocommit = True
+    admin.cursor().execute(f'CREATE SCHEMA {schema}')
+
+    conn = psycopg2.connect(TEST_DATABASE_URL, options=f'-c search_path={schema}')
+    cursor = conn.cursor()
+    for name in ('commands.sql', 'drink_search.sql', 'classify_liquors.sql', 'change_log.sql'):
+        with open(os.path.join(db.PROJECT_ROOT, 'database', name), 'r', encoding='utf-8') as f:
+            cursor.execute(f.read())
+    conn.commit()
+    try:
+        yield conn
+    finally:
+        conn.close()
+        admin.cursor().execute(f'DROP SCHEMA {schema} CASCADE')
+        admin.close()
+
+
+def test_refresh_end_to_end(catalog_schema):
+    conn = catalog_schema
+    listener = type(conn)(conn.dsn)
+    listener.autocommit = True
+    listener.cursor().execute(f'LISTEN {CHANNEL}')
+
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO ingredients (name, abv) VALUES ('Gin', 40), ('Lime Juice', NULL) "
+                   "RETURNING ingredient_id")
+    gin, lime = [row[0] for row in cursor.fetchall()]
+    cursor.execute("INSERT INTO drinks (name, build_method) VALUES ('Gimlet', 'Shaken') RETURNING drink_id")
+    gimlet = cursor.fetchone()[0]
+    cursor.executemany("INSERT INTO drink_ingredients (drink_id, ingredient_id, amount, unit) VALUES (%s, %s, %s, 'oz')",
+                       [(gimlet, gin, '2'), (gimlet, lime, '3/4')])
+    conn.commit()
+
+    assert select.select([listener], [], [], 5)[0]
+    listener.poll()
+    assert {n.channel for n in listener.notifies} == {CHANNEL}
+    listener.close()
+
+    totals = process_pending(conn, {'gimlet': 'Lime wheel'})
+    assert totals['changes'] == 5
+    cursor.execute('SELECT garnish, search_document IS NOT NULL FROM drinks WHERE drink_id = %s', (gimlet,))
+    assert cursor.fetchone() == ('Lime wheel', True)
+    cursor.execute('SELECT amount_ml FROM drink_ingredients WHERE drink_id = %s ORDER BY amount_ml', (gimlet,))
+    assert [float(row[0]) for row in cursor.fetchall()] == [22.5, 60.0]
+    cursor.execute('SELECT total_volume_ml FROM drink_stats WHERE drink_id = %s', (gimlet,))
+    assert float(cursor.fetchone()[0]) == 82.5
+    # The refresh's own writes are not logged as changes
+    cursor.execute('SELECT count(*) FROM catalog_change_log')
+    assert cursor.fetchone()[0] == 0
+
+    cursor.execute("UPDATE drink_ingredients SET amount = '1 1/2' WHERE drink_id = %s AND ingredient_id = %s",
+                   (gimlet, gin))
+    cursor.execute("UPDATE ingredients SET name = 'London Dry Gin' WHERE ingredient_id = %s", (gin,))
+    conn.commit()
+    totals = process_pending(conn, {})
+    assert totals['changes'] == 2
+    cursor.execute('SELECT total_volume_ml FROM drink_stats WHERE drink_id = %s', (gimlet,))
+    assert float(cursor.fetchone()[0]) == 67.5
+    cursor.execute("SELECT count(*) FROM drinks WHERE search_document @@ plainto_tsquery('english', 'london')")
+    assert cursor.fetchone()[0] == 1
+    cursor.execute('SELECT category, subcategory FROM ingredients WHERE ingredient_id = %s', (gin,))
+    assert cursor.fetchone() == ('Liquor', 'Gin')
+
+    # Renamed away from a liquor name: the stale classification is cleared
+    cursor.execute("UPDATE ingredients SET name = 'Elderflower Cordial' WHERE ingredient_id = %s", (gin,))
+    conn.commit()
+    process_pending(conn, {})
+    cursor.execute('SELECT category, subcategory FROM ingredients WHERE ingredient_id = %s', (gin,))
+    assert cursor.fetchone() == (None, None)
+    assert process_pending(conn, {})['changes'] == 0
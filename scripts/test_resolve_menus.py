@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Tests for build-time menu name resolution"""
+
+from resolve_menus import resolve_entries, simplify_menu_name
+
+DRINKS = [(1, 'Americano'), (2, 'Dirty Martini'), (3, 'Bijou'), (4, 'Boulevardier'), (5, 'Negroni'),
+          (6, 'Dry Martini'), (7, 'Café Royale')]
+
+
+def resolve(*names, drink_id=None):
+    return resolve_entries([{'menu_id': 1, 'names': list(names), 'drink_id': drink_id}], DRINKS)[0]
+
+
+def test_simplify_menu_name():
+    assert simplify_menu_name('the bijou') == 'bijou'
+    assert simplify_menu_name('dirty martini (gin)') == 'dirty martini'
+
+
+def test_exact_and_canonical_matches():
+    result = resolve('negroni ')
+    assert (result['drink_id'], result['method'], result['status']) == (5, 'exact', 'update')
+    assert resolve('Cafe Royale')['drink_id'] == 7
+    assert resolve('Negroni', drink_id=5)['status'] == 'ok'
+
+
+def test_db_drink_name_and_menu_decoration():
+    assert resolve('Americano', 'The Americano')['method'] == 'exact'
+    result = resolve('Dirty Martini (gin)')
+    assert (result['drink_id'], result['method']) == (2, 'normalized')
+
+
+def test_fuzzy_match_reports_confidence():
+    result = resolve('Boulevardeir')
+    assert (result['drink_id'], result['method'], result['status']) == (4, 'fuzzy', 'update')
+    assert 0.85 <= result['confidence'] < 1.0
+    assert resolve('Espresso Martini')['status'] == 'low-confidence'
+    assert resolve('Zombie')['status'] == 'unresolved'
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the offline BM25 drink search index"""
+
+import numpy as np
+
+from search_documents import build_search_document
+from search_index import BM25Index
+
+DOCUMENTS = [
+    (10, build_search_document({'name': 'Gimlet', 'garnish': 'Lime wheel'}, ['Gin', 'Lime Juice', 'Simple Syrup'])),
+    (11, build_search_document({'name': 'Lime Rickey', 'description': 'Tall and fizzy'},
+                               ['Gin', 'Limes', 'Soda Water'])),
+    (12, build_search_document({'name': 'Daiquiri'}, ['White Rum', 'Lime Juice', 'Simple Syrup'])),
+    (13, build_search_document({'name': 'Crème de Menthe Frappé'}, ['Crème de Menthe'])),
+]
+
+
+def ids(results):
+    return [doc_id for doc_id, _, _ in results]
+
+
+def test_every_query_word_must_match_as_a_prefix():
+    index = BM25Index().build(DOCUMENTS)
+    assert set(ids(index.search('lim'))) == {10, 11, 12}
+    assert set(ids(index.search('gin lim'))) == {10, 11}
+    assert ids(index.search('gin rum')) == []
+    assert ids(index.search('the of')) == []
+    assert ids(index.search('creme')) == [13]
+
+
+def test_name_matches_rank_above_other_fields():
+    index = BM25Index().build(DOCUMENTS)
+    assert ids(index.search('lime'))[0] == 11
+    assert ids(index.search('lime', limit=2)) == ids(index.search('lime'))[:2]
+
+
+def test_save_and_load_without_pickle(tmp_path):
+    index = BM25Index(k1=1.5, b=0.6).build(DOCUMENTS)
+    path = str(tmp_path / 'index.npz')
+    index.save(path)
+
+    with np.load(path, allow_pickle=False) as data:
+        assert data['terms'].dtype.kind == 'U'
+    loaded = BM25Index.load(path)
+    assert (loaded.k1, loaded.b) == (1.5, 0.6)
+    assert loaded.doc_names == index.doc_names
+    for query in ('lim', 'gin syrup', 'frappe'):
+        assert loaded.search(query) == index.search(query)
+
+
+def test_empty_index():
+    assert BM25Index().build([]).search('gin') == []
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Tests for the file order of backend/run-full-db-setup.js"""
+
+import os
+import re
+
+import db
+from quantities import to_ml
+
+SETUP_SCRIPT = os.path.join(db.PROJECT_ROOT, 'backend', 'run-full-db-setup.js')
+SQL_DIR = os.path.join(db.PROJECT_ROOT, 'database')
+
+
+def setup_files():
+    with open(SETUP_SCRIPT, 'r', encoding='utf-8') as f:
+        block = re.search(r"const files = \[(.*?)\];", f.read(), re.S).group(1)
+    return re.findall(r"'([^']+\.sql)'", block)
+
+
+def read_sql(name):
+    with open(os.path.join(SQL_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_search_documents_are_built_after_every_drink_insert():
+    files = setup_files()
+    search_position = files.index('drink_search.sql')
+    adds_drinks = [name for name in files if re.search(r'INSERT INTO drinks\b', read_sql(name), re.I)]
+    assert adds_drinks
+    assert all(files.index(name) < search_position for name in adds_drinks)
+    assert files[-1] == 'verify_setup.sql'
+
+
+def test_recipe_rows_added_after_the_backfill_carry_amount_ml():
+    files = setup_files()
+    later = files[files.index('update_amount_ml.sql') + 1:]
+    for name in later:
+        sql = read_sql(name)
+        for columns in re.findall(r'INSERT INTO drink_ingredients\s*\(([^)]*)\)', sql, re.I):
+            assert 'amount_ml' in columns, name
+        for amount, unit, amount_ml, is_approximate in re.findall(
+                r"'([^']*)', '([^']*)', (\d+\.\d+), (TRUE|FALSE)\)", sql):
+            assert to_ml(amount, unit) == (float(amount_ml), is_approximate == 'TRUE'), (name, amount, unit)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the menu shopping list calculator"""
+
+import pytest
+
+from shopping_list import BOTTLES_PER_CASE, build_shopping_list, fetch_menu_recipes
+
+# (drink_name, ingredient_id, ingredient_name, category, amount, unit, amount_ml, is_approximate)
+ROWS = [
+    ('Gimlet', 1, 'Gin', 'Liquor', '2', 'oz', 60.0, False),
+    ('Gimlet', 2, 'Lime Juice', 'Juice', '3/4', 'oz', 22.5, False),
+    ('Gimlet', 3, 'Lime', None, '1', 'wheel', None, False),
+    ('Bijou', 1, 'Gin', 'Liquor', '1', 'oz', 30.0, False),
+    ('Bijou', 4, 'Orange Bitters', None, '2', 'dashes', 2.0, True),
+    ('Daiquiri', 3, 'Lime', None, '2', 'pcs', None, False),
+]
+
+
+def by_name(shopping_list):
+    return {(item['ingredient'], item['count_unit']): item for item in shopping_list}
+
+
+def test_scales_by_servings_per_drink():
+    items = by_name(build_shopping_list(ROWS, {'gimlet': 10, 'bijou': 4}, default_servings=0))
+    assert items[('Gin', None)]['total_ml'] == 10 * 60 + 4 * 30
+    assert items[('Lime Juice', None)]['total_ml'] == 225.0
+    assert items[('Orange Bitters', None)]['approximate']
+    assert items[('Lime', 'wheel')]['total_count'] == 10
+    # Daiquiri falls back to default_servings=0
+    assert ('Lime', 'pcs') not in items
+
+
+def test_rounds_up_to_bottles_and_cases():
+    items = by_name(build_shopping_list(ROWS, {'gimlet': 160}))
+    gin = items[('Gin', None)]
+    assert gin['total_ml'] == 9600.0
+    assert gin['bottles'] == 13  # 12.8 x 750 ml
+    assert (gin['cases'], gin['loose_bottles']) == (1, 13 - BOTTLES_PER_CASE)
+    juice = items[('Lime Juice', None)]
+    assert (juice['bottle_ml'], juice['bottles']) == (1000.0, 4)
+
+
+def test_mixed_count_units_stay_separate():
+    items = by_name(build_shopping_list(ROWS, {'gimlet': 3, 'daiquiri': 5}))
+    assert items[('Lime', 'wheel')]['total_count'] == 3
+    assert items[('Lime', 'pcs')]['total_count'] == 10
+    assert items[('Lime', 'pcs')]['bottles'] is None
+
+
+def test_waste_applies_to_liquids_and_counts():
+    items = by_name(build_shopping_list(ROWS, {'gimlet': 10, 'daiquiri': 10}, waste=0.1))
+    assert items[('Gin', None)]['total_ml'] == 660.0
+    assert items[('Lime', 'wheel')]['total_count'] == 11
+    assert items[('Lime', 'pcs')]['total_count'] == 22
+
+
+def test_empty_menu():
+    assert build_shopping_list([], {}) == []
+
+
+def test_only_known_menu_tables_are_queried():
+    # Rejected before a cursor is opened, so no connection is needed
+    with pytest.raises(ValueError):
+        fetch_menu_recipes(None, 'drinks; DROP TABLE drinks')
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for co-occurrence based ingredient substitutes"""
+
+import numpy as np
+
+from substitutions import alternative_matrix, compute_substitutes, name_alternatives
+
+NAMES = ['Bourbon', 'Rye Whiskey', 'Sweet Vermouth', 'Angostura Bitters', 'Lemon Juice', 'Simple Syrup',
+         'Bourbon or Rye Whiskey']
+RECIPES = [
+    [0, 2, 3],      # Manhattan (bourbon)
+    [1, 2, 3],      # Manhattan (rye)
+    [0, 4, 5],      # Whiskey Sour
+    [1, 4, 5],      # Rye Sour
+    [6, 5, 3],      # Old Fashioned
+]
+
+
+def arrays():
+    drink_index = np.array([d for d, recipe in enumerate(RECIPES) for _ in recipe])
+    ingredient_index = np.array([i for recipe in RECIPES for i in recipe])
+    return drink_index, ingredient_index
+
+
+def substitutes_of(result, ingredient):
+    mask = result['ingredient'] == ingredient
+    return list(result['substitute'][mask])
+
+
+def test_name_alternatives():
+    assert name_alternatives('Bourbon or Rye Whiskey') == ['bourbon', 'rye whiskey']
+    assert name_alternatives('Cognac') == ['cognac']
+
+
+def test_alternatives_match_by_token_subset():
+    names = ['Bourbon or Rye Whiskey', 'Bourbon Whiskey', 'Rye Whiskey', 'Brut Champagne or Prosecco',
+             'Champagne', 'Prosecco', 'Lemon Juice', 'Cognac or Brandy', 'Cognac', 'Apricot Brandy',
+             'Rye Whiskey or Bourbon', 'Irish Whiskey']
+    pairs = alternative_matrix(names).nonzero()
+    pairs = set(zip(pairs[0].tolist(), pairs[1].tolist()))
+    assert {(0, 1), (1, 0), (0, 2), (3, 4), (4, 3), (3, 5)} <= pairs
+    assert not any(6 in pair for pair in pairs)
+    assert not any(i == j for i, j in pairs)
+    # Only "or" names create pairs
+    assert (1, 2) not in pairs and (4, 5) not in pairs
+    # A more specific name is not an alternative: fruit brandies are not "Cognac or Brandy"
+    assert (7, 8) in pairs
+    assert (7, 9) not in pairs and (9, 7) not in pairs
+    # A one-word alternative borrows the shared head word: Bourbon -> Bourbon Whiskey
+    assert {(10, 1), (10, 2)} <= pairs
+    assert not any(11 in pair for pair in pairs)
+
+
+def test_shared_context_ranks_interchangeable_ingredients_first():
+    result = compute_substitutes(*arrays(), NAMES, [None] * len(NAMES), [None] * len(NAMES))
+    assert set(substitutes_of(result, 0)[:2]) == {1, 6}
+    assert set(substitutes_of(result, 1)[:2]) == {0, 6}
+    # Used together in every sour, so not substitutes of each other
+    assert 5 not in substitutes_of(result, 4)
+
+
+def test_ranks_top_k_and_category_gate():
+    categories = ['spirit', 'spirit', 'modifier', 'modifier', 'juice', 'sweetener', 'spirit']
+    subcategories = ['whiskey', 'whiskey', None, None, None, None, 'whiskey']
+    result = compute_substitutes(*arrays(), NAMES, categories, subcategories, top_k=2)
+    for ingredient in np.unique(result['ingredient']):
+        ranks = result['rank'][result['ingredient'] == ingredient]
+        assert list(ranks) == list(range(1, len(ranks) + 1))
+        assert len(ranks) <= 2
+    pairs = set(zip(result['ingredient'].tolist(), result['substitute'].tolist()))
+    assert all(categories[i] == categories[j] for i, j in pairs)
+    assert (0, 1) in pairs and (6, 0) in pairs
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for pre-SQL table validation"""
+
+from validate_tables import canonical_name_key, validate_tables
+
+DRINKS = [{'name': 'Negroni'}, {'name': 'Daiquiri'}]
+
+
+def test_canonical_name_key():
+    assert canonical_name_key('Crème de  Cassis ') == canonical_name_key('creme de cassis')
+
+
+def test_unknown_drink_is_an_error():
+    rows = [{'drink_name': 'Negroini', 'ingredient_name': 'Gin', 'amount': '1', 'unit': 'oz'}]
+    merged, report = validate_tables(DRINKS, rows)
+    assert not report.ok
+    assert merged == []
+    assert report.errors[0][0] == 'unknown drink'
+
+
+def test_duplicate_ingredient_policies():
+    rows = [
+        {'drink_name': 'Daiquiri', 'ingredient_name': 'Lime Juice', 'amount': '1/2', 'unit': 'oz'},
+        {'drink_name': 'daiquiri', 'ingredient_name': 'lime juice', 'amount': '1/4', 'unit': 'oz'},
+    ]
+    _, report = validate_tables(DRINKS, [dict(r) for r in rows])
+    assert [check for check, _ in report.errors] == ['duplicate ingredient']
+
+    merged, report = validate_tables(DRINKS, [dict(r) for r in rows], merge_policy='sum')
+    assert report.ok
+    assert merged == [{'drink_name': 'Daiquiri', 'ingredient_name': 'Lime Juice', 'amount': '0.75', 'unit': 'oz'}]
+
+    merged, report = validate_tables(DRINKS, [dict(r) for r in rows], merge_policy='last')
+    assert report.ok and merged[0]['amount'] == '1/4'
+
+
+def test_aliases_resolve_to_catalog_name():
+    rows = [
+        {'drink_name': 'Negroni', 'ingredient_name': 'Angostura', 'amount': '1', 'unit': 'dash'},
+        {'drink_name': 'Negroni', 'ingredient_name': 'Angostura Bitters', 'amount': '1', 'unit': 'dash'},
+    ]
+    catalog = {'Angostura Bitters': {'abv': 44.7}}
+    merged, report = validate_tables(DRINKS, rows, ingredient_catalog=catalog,
+                                     aliases={'Angostura': 'Angostura Bitters'}, merge_policy='sum')
+    assert report.ok
+    assert merged[0]['ingredient_name'] == 'Angostura Bitters'
+    assert merged[0]['amount'] == '2'
+
+
+def test_flavor_and_catalog_ranges():
+    flavors = [
+        {'drink_name': 'Negroni', 'sweetness': '11', 'bitterness': 'high'},
+        {'drink_name': 'negroni', 'sweetness': '3'},
+    ]
+    _, report = validate_tables(DRINKS, [], flavors, {'Campari': {'abv': 120}})
+    checks = sorted(check for check, _ in report.errors)
+    assert checks == ['catalog abv', 'duplicate flavor profile', 'flavor value', 'flavor value']
+
+
+def test_non_finite_flavor_values_are_flagged():
+    flavors = [{'drink_name': 'Negroni', 'sweetness': 'nan', 'bitterness': 'inf', 'herbal': '-Infinity',
+                'fruity': '10'}]
+    _, report = validate_tables(DRINKS, [], flavors, {'Campari': {'abv': float('nan')}})
+    checks = sorted(check for check, _ in report.errors)
+    assert checks == ['catalog abv', 'flavor value', 'flavor value', 'flavor value']
+    assert all('finite' in message for check, message in report.errors if check == 'flavor value')
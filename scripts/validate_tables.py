@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Validate the in-memory CSV tables before any SQL is written.
+
+csv_to_sql.py emits subselects like (SELECT drink_id FROM drinks WHERE name = ...),
+so a bad name only shows up as a NULL foreign key or a primary key violation after
+the database has done the work. These checks catch every such problem in one pass:
+
+- drink_ingredients / flavor rows that reference a drink missing from the drinks sheet
+- duplicate drink names (the subselects would return more than one row)
+- two rows for the same (drink, canonical ingredient), resolved by a merge policy
+- flavor values that are not numbers in 0-10, duplicate flavor rows, bad catalog ABVs
+"""
+
+import math
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from quantities import parse_amount, normalize_unit
+
+MERGE_POLICIES = ['error', 'first', 'last', 'sum']
+
+FLAVOR_FIELDS = ['sweetness', 'sourness', 'bitterness', 'saltiness', 'umami',
+                 'spiciness', 'herbal', 'fruity', 'floral', 'smoky', 'complexity', 'intensity']
+
+
+def canonical_name_key(name: Optional[str]) -> str:
+    """Key used to decide that two spellings name the same thing ('Crème de Cassis' == 'creme de  cassis')."""
+    if not name:
+        return ''
+    folded = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    return ' '.join(folded.casefold().split())
+
+
+def build_name_registry(names, aliases: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Map canonical_name_key -> preferred spelling. Aliases (raw -> canonical) are added on top."""
+    registry = {}
+    for name in names:
+        if name and name.strip():
+            registry.setdefault(canonical_name_key(name), name.strip())
+    for raw, canonical in (aliases or {}).items():
+        registry[canonical_name_key(raw)] = registry.get(canonical_name_key(canonical), canonical.strip())
+    return registry
+
+
+class ValidationReport:
+    """Collects every problem found so they can be reported together."""
+
+    def __init__(self):
+        self.errors: List[Tuple[str, str]] = []
+        self.warnings: List[Tuple[str, str]] = []
+
+    def error(self, check: str, message: str) -> None:
+        self.errors.append((check, message))
+
+    def warning(self, check: str, message: str) -> None:
+        self.warnings.append((check, message))
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def format(self) -> str:
+        """Render the report grouped by check."""
+        lines = []
+        for label, issues in (('Error', self.errors), ('Warning', self.warnings)):
+            by_check = defaultdict(list)
+            for check, message in issues:
+                by_check[check].append(message)
+            for check, messages in by_check.items():
+                lines.append(f"{label}: {check} ({len(messages)})")
+                lines.extend(f"  - {message}" for message in messages)
+        return '\n'.join(lines)
+
+
+def merge_amounts(rows: List[Dict], report: ValidationReport, label: str) -> Dict:
+    """Sum the amounts of duplicate rows when they share a unit; otherwise report an error."""
+    units = {normalize_unit(row.get('unit')) for row in rows}
+    amounts = [parse_amount(row.get('amount')) for row in rows]
+    if len(units) != 1 or any(amount is None for amount in amounts):
+        report.error('duplicate ingredient', f"{label}: cannot sum amounts "
+                     f"{', '.join(repr(row.get('amount')) + ' ' + repr(row.get('unit')) for row in rows)}")
+        return rows[0]
+    total = sum(amounts)
+    merged = dict(rows[0])
+    merged['amount'] = str(int(total)) if total == int(total) else f"{total:.2f}"
+    return merged
+
+
+def validate_tables(drinks: List[Dict[str, str]], drink_ingredients: List[Dict[str, str]],
+                    flavor_profiles: Optional[List[Dict[str, str]]] = None,
+                    ingredient_catalog: Optional[Dict[str, Dict]] = None,
+                    aliases: Optional[Dict[str, str]] = None,
+                    merge_policy: str = 'error') -> Tuple[List[Dict[str, str]], ValidationReport]:
+    """
+    Check all tables and return (drink_ingredients with canonical names and duplicates merged, report).
+
+    Names are canonicalized with canonical_name_key: drink names to the drinks sheet spelling,
+    ingredient names to the catalog spelling (or the first spelling seen), after applying aliases.
+    """
+    if merge_policy not in MERGE_POLICIES:
+        raise ValueError(f"merge_policy must be one of {', '.join(MERGE_POLICIES)}")
+
+    report = ValidationReport()
+
+    # Drinks: names must be present and unique, since every subselect looks them up by name
+    drink_registry = {}
+    for line, drink in enumerate(drinks, start=2):
+        name = (drink.get('name') or '').strip()
+        if not name:
+            report.error('missing drink name', f"drinks line {line} has no name")
+            continue
+        drink['name'] = name
+        key = canonical_name_key(name)
+        if key in drink_registry:
+            report.error('duplicate drink', f"'{name}' (line {line}) duplicates '{drink_registry[key]}'")
+        else:
+            drink_registry[key] = name
+
+    catalog_names = list(ingredient_catalog or {})
+    raw_ingredient_names = [di.get('ingredient_name') for di in drink_ingredients]
+    ingredient_registry = build_name_registry(catalog_names + raw_ingredient_names, aliases)
+
+    # drink_ingredients: resolve names, then group by (drink, ingredient) primary key
+    grouped = defaultdict(list)
+    for line, di in enumerate(drink_ingredients, start=2):
+        drink_key = canonical_name_key(di.get('drink_name'))
+        ingredient_key = canonical_name_key(di.get('ingredient_name'))
+        if not ingredient_key:
+            report.error('missing ingredient name', f"drink_ingredients line {line} has no ingredient_name")
+            continue
+        if drink_key not in drink_registry:
+            report.error('unknown drink', f"drink_ingredients line {line}: '{di.get('drink_name')}' is not in the drinks sheet")
+            continue
+        ingredient_name = ingredient_registry[ingredient_key]
+        resolved = dict(di, drink_name=drink_registry[drink_key], ingredient_name=ingredient_name)
+        grouped[(drink_registry[drink_key], canonical_name_key(ingredient_name))].append(resolved)
+
+    merged_rows = []
+    for (drink_name, _), rows in grouped.items():
+        if len(rows) == 1:
+            merged_rows.append(rows[0])
+            continue
+        label = f"'{drink_name}' lists '{rows[0]['ingredient_name']}' {len(rows)} times"
+        if merge_policy == 'error':
+            report.error('duplicate ingredient', f"{label} (use --on-duplicate first/last/sum to merge)")
+            merged_rows.append(rows[0])
+        elif merge_policy == 'first':
+            report.warning('duplicate ingredient', f"{label}; kept the first")
+            merged_rows.append(rows[0])
+        elif merge_policy == 'last':
+            report.warning('duplicate ingredient', f"{label}; kept the last")
+            merged_rows.append(rows[-1])
+        else:
+            report.warning('duplicate ingredient', f"{label}; summed amounts")
+            merged_rows.append(merge_amounts(rows, report, label))
+
+    # Flavor profiles: one row per known drink, every value a number in 0-10
+    seen_flavors = set()
+    for line, fp in enumerate(flavor_profiles or [], start=2):
+        drink_key = canonical_name_key(fp.get('drink_name'))
+        if drink_key not in drink_registry:
+            report.error('unknown drink', f"flavor_profiles line {line}: '{fp.get('drink_name')}' is not in the drinks sheet")
+            continue
+        if drink_key in seen_flavors:
+            report.error('duplicate flavor profile', f"flavor_profiles line {line}: second profile for '{drink_registry[drink_key]}'")
+        seen_flavors.add(drink_key)
+        fp['drink_name'] = drink_registry[drink_key]
+        for field in FLAVOR_FIELDS:
+            value = fp.get(field)
+            if value is None or str(value).strip() == '':
+                continue
+            try:
+                num = float(value)
+            except ValueError:
+                report.error('flavor value', f"flavor_profiles line {line}: {field}={value!r} is not a number")
+                continue
+            # float() accepts 'nan' and 'inf', and NaN fails every comparison
+            if not math.isfinite(num):
+                report.error('flavor value', f"flavor_profiles line {line}: {field}={value!r} is not a finite number")
+            elif num < 0 or num > 10:
+                report.error('flavor value', f"flavor_profiles line {line}: {field}={num} is outside 0-10")
+
+    # Catalog: ABV must fit NUMERIC(4,2)
+    for name, entry in (ingredient_catalog or {}).items():
+        abv = entry.get('abv')
+        if abv is None:
+            continue
+        try:
+            num = float(abv)
+        except (ValueError, TypeError):
+            report.error('catalog abv', f"'{name}': abv={abv!r} is not a number")
+            continue
+        if not math.isfinite(num) or num < 0 or num >= 100:
+            report.error('catalog abv', f"'{name}': abv={num} is outside 0-99.99")
+
+    return merged_rows, report